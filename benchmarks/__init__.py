@@ -0,0 +1,6 @@
+"""Benchmarks for SL Renamer's hot paths, runnable without Blender.
+
+    python -m benchmarks.run --sizes 1000 10000 100000 --out results.json
+
+See fake_bpy for the bpy stand-in and scenes for the synthetic scenes.
+"""
@@ -0,0 +1,86 @@
+"""Compare the fast GLB writer with the stock glTF exporter inside Blender.
+
+Builds a scene of subdivided cubes with a UV map and two materials, then
+exports every object to its own .glb once with bpy.ops.export_scene.gltf and
+once with sl_renamer.glb_writer, and prints total time and output size:
+
+    blender -b --factory-startup --python benchmarks/bench_glb_writer.py -- --objects 1000
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sl_renamer import core, glb_writer  # noqa: E402
+
+
+def build_scene(n_objects, cuts):
+    for o in list(bpy.data.objects):
+        bpy.data.objects.remove(o, do_unlink=True)
+    mats = [bpy.data.materials.new(f"bench_mat_{i}") for i in range(2)]
+    objs = []
+    for i in range(n_objects):
+        bpy.ops.mesh.primitive_cube_add(location=(i % 20 * 3.0, i // 20 * 3.0, 0.0))
+        obj = bpy.context.active_object
+        obj.name = f"bench_{i:04d}_LOD0"
+        mod = obj.modifiers.new('Subdivision', 'SUBSURF')
+        mod.levels = cuts
+        bpy.ops.object.modifier_apply(modifier=mod.name)
+        for m in mats:
+            obj.data.materials.append(m)
+        obj.data.polygons.foreach_set('material_index', [p.index % 2 for p in obj.data.polygons])
+        objs.append(obj)
+    return objs
+
+
+def _dir_size(path):
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+def time_stock(objs, out_dir):
+    t0 = time.perf_counter()
+    for obj in objs:
+        bpy.ops.object.select_all(action='DESELECT')
+        obj.select_set(True)
+        core._export_selected_to(os.path.join(out_dir, f"{obj.name}.glb"), 'GLB')
+    return time.perf_counter() - t0
+
+
+def time_native(objs, out_dir):
+    t0 = time.perf_counter()
+    for obj in objs:
+        glb_writer.write_glb(os.path.join(out_dir, f"{obj.name}.glb"), [obj])
+    return time.perf_counter() - t0
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--objects', type=int, default=1000)
+    ap.add_argument('--levels', type=int, default=2)
+    args = ap.parse_args(argv)
+
+    objs = build_scene(args.objects, args.levels)
+    reason = glb_writer.unsupported_reason(objs)
+    if reason:
+        print(f"fast writer does not cover the scene: {reason}")
+        return
+
+    for label, fn in (('stock export_scene.gltf', time_stock), ('fast glb_writer', time_native)):
+        out_dir = tempfile.mkdtemp(prefix='sl_bench_glb_')
+        try:
+            dt = fn(objs, out_dir)
+            size = _dir_size(out_dir)
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+        print(f"{label:<24} {dt:8.3f}s  {dt / len(objs) * 1000:7.2f} ms/object  {size / 1024:10.1f} KiB")
+
+
+main()
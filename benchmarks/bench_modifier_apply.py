@@ -0,0 +1,82 @@
+"""Compare the two export modifier paths inside Blender.
+
+Builds a scene of subdivided + bevelled objects and times preparing (and then
+freeing) export copies with the depsgraph path and with the legacy
+copy + bpy.ops.object.modifier_apply path:
+
+    blender -b --factory-startup --python benchmarks/bench_modifier_apply.py -- --objects 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import bpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from sl_renamer import core  # noqa: E402
+
+MOD_FLAGS = {'SUBSURF', 'BEVEL'}
+
+
+def build_scene(n_objects, subsurf_levels):
+    for o in list(bpy.data.objects):
+        bpy.data.objects.remove(o, do_unlink=True)
+    scene = bpy.context.scene
+    objs = []
+    for i in range(n_objects):
+        mesh = bpy.data.meshes.new(f"bench_{i:04d}")
+        # a cube with 8 verts / 6 quads
+        verts = [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+        faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+        mesh.from_pydata(verts, [], faces)
+        obj = bpy.data.objects.new(mesh.name, mesh)
+        obj.location = (i % 20 * 3.0, i // 20 * 3.0, 0.0)
+        scene.collection.objects.link(obj)
+        bev = obj.modifiers.new('Bevel', 'BEVEL')
+        bev.width = 0.1
+        bev.segments = 3
+        sub = obj.modifiers.new('Subdivision', 'SUBSURF')
+        sub.levels = subsurf_levels
+        objs.append(obj)
+    return objs
+
+
+def time_path(objs, use_depsgraph, batched):
+    ctx = bpy.context
+    meshes_before = len(bpy.data.meshes)
+    t0 = time.perf_counter()
+    evaluated = {}
+    if batched:
+        evaluated = core._build_evaluated_meshes(ctx, objs, MOD_FLAGS)
+    tris = 0
+    for obj in objs:
+        tmp = core._prepare_object_for_export(ctx, obj, MOD_FLAGS, use_depsgraph=use_depsgraph,
+                                              evaluated_mesh=evaluated.get(obj))
+        tris += len(tmp.data.polygons)
+        core._remove_export_copy(tmp)
+    dt = time.perf_counter() - t0
+    return dt, tris, len(bpy.data.meshes) - meshes_before
+
+
+def main():
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--objects', type=int, default=200)
+    ap.add_argument('--levels', type=int, default=2)
+    args = ap.parse_args(argv)
+
+    objs = build_scene(args.objects, args.levels)
+    runs = [
+        ('operator (copy + modifier_apply)', False, False),
+        ('depsgraph, per object', True, False),
+        ('depsgraph, batched', True, True),
+    ]
+    for label, use_depsgraph, batched in runs:
+        dt, faces, leaked = time_path(objs, use_depsgraph, batched)
+        print(f"{label:<34} {dt:8.3f}s  {faces} faces  leaked meshes: {leaked}")
+
+
+main()
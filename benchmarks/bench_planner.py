@@ -0,0 +1,89 @@
+"""Benchmark planner.plan_renames on large synthetic Items lists.
+
+Run with plain Python (no Blender needed):
+
+    python benchmarks/bench_planner.py [--items 50000]
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_planner():
+    # load the module by path so the bpy-importing package __init__ is skipped
+    path = os.path.join(HERE, '..', 'sl_renamer', 'planner.py')
+    spec = importlib.util.spec_from_file_location('sl_planner', path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def make_records(planner, n_items, seed=0):
+    """Kits of four LODs: a third explicitly assigned, a tenth with slots, the rest by name."""
+    rnd = random.Random(seed)
+    lods = ('LOD0', 'LOD1', 'LOD2', 'PHYS')
+    records = []
+    base_names = {}
+    registered = set()
+    oid = 0
+    n_kits = max(1, n_items // 4)
+    for k in range(n_kits):
+        base = f"kit_{k:06d}"
+        mode = rnd.random()
+        base_oid = oid
+        oid += 1
+        if mode < 0.33 or mode > 0.9:
+            base_names[base_oid] = base
+            registered.add(base_oid)
+        for lod in lods:
+            name = f"{base}.{rnd.randrange(1000):03d}_{lod.lower()}"
+            if mode < 0.33:
+                records.append(planner.RenameRecord(oid, name, lod, False, base_oid, None))
+            elif mode > 0.9:
+                records.append(planner.RenameRecord(oid, name, lod, False, base_oid, lod.lower()))
+            else:
+                records.append(planner.RenameRecord(oid, f"{base}_{lod}" if lod != 'LOD0' else base, lod, lod == 'LOD0', None, None))
+            oid += 1
+    return records, base_names, registered
+
+
+def naive_remaining(groups, items):
+    """The list flattening SL_OT_apply_list_renames did before the planner (quadratic)."""
+    return [it for it in items if it not in [x for v in groups.values() for x in v]]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--items', type=int, default=50000)
+    ap.add_argument('--naive-items', type=int, default=2000,
+                    help='size used for the old quadratic grouping comparison')
+    args = ap.parse_args()
+
+    planner = _load_planner()
+    name_for = lambda base, lod: f"{base}_{lod}"
+
+    records, base_names, registered = make_records(planner, args.items)
+    t0 = time.perf_counter()
+    plan = planner.plan_renames(records, base_names, name_for, registered=registered)
+    dt = time.perf_counter() - t0
+    print(f"plan_renames: {len(records)} records -> {len(plan)} renames in {dt * 1000:.1f} ms")
+
+    small, _bn, _reg = make_records(planner, args.naive_items)
+    groups = {}
+    for r in small:
+        if r.base_ref is not None and r.slot is None:
+            groups.setdefault(r.base_ref, []).append(r)
+    items = [r for r in small if r.slot is None]
+    t0 = time.perf_counter()
+    naive_remaining(groups, items)
+    dt_naive = time.perf_counter() - t0
+    print(f"old grouping flatten: {len(items)} items in {dt_naive * 1000:.1f} ms (quadratic)")
+
+
+if __name__ == '__main__':
+    main()
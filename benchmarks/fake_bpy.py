@@ -0,0 +1,501 @@
+"""A small stand-in for bpy, good enough to run SL Renamer operators headless.
+
+It implements only what the add-on touches: property declarations that
+become plain attributes with their defaults, ID datablocks with Blender-style
+unique names (assigning a taken name yields 'name.001'), meshes backed by
+NumPy arrays with foreach_get, CollectionProperty-like lists, and a context
+object. It is not a Blender emulator; timings measure the add-on's own Python
+work, not Blender internals.
+
+    from benchmarks import fake_bpy
+    fake_bpy.install()
+    import sl_renamer
+"""
+
+import itertools
+import os
+import sys
+import types
+
+import numpy as np
+
+_uid = itertools.count(1)
+
+
+# --- bpy.props ---
+
+
+class PropDef:
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+        self.kwargs = kwargs
+
+    def default(self):
+        if 'default' in self.kwargs:
+            value = self.kwargs['default']
+            return set(value) if isinstance(value, (set, frozenset)) else value
+        if self.kind == 'ENUM':
+            if 'ENUM_FLAG' in self.kwargs.get('options', ()):
+                return set()
+            return self.kwargs['items'][0][0]
+        if self.kind == 'COLLECTION':
+            return CollectionProperty(self.kwargs.get('type'))
+        return {
+            'STRING': '',
+            'BOOL': False,
+            'INT': 0,
+            'FLOAT': 0.0,
+            'POINTER': None,
+        }.get(self.kind)
+
+
+def _prop_factory(kind):
+    def factory(**kwargs):
+        return PropDef(kind, **kwargs)
+    factory.__name__ = kind.title() + 'Property'
+    return factory
+
+
+# --- bpy.types ---
+
+
+class bpy_struct:
+    pass
+
+
+class PropertyGroup(bpy_struct):
+    """Instances get one attribute per annotated property, set to its default."""
+
+    def __init__(self):
+        for klass in reversed(type(self).__mro__):
+            for name, decl in getattr(klass, '__annotations__', {}).items():
+                if isinstance(decl, PropDef):
+                    if decl.kind == 'POINTER' and isinstance(decl.kwargs.get('type'), type) \
+                            and issubclass(decl.kwargs['type'], PropertyGroup):
+                        setattr(self, name, decl.kwargs['type']())
+                    else:
+                        setattr(self, name, decl.default())
+
+
+class Operator(bpy_struct):
+    def __init__(self):
+        self.reports = []
+        for klass in reversed(type(self).__mro__):
+            for name, decl in getattr(klass, '__annotations__', {}).items():
+                if isinstance(decl, PropDef):
+                    setattr(self, name, decl.default())
+
+    def report(self, level, message):
+        self.reports.append((set(level), message))
+
+
+class Panel(bpy_struct):
+    pass
+
+
+class UIList(bpy_struct):
+    pass
+
+
+class CollectionProperty:
+    """List of PropertyGroups with the add()/remove() API of bpy collections."""
+
+    def __init__(self, item_type=None):
+        self.item_type = item_type
+        self._items = []
+
+    def add(self):
+        item = self.item_type()
+        self._items.append(item)
+        return item
+
+    def remove(self, index):
+        del self._items[index]
+
+    def clear(self):
+        self._items.clear()
+
+    def move(self, src, dst):
+        self._items.insert(dst, self._items.pop(src))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+
+class IDCollection:
+    """bpy.data.<kind>: name -> ID with Blender's '.001' uniqueness rule."""
+
+    def __init__(self, factory=None):
+        self._by_name = {}
+        self._factory = factory
+
+    def _unique(self, name, id_):
+        holder = self._by_name.get(name)
+        if holder is None or holder is id_:
+            return name
+        base = name
+        if len(name) > 4 and name[-4] == '.' and name[-3:].isdigit():
+            base = name[:-4]
+        for i in itertools.count(1):
+            cand = f"{base}.{i:03d}"
+            if cand not in self._by_name:
+                return cand
+
+    def _rename(self, id_, old, new):
+        new = self._unique(new, id_)
+        if old is not None and self._by_name.get(old) is id_:
+            del self._by_name[old]
+        self._by_name[new] = id_
+        return new
+
+    def new(self, name, *args):
+        id_ = self._factory(*args)
+        id_._collection = self
+        id_.name = name
+        return id_
+
+    def get(self, name, default=None):
+        return self._by_name.get(name, default)
+
+    def remove(self, id_, do_unlink=True):
+        if self._by_name.get(id_.name) is id_:
+            del self._by_name[id_.name]
+        id_._collection = None
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __iter__(self):
+        return iter(list(self._by_name.values()))
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __getitem__(self, name):
+        return self._by_name[name]
+
+
+class ID(bpy_struct):
+    def __init__(self):
+        self._name = None
+        self._collection = None
+        self.session_uid = next(_uid)
+        self.users = 1
+        self.library = None
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        value = str(value)[:63]
+        if self._collection is not None:
+            value = self._collection._rename(self, self._name, value)
+        self._name = value
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self._name!r}>"
+
+
+class Material(ID):
+    def __init__(self):
+        super().__init__()
+        self.diffuse_color = (0.8, 0.8, 0.8, 1.0)
+        self.metallic = 0.0
+        self.roughness = 0.5
+        self.use_nodes = False
+        self.node_tree = None
+
+
+class _Seq:
+    """Mesh element sequence backed by NumPy arrays keyed by attribute name."""
+
+    def __init__(self, n, **arrays):
+        self._n = n
+        self._arrays = arrays
+
+    def __len__(self):
+        return self._n
+
+    def foreach_get(self, attr, buf):
+        buf[:] = self._arrays[attr].ravel()
+
+    def foreach_set(self, attr, buf):
+        self._arrays[attr] = np.asarray(buf).copy()
+
+
+class Mesh(ID):
+    def __init__(self):
+        super().__init__()
+        self.materials = []
+        self.uv_layers = []
+        self.set_geometry(np.zeros((0, 3), np.float32), [])
+
+    def set_geometry(self, co, faces):
+        """co: (V, 3) array, faces: list of vertex index tuples."""
+        co = np.asarray(co, dtype=np.float32).reshape(-1, 3)
+        sizes = np.array([len(f) for f in faces], dtype=np.int32)
+        loops = np.array([i for f in faces for i in f], dtype=np.int32)
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(np.int32) if len(faces) else sizes
+        self.vertices = _Seq(len(co), co=co)
+        self.loops = _Seq(len(loops), vertex_index=loops)
+        self.polygons = _Seq(
+            len(faces),
+            loop_start=starts,
+            loop_total=sizes,
+            material_index=np.zeros(len(faces), np.int32),
+            use_smooth=np.zeros(len(faces), np.bool_),
+        )
+        # fan triangulation, like Blender for convex polygons
+        tris = [(f[0], f[i], f[i + 1]) for f in faces for i in range(1, len(f) - 1)]
+        self._tris = np.array(tris, dtype=np.int32).reshape(-1, 3)
+        self.loop_triangles = _Seq(0, vertices=self._tris)
+
+    def calc_loop_triangles(self):
+        self.loop_triangles = _Seq(len(self._tris), vertices=self._tris)
+
+    def copy(self):
+        m = bpy.data.meshes.new(self.name)
+        m.materials = list(self.materials)
+        m.vertices, m.loops, m.polygons = self.vertices, self.loops, self.polygons
+        m._tris = self._tris
+        m.loop_triangles = self.loop_triangles
+        return m
+
+
+class Object(ID):
+    def __init__(self, data=None):
+        super().__init__()
+        self.data = data
+        self.type = 'MESH' if isinstance(data, Mesh) else ('EMPTY' if data is None else 'OTHER')
+        self.modifiers = []
+        self.location = (0.0, 0.0, 0.0)
+        self.dimensions = (2.0, 2.0, 2.0)
+        self.matrix_world = np.identity(4, dtype=np.float32)
+        self.parent = None
+        self._selected = False
+
+    @property
+    def bound_box(self):
+        """Eight local bounding-box corners, from the mesh vertices."""
+        co = self.data.vertices._arrays['co'].reshape(-1, 3) if isinstance(self.data, Mesh) else ()
+        if len(co) == 0:
+            lo, hi = -np.ones(3), np.ones(3)
+        else:
+            lo, hi = co.min(axis=0), co.max(axis=0)
+        return [(x, y, z) for x in (lo[0], hi[0]) for y in (lo[1], hi[1]) for z in (lo[2], hi[2])]
+
+    def select_set(self, state):
+        self._selected = bool(state)
+
+    def select_get(self):
+        return self._selected
+
+    def evaluated_get(self, depsgraph):
+        return self
+
+    def copy(self):
+        o = bpy.data.objects.new(self.name, self.data)
+        o.modifiers = list(self.modifiers)
+        o.location = self.location
+        o.dimensions = self.dimensions
+        return o
+
+
+class Text(ID):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def write(self, text):
+        self.lines.append(text)
+
+
+class Collection(ID):
+    def __init__(self):
+        super().__init__()
+        self.objects = _ObjectList()
+        self.children = _ObjectList()
+
+
+class _ObjectList(list):
+    def link(self, obj):
+        self.append(obj)
+
+    def unlink(self, obj):
+        self.remove(obj)
+
+    def get(self, name, default=None):
+        for o in self:
+            if o.name == name:
+                return o
+        return default
+
+
+class Scene(ID):
+    """Scene with the SL Renamer properties instantiated directly."""
+
+    def __init__(self):
+        super().__init__()
+        self.collection = Collection()
+        self.collection.name = 'Scene Collection'
+
+    @property
+    def objects(self):
+        return self.collection.objects
+
+    def init_sl_renamer(self, core):
+        self.sl_renamer_props = core.SLRenamerProperties()
+        self.sl_renamer_items = CollectionProperty(core.SLRenamerItem)
+        self.sl_renamer_index = 0
+        self.sl_renamer_bases = CollectionProperty(core.SLRenamerBase)
+        self.sl_renamer_base_index = 0
+        self.sl_renamer_li_report = CollectionProperty(core.SLRenamerLandImpact)
+        self.sl_renamer_li_index = 0
+
+
+class ViewLayer:
+    def __init__(self):
+        self.objects = types.SimpleNamespace(active=None)
+
+
+class Context:
+    def __init__(self, scene):
+        self.scene = scene
+        self.collection = scene.collection
+        self.view_layer = ViewLayer()
+        self.window_manager = types.SimpleNamespace(windows=[])
+
+    @property
+    def selected_objects(self):
+        return [o for o in self.scene.objects if o.select_get()]
+
+    def evaluated_depsgraph_get(self):
+        return None
+
+
+class KDTree:
+    """mathutils.kdtree.KDTree stand-in: points bucketed in a uniform grid.
+
+    find_n searches rings of cells outwards until the n nearest points are
+    known, so queries stay cheap on evenly spread scenes.
+    """
+
+    def __init__(self, size):
+        self._points = []
+
+    def insert(self, co, index):
+        self._points.append((tuple(co), index))
+
+    def balance(self):
+        self._co = np.array([p[0] for p in self._points], dtype=np.float64).reshape(-1, 3)
+        self._index = [p[1] for p in self._points]
+        self._cells = {}
+        if not len(self._co):
+            return
+        lo, hi = self._co.min(axis=0), self._co.max(axis=0)
+        self._lo = lo
+        self._cell = max(float((hi - lo).max()) / max(len(self._co) ** (1 / 3), 1.0), 1e-6)
+        keys = np.floor((self._co - lo) / self._cell).astype(np.int64)
+        for i, key in enumerate(map(tuple, keys)):
+            self._cells.setdefault(key, []).append(i)
+        self._span = int(keys.max()) + 1
+
+    def find_n(self, co, n):
+        if not self._cells:
+            return []
+        co = np.asarray(co, dtype=np.float64)
+        cx, cy, cz = np.floor((co - self._lo) / self._cell).astype(np.int64)
+        found = []
+        limit = self._span + abs(cx) + abs(cy) + abs(cz)
+        r = 0
+        while True:
+            for x in range(cx - r, cx + r + 1):
+                for y in range(cy - r, cy + r + 1):
+                    for z in range(cz - r, cz + r + 1):
+                        if max(abs(x - cx), abs(y - cy), abs(z - cz)) == r:
+                            found.extend(self._cells.get((x, y, z), ()))
+            # every point outside the searched cube is at least r * cell away
+            if found:
+                dist = np.linalg.norm(self._co[found] - co, axis=1)
+                order = np.argsort(dist, kind='stable')[:n]
+                if (len(order) >= n and dist[order[-1]] <= r * self._cell) or r > limit:
+                    return [(tuple(self._co[found[i]]), self._index[found[i]], float(dist[i])) for i in order]
+            elif r > limit:
+                return []
+            r += 1
+
+
+# --- module assembly ---
+
+bpy = types.ModuleType('bpy')
+
+
+def install():
+    """Register the fake as `bpy` (and its submodules) in sys.modules."""
+    if sys.modules.get('bpy') is bpy:
+        return bpy
+
+    props = types.ModuleType('bpy.props')
+    for kind in ('STRING', 'BOOL', 'INT', 'FLOAT', 'ENUM', 'POINTER', 'COLLECTION'):
+        setattr(props, _prop_factory(kind).__name__, _prop_factory(kind))
+
+    btypes = types.ModuleType('bpy.types')
+    for cls in (bpy_struct, PropertyGroup, Operator, Panel, UIList, ID, Object, Mesh,
+                Material, Scene, Collection, Text):
+        setattr(btypes, cls.__name__, cls)
+
+    utils = types.ModuleType('bpy.utils')
+    utils.register_class = lambda cls: None
+    utils.unregister_class = lambda cls: None
+
+    path = types.ModuleType('bpy.path')
+    path.abspath = lambda p: os.path.join(os.getcwd(), p[2:]) if p.startswith('//') else p
+
+    data = types.SimpleNamespace(
+        objects=IDCollection(Object),
+        meshes=IDCollection(Mesh),
+        materials=IDCollection(Material),
+        texts=IDCollection(Text),
+        collections=IDCollection(Collection),
+        scenes=IDCollection(Scene),
+        filepath='',
+    )
+    app = types.SimpleNamespace(
+        binary_path='',
+        timers=types.SimpleNamespace(register=lambda fn, **kw: None, is_registered=lambda fn: False,
+                                     unregister=lambda fn: None),
+        handlers=types.SimpleNamespace(undo_post=[], redo_post=[], load_post=[], depsgraph_update_post=[]),
+    )
+
+    bpy.props, bpy.types, bpy.utils, bpy.path, bpy.data, bpy.app = props, btypes, utils, path, data, app
+    bpy.ops = types.SimpleNamespace()
+    bpy.context = None
+    mathutils = types.ModuleType('mathutils')
+    mathutils.kdtree = types.ModuleType('mathutils.kdtree')
+    mathutils.kdtree.KDTree = KDTree
+
+    sys.modules.update({
+        'mathutils': mathutils,
+        'mathutils.kdtree': mathutils.kdtree,
+        'bpy': bpy,
+        'bpy.props': props,
+        'bpy.types': btypes,
+        'bpy.utils': utils,
+        'bpy.path': path,
+    })
+    return bpy
+
+
+def reset_data():
+    """Drop every datablock (between benchmark scenes)."""
+    for coll in vars(bpy.data).values():
+        if isinstance(coll, IDCollection):
+            coll._by_name.clear()
@@ -0,0 +1,140 @@
+"""Time SL Renamer operators on synthetic scenes and save the results as JSON.
+
+    python -m benchmarks.run                        # 1k, 10k and 100k objects
+    python -m benchmarks.run --sizes 1000 --repeat 5 --out new.json --compare old.json
+
+Each scenario builds a fresh scene (not timed), then times one call. With
+--repeat the best time is kept. --compare prints the ratio against a previous
+results file so regressions between versions are visible.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+from . import fake_bpy, scenes
+
+fake_bpy.install()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import sl_renamer  # noqa: E402
+from sl_renamer import core  # noqa: E402
+
+
+def _timed(fn):
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        t0 = time.perf_counter()
+        result = fn()
+        return time.perf_counter() - t0, result
+
+
+def _run_operator(op_cls, sc):
+    op = op_cls()
+    return _timed(lambda: op.execute(sc.context))
+
+
+def bench_apply_list_renames(size, args):
+    sc = scenes.build_scene(size, core)
+    return _run_operator(core.SL_OT_apply_list_renames, sc)
+
+
+def bench_rename_lods(size, args):
+    sc = scenes.build_scene(size, core)
+    sc.select(sc.objects)
+    return _run_operator(core.OBJECT_OT_rename_lods, sc)
+
+
+def bench_check_material_subset(size, args):
+    sc = scenes.build_scene(size, core)
+    return _run_operator(core.SL_OT_check_material_subset, sc)
+
+
+def bench_validate_for_sl(size, args):
+    sc = scenes.build_scene(size, core)
+    sc.select(sc.objects)
+    return _run_operator(core.OBJECT_OT_validate_for_sl, sc)
+
+
+def bench_add_selected_to_list(size, args):
+    # every object is listed already: each one is a duplicate check
+    sc = scenes.build_scene(size, core)
+    sc.select(sc.objects)
+    return _run_operator(core.SL_OT_add_selected_to_list, sc)
+
+
+def bench_assign_to_base(size, args):
+    sc = scenes.build_scene(size, core)
+    sc.select(sc.objects)
+    sc.scene.sl_renamer_base_index = 0
+    return _run_operator(core.SL_OT_assign_to_base, sc)
+
+
+def bench_rename_files_on_disk(size, args):
+    n_files = min(size, args.max_files)
+    tmp = tempfile.mkdtemp(prefix='sl_bench_files_')
+    try:
+        scenes.populate_directory(tmp, n_files)
+        targets = {f"Kit{k:06d}": [f"kit_{k:06d}"] for k in range(max(1, n_files // 4))}
+        return _timed(lambda: core.rename_files_for_bases(tmp, targets, dry_run=False))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+SCENARIOS = {
+    'apply_list_renames': bench_apply_list_renames,
+    'rename_lods': bench_rename_lods,
+    'check_material_subset': bench_check_material_subset,
+    'validate_for_sl': bench_validate_for_sl,
+    'rename_files_on_disk': bench_rename_files_on_disk,
+    'add_selected_to_list': bench_add_selected_to_list,
+    'assign_to_base': bench_assign_to_base,
+}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog='benchmarks.run')
+    ap.add_argument('--sizes', type=int, nargs='+', default=list(scenes.SIZES))
+    ap.add_argument('--scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    ap.add_argument('--repeat', type=int, default=1)
+    ap.add_argument('--max-files', type=int, default=20000, help='cap for files created on disk')
+    ap.add_argument('--out', default='bench_results.json')
+    ap.add_argument('--compare', default='', help='previous results file to compare against')
+    args = ap.parse_args(argv)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as fh:
+            previous = {(r['scenario'], r['size']): r['seconds'] for r in json.load(fh)['results']}
+
+    results = []
+    for name in args.scenarios:
+        for size in args.sizes:
+            best = None
+            for _ in range(max(1, args.repeat)):
+                seconds, _ret = SCENARIOS[name](size, args)
+                best = seconds if best is None else min(best, seconds)
+            results.append({'scenario': name, 'size': size, 'seconds': best})
+            line = f"{name:<24} {size:>7}  {best * 1000:10.1f} ms"
+            old = previous.get((name, size))
+            if old:
+                line += f"  ({best / old:5.2f}x vs previous)"
+            print(line, flush=True)
+
+    with open(args.out, 'w', encoding='utf-8') as fh:
+        json.dump({
+            'addon_version': list(sl_renamer.bl_info['version']),
+            'python': platform.python_version(),
+            'timestamp': time.time(),
+            'results': results,
+        }, fh, indent=2)
+    print(f"results written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""Synthetic SL Renamer scenes on top of benchmarks.fake_bpy.
+
+A scene of n objects is made of n // 4 kits; every kit has a LOD0/LOD1/LOD2/
+PHYS object with messy names ('kit_00042.hi', 'kit_00042_low.001', ...), a
+small grid mesh whose resolution drops per LOD, and a few materials. All
+objects are on the Items list; a fraction of the kits is registered as Bases,
+some with explicit slots, some with Items pointing at them via base_ref.
+"""
+
+import random
+
+import numpy as np
+
+from . import fake_bpy
+
+SIZES = (1000, 10000, 100000)
+
+_LODS = ('LOD0', 'LOD1', 'LOD2', 'PHYS')
+_MESSY = {
+    'LOD0': ('{b}', '{b}.hi', '{b}_lod0'),
+    'LOD1': ('{b}_lod1', '{b}.med', '{b}_LOD1.001'),
+    'LOD2': ('{b}_lod2', '{b}_low.001', '{b}_LOD2'),
+    'PHYS': ('{b}_phys', '{b}.collision', '{b}_PHYS'),
+}
+# grid resolution per LOD (quads per side)
+_GRID = {'LOD0': 8, 'LOD1': 4, 'LOD2': 2, 'PHYS': 1}
+
+_grid_cache = {}
+
+
+def _grid(res):
+    """Flat res x res quad grid: (co, faces)."""
+    if res not in _grid_cache:
+        xs = np.linspace(-1.0, 1.0, res + 1, dtype=np.float32)
+        gx, gy = np.meshgrid(xs, xs)
+        co = np.stack([gx.ravel(), gy.ravel(), np.zeros(gx.size, np.float32)], axis=1)
+        faces = []
+        w = res + 1
+        for y in range(res):
+            for x in range(res):
+                i = y * w + x
+                faces.append((i, i + 1, i + w + 1, i + w))
+        _grid_cache[res] = (co, faces)
+    return _grid_cache[res]
+
+
+class SyntheticScene:
+    def __init__(self, bpy, scene, context, kits):
+        self.bpy = bpy
+        self.scene = scene
+        self.context = context
+        self.kits = kits  # list of {lod: object}
+
+    @property
+    def objects(self):
+        return [o for kit in self.kits for o in kit.values()]
+
+    def select(self, objs):
+        for o in self.scene.objects:
+            o.select_set(False)
+        for o in objs:
+            o.select_set(True)
+
+
+def build_scene(n_objects, core, seed=0, base_fraction=0.25, slot_fraction=0.1, materials_per_kit=3):
+    bpy = fake_bpy.install()
+    fake_bpy.reset_data()
+    rnd = random.Random(seed)
+
+    scene = bpy.data.scenes.new('Scene')
+    scene.init_sl_renamer(core)
+    # keep the console quiet; benchmarks time the work, not terminal output
+    scene.sl_renamer_props.log_level = 'ERROR'
+    context = fake_bpy.Context(scene)
+    bpy.context = context
+
+    shared_mats = [bpy.data.materials.new(f"mat_{i:02d}") for i in range(32)]
+
+    kits = []
+    for k in range(max(1, n_objects // 4)):
+        base = f"kit_{k:06d}"
+        kit_mats = rnd.sample(shared_mats, materials_per_kit)
+        kit = {}
+        for lod in _LODS:
+            co, faces = _grid(_GRID[lod])
+            mesh = bpy.data.meshes.new(f"{base}_{lod.lower()}_mesh")
+            mesh.set_geometry(co + np.float32(k % 100) * 3.0, faces)
+            # lower LODs may lose a material, never gain one
+            mesh.materials = kit_mats if lod == 'LOD0' else kit_mats[:rnd.randint(1, len(kit_mats))]
+            # spread the faces over the slots
+            mesh.polygons.foreach_set('material_index', np.arange(len(faces), dtype=np.int32) % len(mesh.materials))
+            name = rnd.choice(_MESSY[lod]).format(b=base)
+            obj = bpy.data.objects.new(name, mesh)
+            scene.collection.objects.link(obj)
+            kit[lod] = obj
+
+            it = scene.sl_renamer_items.add()
+            it.obj = obj
+            it.lod = lod
+            it.is_base = lod == 'LOD0'
+        kits.append(kit)
+
+        r = rnd.random()
+        if r < base_fraction:
+            b = scene.sl_renamer_bases.add()
+            b.obj = kit['LOD0']
+            if r < slot_fraction:
+                b.lod1_obj, b.lod2_obj, b.phys_obj = kit['LOD1'], kit['LOD2'], kit['PHYS']
+            else:
+                for it in list(scene.sl_renamer_items)[-3:]:
+                    it.base_ref = kit['LOD0']
+
+    # no active base: the list renames run over the whole list
+    scene.sl_renamer_base_index = -1
+    scene.sl_renamer_index = -1
+    return SyntheticScene(bpy, scene, context, kits)
+
+
+def populate_directory(directory, n_files, seed=0):
+    """Create n_files empty .dae/.glb LOD files named like messy exports."""
+    rnd = random.Random(seed)
+    names = []
+    for k in range(max(1, n_files // 4)):
+        base = f"kit_{k:06d}"
+        for kw in ('lod0', 'lod1', 'lod2', 'phys'):
+            ext = rnd.choice(('.dae', '.glb'))
+            names.append(f"{base}_{kw}{ext}")
+    for n in names:
+        with open(f"{directory}/{n}", 'wb'):
+            pass
+    return names
@@ -0,0 +1,248 @@
+"""Headless batch rename + export over many .blend files.
+
+Run from a shell with Blender in background mode, passing add-on settings and
+the files to process after the '--' separator:
+
+    blender -b --python /path/to/sl_renamer/batch.py -- "assets/**/*.blend" \
+        --workers 8 --set export_format=GLB --set export_mode=INDIVIDUAL \
+        --set target_dir=/exports --summary-json summary.json
+
+The controller expands the file list/globs and starts one background Blender
+per file (at most --workers at a time). Each worker opens its file, applies the
+--set overrides to scene.sl_renamer_props, runs "Apply List Renames" and
+"Export" and reports timings back; the controller prints one consolidated
+summary at the end.
+"""
+
+import os
+import sys
+
+if __name__ == '__main__' and not __package__:
+    # executed via `blender --python .../sl_renamer/batch.py`: make the package importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'sl_renamer'
+    import sl_renamer  # noqa: F401
+
+import argparse
+import glob
+import json
+import time
+
+from . import procpool
+
+STEP_OPERATORS = {
+    'rename': ('scene', 'sl_apply_list_renames'),
+    'export': ('scene', 'sl_export_scene'),
+}
+
+
+def _script_args():
+    """Arguments meant for us: everything after Blender's '--' separator."""
+    argv = sys.argv
+    if '--' in argv:
+        return argv[argv.index('--') + 1:]
+    return argv[1:]
+
+
+def _build_parser():
+    p = argparse.ArgumentParser(
+        prog='sl_renamer.batch',
+        description='Rename and export SL LOD sets in many .blend files using background Blender workers.',
+    )
+    p.add_argument('files', nargs='*', help='.blend files or glob patterns (use quotes for ** globs)')
+    p.add_argument('--files-from', help='text file with one .blend path or glob per line')
+    p.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='number of parallel Blender processes')
+    p.add_argument('--blender', default=None, help='Blender executable used for workers (default: this Blender)')
+    p.add_argument('--set', dest='settings', action='append', default=[], metavar='PROP=VALUE',
+                   help='override a SLRenamerProperties setting, e.g. export_format=DAE (repeatable)')
+    p.add_argument('--steps', default='rename,export', help='comma separated steps to run: rename, export')
+    p.add_argument('--scene', default='', help='scene name to operate on (default: the active scene)')
+    p.add_argument('--save', action='store_true', help='save each .blend after renaming')
+    p.add_argument('--timeout', type=float, default=None, help='seconds before a worker is killed')
+    p.add_argument('--summary-json', default='', help='write the consolidated summary to this JSON file')
+    # internal: run as a worker inside the Blender process that opened the file
+    p.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    return p
+
+
+def parse_settings(pairs):
+    settings = {}
+    for pair in pairs:
+        if '=' not in pair:
+            raise ValueError(f"invalid --set value '{pair}', expected PROP=VALUE")
+        key, value = pair.split('=', 1)
+        settings[key.strip()] = value.strip()
+    return settings
+
+
+def expand_files(patterns, files_from=''):
+    patterns = list(patterns)
+    if files_from:
+        with open(files_from, 'r', encoding='utf-8') as fh:
+            patterns += [ln.strip() for ln in fh if ln.strip() and not ln.startswith('#')]
+
+    seen = set()
+    files = []
+    for pat in patterns:
+        matches = sorted(glob.glob(pat, recursive=True)) if glob.has_magic(pat) else [pat]
+        for m in matches:
+            path = os.path.abspath(m)
+            if path in seen or not path.lower().endswith('.blend'):
+                continue
+            seen.add(path)
+            files.append(path)
+    return files
+
+
+# --- worker side (runs inside Blender with the .blend already open) ---
+
+
+def _coerce_setting(current, value):
+    """Convert a --set string to the type of the existing property value."""
+    if isinstance(current, bool):
+        return value.lower() in ('1', 'true', 'yes', 'on')
+    if isinstance(current, int):
+        return int(value)
+    if isinstance(current, float):
+        return float(value)
+    if isinstance(current, set):
+        return {v.strip() for v in value.split(',') if v.strip()}
+    return value
+
+
+def apply_settings(props, settings):
+    for key, value in settings.items():
+        if not hasattr(props, key):
+            raise ValueError(f"unknown SL Renamer setting '{key}'")
+        setattr(props, key, _coerce_setting(getattr(props, key), value))
+
+
+def _ensure_registered():
+    import bpy
+    if not hasattr(bpy.types.Scene, 'sl_renamer_props'):
+        import sl_renamer
+        sl_renamer.register()
+
+
+def run_worker(opts):
+    import bpy
+
+    result = {'file': bpy.data.filepath, 'status': 'ok', 'steps': {}}
+    start = time.perf_counter()
+    try:
+        _ensure_registered()
+        scene = bpy.data.scenes[opts.scene] if opts.scene else bpy.context.scene
+        apply_settings(scene.sl_renamer_props, parse_settings(opts.settings))
+
+        with bpy.context.temp_override(scene=scene):
+            for step in [s.strip() for s in opts.steps.split(',') if s.strip()]:
+                if step not in STEP_OPERATORS:
+                    raise ValueError(f"unknown step '{step}'")
+                mod, name = STEP_OPERATORS[step]
+                t0 = time.perf_counter()
+                ret = getattr(getattr(bpy.ops, mod), name)()
+                result['steps'][step] = {
+                    'seconds': time.perf_counter() - t0,
+                    'result': sorted(ret),
+                }
+                if 'CANCELLED' in ret:
+                    result['status'] = 'cancelled'
+
+        if opts.save:
+            bpy.ops.wm.save_mainfile()
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - start
+    procpool.emit_result(result)
+    return 0 if result['status'] != 'error' else 1
+
+
+# --- controller side ---
+
+
+def _worker_args(opts):
+    args = ['--worker', '--steps', opts.steps]
+    for pair in opts.settings:
+        args += ['--set', pair]
+    if opts.scene:
+        args += ['--scene', opts.scene]
+    if opts.save:
+        args.append('--save')
+    return args
+
+
+def format_summary(rows):
+    lines = []
+    width = max([len(os.path.basename(r['file'])) for r in rows] + [4])
+    lines.append(f"{'file':<{width}}  {'status':<9}  {'total s':>8}  steps")
+    for r in rows:
+        steps = ', '.join(f"{k} {v['seconds']:.2f}s" for k, v in r.get('steps', {}).items())
+        if r.get('error'):
+            steps = (steps + '; ' if steps else '') + r['error']
+        lines.append(f"{os.path.basename(r['file']):<{width}}  {r['status']:<9}  {r['seconds']:>8.2f}  {steps}")
+    ok = sum(1 for r in rows if r['status'] == 'ok')
+    lines.append(f"{ok}/{len(rows)} file(s) succeeded")
+    return '\n'.join(lines)
+
+
+def run_controller(opts):
+    files = expand_files(opts.files, opts.files_from)
+    if not files:
+        print("SL Batch: no .blend files matched")
+        return 2
+    parse_settings(opts.settings)  # validate syntax before starting any worker
+
+    script = os.path.abspath(__file__)
+    jobs = [procpool.BlenderJob(f, script, _worker_args(opts), blend_file=f) for f in files]
+    pool = procpool.BlenderPool(jobs, workers=opts.workers, blender=opts.blender, timeout=opts.timeout)
+    print(f"SL Batch: processing {len(files)} file(s) with {pool.workers} worker(s)")
+
+    rows = {}
+
+    def _on_event(ev):
+        f = ev['label']
+        if ev['event'] == 'result':
+            rows[f] = dict(ev['payload'], file=f)
+        elif ev['event'] == 'error':
+            rows.setdefault(f, {'file': f, 'status': 'error', 'steps': {}, 'seconds': 0.0})
+            rows[f]['status'] = 'error'
+            rows[f]['error'] = ev['error']
+        elif ev['event'] == 'done':
+            if f not in rows:
+                # the worker died before reporting anything
+                rows[f] = {
+                    'file': f,
+                    'status': 'error',
+                    'steps': {},
+                    'seconds': ev['elapsed'],
+                    'error': f"worker exited with code {ev['returncode']}: " + ' | '.join(ev['output'][-3:]),
+                }
+            row = rows[f]
+            row['process_seconds'] = ev['elapsed']
+            print(f"SL Batch: {os.path.basename(f)} {row['status']} ({ev['elapsed']:.2f}s)")
+
+    start = time.perf_counter()
+    pool.run(on_event=_on_event)
+    elapsed = time.perf_counter() - start
+
+    ordered = [rows.get(f, {'file': f, 'status': 'error', 'steps': {}, 'seconds': 0.0}) for f in files]
+    print(format_summary(ordered))
+    print(f"SL Batch: wall time {elapsed:.2f}s")
+
+    if opts.summary_json:
+        with open(opts.summary_json, 'w', encoding='utf-8') as fh:
+            json.dump({'elapsed': elapsed, 'workers': pool.workers, 'files': ordered}, fh, indent=2)
+
+    return 0 if all(r['status'] == 'ok' for r in ordered) else 1
+
+
+def main(argv=None):
+    opts = _build_parser().parse_args(_script_args() if argv is None else argv)
+    if opts.worker:
+        return run_worker(opts)
+    return run_controller(opts)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,5 +1,8 @@
 import bpy
 import os
+import numpy as np
+from . import (dae_writer, export_cache, fileops, geometry, glb_writer, land_impact, list_index, log, pairing,
+               parallel_export, planner, profiler, templates, verify)
 from bpy.props import (
     StringProperty,
     BoolProperty,
@@ -7,42 +10,52 @@ from bpy.props import (
     PointerProperty,
     CollectionProperty,
     IntProperty,
+    FloatProperty,
 )
 
-# Naming templates adapted for Second Life: base + LOD/PHYS suffixes
-DEFAULT_TEMPLATES = {
-    # Second Life prefers LOD0 (highest), LOD1, LOD2 and a separate physics mesh
-    'mesh_lod0': "{base}_LOD0",
-    'mesh_lod1': "{base}_LOD1",
-    'mesh_lod2': "{base}_LOD2",
-    'phys': "{base}_PHYS",
+# Items list LOD enum value -> template key
+LOD_TEMPLATE_KEYS = {
+    'LOD0': 'mesh_lod0',
+    'LOD1': 'mesh_lod1',
+    'LOD2': 'mesh_lod2',
+    'PHYS': 'phys',
 }
+_TEMPLATE_KEY_LODS = {key: lod for lod, key in LOD_TEMPLATE_KEYS.items()}
 
+# Naming templates adapted for Second Life: base + LOD/PHYS suffixes (the scene can override them)
+DEFAULT_TEMPLATES = {key: templates.DEFAULT_PATTERNS[lod] for lod, key in LOD_TEMPLATE_KEYS.items()}
 
-def apply_template(base, template_key):
-    tpl = DEFAULT_TEMPLATES.get(template_key, "{base}")
-    return tpl.format(base=base)
 
+def apply_template(base, template_key):
+    lod = _TEMPLATE_KEY_LODS.get(template_key)
+    if lod is None:
+        return base
+    return templates.active().format(base, lod)
+
+
+def _template_patterns(props):
+    return {
+        'LOD0': props.template_lod0,
+        'LOD1': props.template_lod1,
+        'LOD2': props.template_lod2,
+        'PHYS': props.template_phys,
+    }
 
-def _bl_log(msg: str):
-    """Log a message into Blender's Text Editor (SL_Renamer_Log) and print to console.
 
-    This ensures logs are visible inside Blender (open Text Editor -> SL_Renamer_Log)
-    and also printed to the system console.
-    """
-    try:
-        # append to or create a text datablock
-        txt = bpy.data.texts.get('SL_Renamer_Log')
-        if txt is None:
-            txt = bpy.data.texts.new('SL_Renamer_Log')
-        txt.write(msg + "\n")
-    except Exception:
-        # ignore text buffer errors
-        pass
+def _sync_templates(props):
+    """Activate the scene's naming templates; an invalid set keeps the previous one."""
     try:
-        print(msg)
-    except Exception:
-        pass
+        templates.activate(_template_patterns(props), props.template_case_sensitive)
+    except templates.TemplateError as e:
+        log.warning(f"SL Renamer: naming templates not applied: {e}")
+        return False
+    return True
+
+
+def _on_template_update(self, context):
+    _sync_templates(self)
+    # derived base names (list filters, file preview) depend on the templates
+    list_index.invalidate()
 
 
 class SLRenamerProperties(bpy.types.PropertyGroup):
@@ -57,6 +70,36 @@ class SLRenamerProperties(bpy.types.PropertyGroup):
         default="",
         subtype='DIR_PATH'
     )
+    template_lod0: StringProperty(
+        name="LOD0 Template",
+        description="Name of the high LOD; {base} is replaced by the base name",
+        default=templates.DEFAULT_PATTERNS['LOD0'],
+        update=_on_template_update,
+    )
+    template_lod1: StringProperty(
+        name="LOD1 Template",
+        description="Name of the medium LOD; {base} is replaced by the base name",
+        default=templates.DEFAULT_PATTERNS['LOD1'],
+        update=_on_template_update,
+    )
+    template_lod2: StringProperty(
+        name="LOD2 Template",
+        description="Name of the low LOD; {base} is replaced by the base name",
+        default=templates.DEFAULT_PATTERNS['LOD2'],
+        update=_on_template_update,
+    )
+    template_phys: StringProperty(
+        name="PHYS Template",
+        description="Name of the physics mesh; {base} is replaced by the base name",
+        default=templates.DEFAULT_PATTERNS['PHYS'],
+        update=_on_template_update,
+    )
+    template_case_sensitive: BoolProperty(
+        name="Case-Sensitive Templates",
+        description="Only recognise names whose template text matches in case (chair_lod1 is not chair_LOD1)",
+        default=False,
+        update=_on_template_update,
+    )
     rename_files: BoolProperty(
         name="Rename Files",
         description="Also rename files on disk in the target directory",
@@ -123,6 +166,126 @@ class SLRenamerProperties(bpy.types.PropertyGroup):
         description="If enabled, only the modifiers selected above will be applied to temp copies during export",
         default=False,
     )
+    modifier_apply_method: EnumProperty(
+        name="Apply Method",
+        description="How the selected modifiers are applied to the export copies",
+        items=[
+            ('EVALUATED', 'Evaluated mesh', 'Build each export mesh once from the evaluated depsgraph (fast, no operators)'),
+            ('OPERATOR', 'Modifier Apply', 'Copy the mesh and run Apply Modifier for each modifier (legacy)'),
+        ],
+        default='EVALUATED',
+    )
+    li_sort_key: EnumProperty(
+        name="Sort By",
+        description="Column the land impact report is sorted by",
+        items=[
+            ('land_impact', 'Land Impact', ''),
+            ('streaming', 'Streaming', ''),
+            ('physics', 'Physics', ''),
+            ('tris_lod0', 'LOD0 Triangles', ''),
+            ('NAME', 'Name', ''),
+        ],
+        default='land_impact',
+    )
+    li_sort_reverse: BoolProperty(
+        name="Reverse",
+        description="Reverse the report order (costs sort highest first, names A-Z)",
+        default=False,
+    )
+    lod1_ratio: FloatProperty(
+        name="LOD1 Budget",
+        description="Triangle budget of generated LOD1 meshes as a fraction of LOD0",
+        default=0.5,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+    )
+    lod2_ratio: FloatProperty(
+        name="LOD2 Budget",
+        description="Triangle budget of generated LOD2 meshes as a fraction of LOD0",
+        default=0.25,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+    )
+    phys_ratio: FloatProperty(
+        name="PHYS Budget",
+        description="Triangle budget of generated physics meshes as a fraction of LOD0",
+        default=0.05,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+    )
+    lod_min_tris: IntProperty(
+        name="Minimum Triangles",
+        description="Generated meshes are never decimated below this many triangles",
+        default=12,
+        min=1,
+    )
+    lod_gen_replace: BoolProperty(
+        name="Replace Filled Slots",
+        description="Regenerate slots that already hold an object (previously generated objects are deleted)",
+        default=False,
+    )
+    log_level: EnumProperty(
+        name="Log Level",
+        description="Lowest severity written to the SL_Renamer_Log text and the console",
+        items=[
+            ('DEBUG', 'Debug', ''),
+            ('INFO', 'Info', ''),
+            ('WARNING', 'Warning', ''),
+            ('ERROR', 'Error', ''),
+        ],
+        default='INFO',
+    )
+    log_buffer_size: IntProperty(
+        name="Log Buffer",
+        description="Maximum number of messages kept per operator run; older ones are dropped",
+        default=10000,
+        min=100,
+    )
+    log_jsonl_path: StringProperty(
+        name="JSONL Log File",
+        description="Optionally also append every message as a JSON line to this file",
+        default="",
+        subtype='FILE_PATH',
+    )
+    profile_enabled: BoolProperty(
+        name="Profile Operators",
+        description="Record wall time, calls and object counts of every operator and its phases "
+                    "(shown under Profiler Report)",
+        default=False,
+    )
+    export_force: BoolProperty(
+        name="Force Re-export",
+        description="Export every file even if the export manifest says it is up to date",
+        default=False,
+    )
+    export_native_glb: BoolProperty(
+        name="Fast GLB Writer",
+        description="Write static meshes with the built-in GLB writer (geometry, UVs, material names); "
+                    "objects it does not cover use the stock glTF exporter",
+        default=False,
+    )
+    export_verify: BoolProperty(
+        name="Verify Written Files",
+        description="After exporting, read the written files back and check node names and triangle counts",
+        default=True,
+    )
+    export_chunk_size: IntProperty(
+        name="Objects per Step",
+        description="Objects the interactive export processes per timer tick (higher is faster, less responsive)",
+        default=1,
+        min=1,
+        max=1000,
+    )
+    export_workers: IntProperty(
+        name="Parallel Workers",
+        description="Export Individual files with this many background Blender processes (0 or 1 exports in this session)",
+        default=0,
+        min=0,
+        max=64,
+    )
 
 
 class SLRenamerItem(bpy.types.PropertyGroup):
@@ -130,6 +293,7 @@ class SLRenamerItem(bpy.types.PropertyGroup):
     obj: PointerProperty(
         name="Object",
         type=bpy.types.Object,
+        update=list_index.on_item_update,
     )
     lod: EnumProperty(
         name="LOD",
@@ -140,30 +304,46 @@ class SLRenamerItem(bpy.types.PropertyGroup):
             ('LOD2', 'Low (LOD2)', ''),
             ('PHYS', 'Physics (PHYS)', ''),
         ],
-        default='LOD0'
+        default='LOD0',
+        update=list_index.on_item_update,
     )
     is_base: BoolProperty(
         name="Base",
         description="Mark this item as the reference/base object for its group",
         default=False,
+        update=list_index.on_item_update,
     )
     # pointer to an explicit base object entry (optional)
     base_ref: PointerProperty(
         name="Base Ref",
         type=bpy.types.Object,
+        update=list_index.on_item_update,
     )
 
 
 
 class SLRenamerBase(bpy.types.PropertyGroup):
     """Represents an original/base object that can be referenced by other items"""
-    obj: PointerProperty(name="Object", type=bpy.types.Object)
+    obj: PointerProperty(name="Object", type=bpy.types.Object, update=list_index.on_item_update)
     lod0_obj: PointerProperty(name="LOD0", type=bpy.types.Object)
     lod1_obj: PointerProperty(name="LOD1", type=bpy.types.Object)
     lod2_obj: PointerProperty(name="LOD2", type=bpy.types.Object)
     phys_obj: PointerProperty(name="PHYS", type=bpy.types.Object)
 
 
+class SLRenamerLandImpact(bpy.types.PropertyGroup):
+    """One row of the land impact report (name holds the base object's name)"""
+    obj: PointerProperty(name="Base", type=bpy.types.Object)
+    tris_lod0: IntProperty(name="LOD0 Triangles")
+    tris_lod1: IntProperty(name="LOD1 Triangles")
+    tris_lod2: IntProperty(name="LOD2 Triangles")
+    tris_phys: IntProperty(name="PHYS Triangles")
+    radius: FloatProperty(name="Radius")
+    streaming: FloatProperty(name="Streaming Cost")
+    physics: FloatProperty(name="Physics Cost")
+    land_impact: IntProperty(name="Land Impact")
+
+
 
 
 class OBJECT_OT_rename_lods(bpy.types.Operator):
@@ -171,6 +351,8 @@ class OBJECT_OT_rename_lods(bpy.types.Operator):
     bl_label = "Rename LODs and Phys"
     bl_description = "Rename selected objects (or all) to Second Life LOD/phys naming"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         props = context.scene.sl_renamer_props
         # Determine base name and (preferably) base object.
@@ -196,24 +378,23 @@ class OBJECT_OT_rename_lods(bpy.types.Operator):
         # If we still don't have a base object, look inside the selection for a LOD0 object
         if base_obj is None:
             for obj in sel or list(context.scene.objects):
-                if 'LOD0' in obj.name.upper() or obj.name.upper().endswith('_LOD0'):
+                if _lod_of_name(obj.name) == 'LOD0' or 'LOD0' in obj.name.upper():
                     base_obj = obj
                     break
 
         # As a last resort, search the whole scene for a LOD0 object
         if base_obj is None:
             for obj in context.scene.objects:
-                if 'LOD0' in obj.name.upper() or obj.name.upper().endswith('_LOD0'):
+                if _lod_of_name(obj.name) == 'LOD0' or 'LOD0' in obj.name.upper():
                     base_obj = obj
                     break
 
         # If we found a base object, derive its base name
         if base_obj is not None:
             bname = base_obj.name
-            for sfx in ['_LOD0', '_LOD1', '_LOD2', '_PHYS']:
-                if bname.upper().endswith(sfx):
-                    base = bname[:-len(sfx)]
-                    break
+            parsed = templates.active().parse(bname)
+            if parsed is not None:
+                base = parsed[0]
             if not base:
                 base = bname
 
@@ -222,76 +403,232 @@ class OBJECT_OT_rename_lods(bpy.types.Operator):
             return {'CANCELLED'}
 
         sel = list(context.selected_objects) if context.selected_objects else list(context.scene.objects)
-        # Heuristic: try to detect objects named with LOD0/LOD1/LOD2/PHYS or use selection order
-        name_map = {}
-        keywords = ['lod0', 'lod1', 'lod2', 'phys']
+
+        # a whole kit (several bases) is paired by geometry, one LOD set per base
+        kit_bases = _kit_bases(scene_bases, sel)
+        if len(kit_bases) >= 2:
+            return self._rename_kit(context, props, kit_bases, sel)
+
         # If a base object was found, exclude it from the list of secondary candidates
         candidates = [o for o in sel if o is not base_obj]
+        with profiler.phase('renaming', objects=len(candidates)):
+            _apply_renames(_lod_set_names(base, _assign_lod_slots(candidates, base_obj)))
+            # object names are shown and sorted in the lists
+            list_index.invalidate()
 
-        # first pass: assign any objects that already contain LOD/PHYS in their names
-        used_objs = set()
-        for obj in candidates:
-            lname = obj.name.lower()
-            for kw in keywords:
-                if kw in lname and kw not in name_map:
-                    name_map[kw] = obj
-                    used_objs.add(obj)
-                    break
+        # Optionally rename files on disk
+        if props.rename_files and props.target_dir:
+            with profiler.phase('file ops', objects=1):
+                rename_files_on_disk(props.target_dir, base, dry_run=props.dry_run)
 
-        # second pass: fill remaining slots in preferred order (LOD1, LOD2, PHYS) from remaining candidates
-        remaining_keys = [k for k in ['lod1', 'lod2', 'phys'] if k not in name_map]
-        ci = 0
-        for obj in candidates:
-            if obj in used_objs:
-                continue
-            if ci >= len(remaining_keys):
-                break
-            kw = remaining_keys[ci]
-            name_map[kw] = obj
-            used_objs.add(obj)
-            ci += 1
-
-        # ensure LOD0 is set: prefer existing LOD0 object, else the base_obj (if present)
-        if 'lod0' not in name_map:
-            # try candidates first
-            for obj in candidates:
-                if 'lod0' in obj.name.lower():
-                    name_map['lod0'] = obj
-                    break
-            # fall back to base_obj if available (we don't rename base, but ensure mapping exists)
-            if 'lod0' not in name_map and base_obj is not None:
-                name_map['lod0'] = base_obj
-
-        # apply names
-        mapping = {
-            'lod0': apply_template(base, 'mesh_lod0'),
-            'lod1': apply_template(base, 'mesh_lod1'),
-            'lod2': apply_template(base, 'mesh_lod2'),
-            'phys': apply_template(base, 'phys'),
-        }
+        self.report({'INFO'}, "SL Renamer: Rename complete (check console for details)")
+        return {'FINISHED'}
 
-        for kw, obj in name_map.items():
-            new_name = mapping.get(kw, f"{base}_{kw}")
-            obj.name = new_name
-            if getattr(obj, 'data', None):
-                try:
-                    obj.data.name = new_name
-                except Exception:
-                    pass
+    def _rename_kit(self, context, props, bases, sel):
+        base_set = set(bases)
+        candidates = [o for o in sel if o not in base_set]
+        with profiler.phase('grouping', objects=len(candidates)):
+            clusters = _cluster_by_base(bases, candidates)
+
+        unmatched = len(candidates) - sum(len(c) for c in clusters)
+        if unmatched:
+            log.warning(f"SL Renamer: {unmatched} object(s) match no base by name or size; left unchanged")
+
+        # old names, for renaming the files that belong to each base
+        file_targets = {}
+        with profiler.phase('renaming', objects=len(candidates) + len(bases)):
+            pairs = []
+            for base_obj, members in zip(bases, clusters):
+                base = _derive_base_from_name(base_obj.name)
+                file_targets.setdefault(base, []).extend(o.name for o in members)
+                # within a base, unnamed LODs are filled from the densest mesh down
+                members.sort(key=_triangles_of, reverse=True)
+                pairs.extend(_lod_set_names(base, _assign_lod_slots(members, base_obj)))
+                log.info(f"SL Renamer: {base}: {len(members)} LOD object(s) paired")
+            # the whole kit at once, so LODs trading names between sets do not collide
+            _apply_renames(pairs)
+            list_index.invalidate()
 
-        # Optionally rename files on disk
         if props.rename_files and props.target_dir:
-            rename_files_on_disk(props.target_dir, base, dry_run=props.dry_run)
+            with profiler.phase('file ops', objects=len(file_targets)):
+                rename_files_for_bases(props.target_dir, file_targets, dry_run=props.dry_run)
 
-        self.report({'INFO'}, "SL Renamer: Rename complete (check console for details)")
+        self.report({'INFO'}, f"SL Renamer: renamed LOD sets of {len(bases)} base(s) (check console for details)")
         return {'FINISHED'}
 
 
+def _assign_lod_slots(candidates, base_obj):
+    """{'lod0'|'lod1'|'lod2'|'phys': object} for one LOD set.
+
+    Objects whose names follow a naming template keep that slot, then
+    objects whose names contain a LOD/PHYS keyword take it; the remaining
+    LOD1, LOD2 and PHYS slots are filled in candidate order. LOD0 falls back
+    to base_obj (which keeps its name).
+    """
+    name_map = {}
+    keywords = ['lod0', 'lod1', 'lod2', 'phys']
+
+    # first pass: objects already named by the templates, then by keyword
+    used_objs = set()
+    for obj in candidates:
+        lod = _lod_of_name(obj.name)
+        if lod is not None and lod.lower() not in name_map:
+            name_map[lod.lower()] = obj
+            used_objs.add(obj)
+    for obj in candidates:
+        if obj in used_objs:
+            continue
+        lname = obj.name.lower()
+        for kw in keywords:
+            if kw in lname and kw not in name_map:
+                name_map[kw] = obj
+                used_objs.add(obj)
+                break
+
+    # second pass: fill remaining slots in preferred order (LOD1, LOD2, PHYS) from remaining candidates
+    remaining_keys = [k for k in ['lod1', 'lod2', 'phys'] if k not in name_map]
+    ci = 0
+    for obj in candidates:
+        if obj in used_objs:
+            continue
+        if ci >= len(remaining_keys):
+            break
+        kw = remaining_keys[ci]
+        name_map[kw] = obj
+        used_objs.add(obj)
+        ci += 1
+
+    # ensure LOD0 is set: prefer existing LOD0 object, else the base_obj (if present)
+    if 'lod0' not in name_map:
+        # try candidates first
+        for obj in candidates:
+            if _lod_of_name(obj.name) == 'LOD0' or 'lod0' in obj.name.lower():
+                name_map['lod0'] = obj
+                break
+        # fall back to base_obj if available (we don't rename base, but ensure mapping exists)
+        if 'lod0' not in name_map and base_obj is not None:
+            name_map['lod0'] = base_obj
+    return name_map
+
+
+def _lod_set_names(base, name_map):
+    """(object, new name) for every object of one LOD set."""
+    mapping = {
+        'lod0': apply_template(base, 'mesh_lod0'),
+        'lod1': apply_template(base, 'mesh_lod1'),
+        'lod2': apply_template(base, 'mesh_lod2'),
+        'phys': apply_template(base, 'phys'),
+    }
+    return [(obj, mapping.get(kw, f"{base}_{kw}")) for kw, obj in name_map.items()]
+
+
+def _assign_names(ids, temps, finals):
+    for pass_names in (temps, finals):
+        for i, name in pass_names:
+            try:
+                ids[i].name = name
+            except Exception as e:
+                log.warning(f"SL Renamer: cannot rename '{ids[i].name}' to '{name}': {e}")
+
+
+def _apply_renames(pairs):
+    """Rename objects, and their mesh data, without Blender's '.001' fallback.
+
+    pairs are (object, new name). All collisions are resolved up front (see
+    planner.resolve_collisions): objects and meshes whose names are wanted
+    by another rename are moved to temporary names in one pass, then the
+    final names are assigned in a second. A name held by something that is
+    not renamed is left alone and the rename is skipped with a warning.
+    Returns the number of objects renamed.
+    """
+    objs = []
+    renames = []
+    for obj, new_name in pairs:
+        if getattr(obj, 'library', None) is not None:
+            log.warning(f"SL Renamer: '{obj.name}' is linked from a library; not renamed")
+            continue
+        renames.append((len(objs), obj.name, new_name))
+        objs.append(obj)
+
+    temps, finals, conflicts = planner.resolve_collisions(renames, bpy.data.objects)
+    for i, name in conflicts:
+        log.warning(f"SL Renamer: '{name}' is already used by another object; '{objs[i].name}' not renamed")
+
+    # meshes get the object's name; a mesh shared by several objects ends with the last one
+    meshes = []
+    mesh_keys = {}
+    mesh_renames = []
+    other_data = []  # curves, armatures, ...: renamed directly as before
+    for i, name in finals:
+        data = getattr(objs[i], 'data', None)
+        if data is None or getattr(data, 'library', None) is not None:
+            continue
+        if objs[i].type != 'MESH':
+            other_data.append((data, name))
+            continue
+        key = mesh_keys.setdefault(data.session_uid, len(meshes))
+        if key == len(meshes):
+            meshes.append(data)
+        mesh_renames.append((key, data.name, name))
+    mesh_temps, mesh_finals, mesh_conflicts = planner.resolve_collisions(mesh_renames, bpy.data.meshes)
+    for i, name in mesh_conflicts:
+        log.info(f"SL Renamer: mesh name '{name}' is taken; mesh '{meshes[i].name}' keeps its name")
+
+    _assign_names(objs, temps, finals)
+    _assign_names(meshes, mesh_temps, mesh_finals)
+    for data, name in other_data:
+        try:
+            data.name = name
+        except Exception:
+            pass
+    return len(finals)
+
+
+def _kit_bases(scene_bases, sel):
+    """Bases of a kit rename: the Bases list plus the selected LOD0 objects."""
+    bases = [b.obj for b in scene_bases if b.obj] if scene_bases else []
+    bases += [o for o in sel if _lod_of_name(o.name) == 'LOD0']
+    # an object listed twice is still one base
+    return list(dict.fromkeys(bases))
+
+
+def _cluster_by_base(bases, candidates):
+    """Candidates grouped per base (same order as bases).
+
+    A candidate whose name minus its LOD suffix equals a base's goes to that
+    base; the others are paired by geometry (pairing.nearest_bases). Objects
+    no base fits are left out.
+    """
+    clusters = [[] for _ in bases]
+    by_name = {}
+    for i, b in enumerate(bases):
+        by_name.setdefault(_derive_base_from_name(b.name), i)
+    unnamed = []
+    for obj in candidates:
+        i = by_name.get(_derive_base_from_name(obj.name)) if _lod_of_name(obj.name) else None
+        if i is not None:
+            clusters[i].append(obj)
+        else:
+            unnamed.append(obj)
+    for obj, i in zip(unnamed, pairing.nearest_bases(bases, unnamed)):
+        if i is not None:
+            clusters[i].append(obj)
+    return clusters
+
+
+def _triangles_of(obj):
+    if obj.type != 'MESH' or obj.data is None:
+        return 0
+    return geometry.triangle_count(obj.data)
+
+
 class OBJECT_OT_validate_for_sl(bpy.types.Operator):
     bl_idname = "object.sl_validate_for_sl"
     bl_label = "Validate for SL Upload"
-    bl_description = "Check selected objects / LODs for common Second Life upload issues"
+    bl_description = "Check selected objects / LODs for common Second Life upload issues and geometry statistics"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         objs = context.selected_objects if context.selected_objects else list(context.scene.objects)
         issues = []
@@ -310,30 +647,34 @@ class OBJECT_OT_validate_for_sl(bpy.types.Operator):
             if len(mat_names) > 8:
                 issues.append(f"Mesh '{mesh.name}' has {len(mat_names)} materials (limit 8 recommended)")
 
-        # Check LOD parent relationships by name suffixes
-        # Build map of base names found (strip _LOD* and _PHYS)
+        # Check LOD parent relationships by the naming templates
+        # Build map of base names found -> {lod (None when unsuffixed): mesh names}
+        tset = templates.active()
         name_buckets = {}
         for obj in objs:
             mesh = getattr(obj, 'data', None)
             if not mesh:
                 continue
-            lname = mesh.name
-            base = lname
-            for sfx in ["_LOD0", "_LOD1", "_LOD2", "_PHYS"]:
-                if lname.endswith(sfx):
-                    base = lname[:-len(sfx)]
-                    break
-            name_buckets.setdefault(base, []).append(lname)
+            parsed = tset.parse(mesh.name)
+            base, lod = parsed if parsed else (mesh.name, None)
+            name_buckets.setdefault(base, {}).setdefault(lod, []).append(mesh.name)
 
-        for base, variants in name_buckets.items():
-            # If lower LOD present, ensure parent (no suffix) exists
-            for sfx in ["_LOD2", "_LOD1", "_LOD0", "_PHYS"]:
-                if any(v.endswith(sfx) for v in variants) and base not in [v for v in variants]:
-                    issues.append(f"Base/high LOD mesh '{base}' not found while '{sfx}' variants exist: {variants}")
+        for base, by_lod in name_buckets.items():
+            # If lower LOD present, ensure the high LOD (unsuffixed or LOD0) exists
+            if None in by_lod or 'LOD0' in by_lod:
+                continue
+            for lod in ('LOD2', 'LOD1', 'PHYS'):
+                if lod in by_lod:
+                    variants = [n for names in by_lod.values() for n in names]
+                    issues.append(f"Base/high LOD mesh '{base}' not found while {lod} variants exist: {variants}")
+
+        table = _validate_geometry(objs, issues)
+        if table:
+            log.info("SL Validator: geometry statistics\n" + table)
 
         if issues:
             for i in issues:
-                _bl_log(f"SL Validator: {i}")
+                log.warning(f"SL Validator: {i}")
             self.report({'WARNING'}, f"Validation found {len(issues)} issue(s). See Text Editor 'SL_Renamer_Log' or system console.")
             return {'FINISHED'}
 
@@ -341,161 +682,614 @@ class OBJECT_OT_validate_for_sl(bpy.types.Operator):
         return {'FINISHED'}
 
 
-def rename_files_on_disk(directory, base, dry_run=True):
+def _lod_of_name(name):
+    """'LOD0'/'LOD1'/'LOD2'/'PHYS' when name follows a naming template, or None."""
+    return templates.active().lod_of(name)
+
+
+def _validate_geometry(objs, issues):
+    """Collect per-mesh geometry statistics and LOD triangle ratios.
+
+    Returns the statistics as a text table; degenerate and zero-area counts
+    are columns and an inverted LOD ratio is marked with '!'. Geometry
+    problems add a single summary line to issues, not one per mesh. Meshes
+    shared by several objects are analysed once.
+    """
+    stats_by_mesh = {}
+    rows = []
+    lod_tris = {}  # base -> {lod: tris}
+    for obj in objs:
+        if obj.type != 'MESH' or obj.data is None:
+            continue
+        mesh = obj.data
+        st = stats_by_mesh.get(mesh)
+        if st is None:
+            st = stats_by_mesh[mesh] = geometry.mesh_stats(mesh)
+        lod = _lod_of_name(obj.name)
+        base = _derive_base_from_name(obj.name) if lod else obj.name
+        # an unsuffixed object is the high LOD of its group unless an explicit _LOD0 exists
+        bucket = lod_tris.setdefault(base, {})
+        key = lod or 'BASE'
+        bucket[key] = bucket.get(key, 0) + st.tris
+        rows.append([obj.name, lod or '-', st.tris, st.verts, st.loops, st.degenerate, st.zero_area])
+
+    ratios = {}
+    for base, tris in lod_tris.items():
+        if 'LOD0' not in tris and 'BASE' in tris:
+            tris['LOD0'] = tris['BASE']
+        chain = [lod for lod in ('LOD0', 'LOD1', 'LOD2') if lod in tris]
+        for hi, lo in zip(chain, chain[1:]):
+            if tris[hi] == 0:
+                continue
+            ratios[(base, lo)] = tris[lo] / tris[hi]
+
+    for r in rows:
+        lod = r[1] if r[1] != '-' else None
+        ratio = ratios.get((_derive_base_from_name(r[0]), lod)) if lod else None
+        # above 1.0 the LOD has more triangles than the level above it
+        r.append('' if ratio is None else f"{ratio:.2f}" + (' !' if ratio > 1.0 else ''))
+
+    degenerate = sum(1 for st in stats_by_mesh.values() if st.degenerate)
+    zero_area = sum(1 for st in stats_by_mesh.values() if st.zero_area)
+    inverted = sum(1 for ratio in ratios.values() if ratio > 1.0)
+    if degenerate or zero_area or inverted:
+        issues.append(f"geometry: {degenerate} mesh(es) with degenerate triangles, {zero_area} with zero-area "
+                      f"triangles, {inverted} LOD(s) with more triangles than the level above (see the table)")
+
+    if not rows:
+        return ''
+    rows.sort(key=lambda r: (_derive_base_from_name(r[0]), r[1]))
+    total = sum(st.tris for st in stats_by_mesh.values())
+    return geometry.format_table(
+        ['object', 'lod', 'tris', 'verts', 'loops', 'degen', 'zero-area', 'ratio'], rows
+    ) + f"\n{len(rows)} object(s), {total} unique triangles"
+
+
+def _file_target_name(base, keyword):
+    return apply_template(base, LOD_TEMPLATE_KEYS[keyword.upper()])
+
+
+def rename_files_for_bases(directory, targets, dry_run=True, index=None):
+    """Rename .dae/.glb files for several bases using one directory scan.
+
+    targets maps base name -> iterable of alias names (old object names) whose
+    files should be renamed to that base. An existing fileops.DirectoryIndex
+    can be passed in to avoid rescanning the directory.
+
+    The directory listing comes from the session's fileops.snapshot cache
+    (one stat when nothing changed). The moves are checked for collisions up
+    front and applied as one journaled fileops.RenameTransaction (see
+    SL_OT_rollback_file_renames). Returns the transaction, or None when the
+    directory does not exist.
+    """
+    directory = bpy.path.abspath(directory)
     if not os.path.isdir(directory):
-        print(f"SL Renamer: directory not found: {directory}")
+        log.error(f"SL Renamer: directory not found: {directory}")
         return
+    exists = os.path.exists
+    if index is None:
+        snap = fileops.snapshot(directory)
+        index, exists = snap.index, snap.exists
+
+    moves, unmatched = index.plan(targets, _file_target_name)
+    pending = []
+    for mv in moves:
+        fname = os.path.basename(mv.src)
+        if os.path.abspath(mv.src) == os.path.abspath(mv.dst):
+            log.debug(f"SL Renamer: skipping {fname}, already named correctly")
+            continue
+        pending.append(mv)
+    if unmatched:
+        log.info(f"SL Renamer: {len(unmatched)} LOD/PHYS file(s) did not match any base and were left as-is")
+
+    txn = fileops.RenameTransaction(directory, pending, exists=exists)
+    for c in txn.conflicts:
+        log.warning(f"SL Renamer: not renaming {os.path.basename(c.src)} -> {os.path.basename(c.dst)}: {c.reason}")
+    for src, dst in txn.moves:
+        log.info(f"SL Renamer: will rename {os.path.basename(src)} -> {os.path.basename(dst)}")
+    if dry_run or not txn.moves:
+        return txn
 
-    # Second Life accepted upload types are COLLADA (.dae) and glTF Binary (.glb)
-    exts = ['.dae', '.glb']
-    target_names = {
-        'lod0': apply_template(base, 'mesh_lod0'),
-        'lod1': apply_template(base, 'mesh_lod1'),
-        'lod2': apply_template(base, 'mesh_lod2'),
-        'phys': apply_template(base, 'phys'),
-    }
+    try:
+        txn.apply()
+    except fileops.RenameError as e:
+        log.error(f"SL Renamer: file renames rolled back, {e}")
+        return txn
+    log.info(f"SL Renamer: renamed {len(txn.moves)} file(s); journal written to {txn.journal_path}")
+    return txn
 
-    # prepare list of files
-    for fname in os.listdir(directory):
-        fpath = os.path.join(directory, fname)
-        if not os.path.isfile(fpath):
-            continue
-        name_lower = fname.lower()
-        for key, target in target_names.items():
-            if key in name_lower:
-                base_name, ext = os.path.splitext(fname)
-                if ext.lower() in exts:
-                    dst = os.path.join(directory, target + ext)
-                    if os.path.abspath(fpath) == os.path.abspath(dst):
-                        print(f"SL Renamer: skipping {fname}, already named correctly")
-                        break
-                    print(f"SL Renamer: will rename {fname} -> {os.path.basename(dst)}")
-                    if not dry_run:
-                        try:
-                            os.replace(fpath, dst)
-                            print(f"Renamed {fname} -> {os.path.basename(dst)}")
-                        except Exception as e:
-                            print(f"Failed to rename {fname} -> {os.path.basename(dst)}: {e}")
-                    break
 
+def rename_files_on_disk(directory, base, dry_run=True, index=None):
+    return rename_files_for_bases(directory, {base: ()}, dry_run=dry_run, index=index)
 
-class SL_OT_export_scene(bpy.types.Operator):
-    """Export selected/items/bases to GLB or DAE with optional modifier application"""
-    bl_idname = "scene.sl_export_scene"
-    bl_label = "Export SL Group"
 
-    def execute(self, context):
-        scene = context.scene
-        props = scene.sl_renamer_props
+class SL_OT_rollback_file_renames(bpy.types.Operator):
+    bl_idname = "scene.sl_rollback_file_renames"
+    bl_label = "Roll back last file rename"
+    bl_description = "Restore the original file names of the last file rename batch in the target directory"
 
-        # Determine objects to export based on scope
-        objs = []
-        if props.export_scope == 'SELECTION':
-            objs = list(context.selected_objects)
-        elif props.export_scope == 'ITEMS':
-            objs = [it.obj for it in scene.sl_renamer_items if it.obj]
-        elif props.export_scope == 'BASES':
-            objs = [b.obj for b in scene.sl_renamer_bases if b.obj]
+    @classmethod
+    def poll(cls, context):
+        props = context.scene.sl_renamer_props
+        return bool(props.target_dir)
 
-        if not objs:
-            self.report({'WARNING'}, 'No objects found for export')
+    @profiler.profiled
+    @log.flush_after
+    def execute(self, context):
+        directory = bpy.path.abspath(context.scene.sl_renamer_props.target_dir)
+        try:
+            restored = fileops.rollback_last(directory)
+        except (fileops.RenameError, OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Rollback failed: {e}")
+            return {'CANCELLED'}
+        if not restored:
+            self.report({'INFO'}, "Nothing to roll back")
             return {'CANCELLED'}
+        self.report({'INFO'}, f"Restored {restored} file name(s)")
+        return {'FINISHED'}
 
-        # prepare modifier filter set
-        mod_flags = set()
-        if props.apply_export_modifiers:
-            # export_modifiers is an EnumFlag; convert to set of keys
-            for flag in ['SUBSURF','MIRROR','ARRAY','BOOLEAN','ARMATURE','BEVEL','SOLIDIFY','DECIMATE','TRIANGULATE','REMESH','SKIN','LATTICE','WELD','SHRINKWRAP']:
-                if flag in props.export_modifiers:
-                    mod_flags.add(flag)
 
-        export_format = props.export_format
-        export_mode = props.export_mode
-        target_dir = props.target_dir or bpy.path.abspath("//")
+EXPORT_MODIFIER_TYPES = (
+    'SUBSURF', 'MIRROR', 'ARRAY', 'BOOLEAN', 'ARMATURE', 'BEVEL', 'SOLIDIFY',
+    'DECIMATE', 'TRIANGULATE', 'REMESH', 'SKIN', 'LATTICE', 'WELD', 'SHRINKWRAP',
+)
 
-        # ensure directory exists
-        if export_mode == 'INDIVIDUAL' and not os.path.isdir(target_dir):
-            try:
-                os.makedirs(target_dir, exist_ok=True)
-            except Exception as e:
-                self.report({'ERROR'}, f'Cannot create target directory: {e}')
-                return {'CANCELLED'}
 
-        # helper to apply modifiers to a temporary copy object
-        def _prepare_object_for_export(obj):
-            # duplicate the object (data copy) to avoid changing original, then apply selected modifiers
-            tmp = obj.copy()
-            if obj.data:
-                tmp.data = obj.data.copy()
-            # link to the scene collection to ensure export operators can see it
-            try:
-                scene.collection.objects.link(tmp)
-            except Exception:
-                try:
-                    context.collection.objects.link(tmp)
-                except Exception:
-                    bpy.context.scene.collection.objects.link(tmp)
+def _export_modifier_flags(props):
+    """Modifier types to apply on export copies (empty when the option is off)."""
+    if not props.apply_export_modifiers:
+        return set()
+    # export_modifiers is an EnumFlag; convert to set of keys
+    return {flag for flag in EXPORT_MODIFIER_TYPES if flag in props.export_modifiers}
 
-            if props.apply_export_modifiers and mod_flags:
-                # apply selected modifiers on the tmp object
-                prev_active = bpy.context.view_layer.objects.active
-                try:
-                    bpy.context.view_layer.objects.active = tmp
-                    for m in list(tmp.modifiers):
-                        mtype = m.type.upper()
-                        if mtype in mod_flags:
-                            try:
-                                bpy.ops.object.modifier_apply(modifier=m.name)
-                            except Exception:
-                                pass
-                finally:
+
+def _link_export_copy(context, tmp):
+    # link to the scene collection to ensure export operators can see it
+    try:
+        context.scene.collection.objects.link(tmp)
+    except Exception:
+        try:
+            context.collection.objects.link(tmp)
+        except Exception:
+            bpy.context.scene.collection.objects.link(tmp)
+
+
+def _build_evaluated_meshes(context, objs, mod_flags):
+    """Return {obj: new mesh} with only the mod_flags modifiers applied.
+
+    Every other modifier is switched off in the viewport, the depsgraph is
+    evaluated once for all objects and each export mesh is created with
+    bpy.data.meshes.new_from_object; no operators and no active-object swaps.
+    """
+    toggled = []
+    for obj in objs:
+        for m in obj.modifiers:
+            if m.show_viewport and m.type not in mod_flags:
+                m.show_viewport = False
+                toggled.append(m)
+    meshes = {}
+    try:
+        depsgraph = context.evaluated_depsgraph_get()
+        for obj in objs:
+            obj_eval = obj.evaluated_get(depsgraph)
+            meshes[obj] = bpy.data.meshes.new_from_object(
+                obj_eval, preserve_all_data_layers=True, depsgraph=depsgraph
+            )
+    finally:
+        for m in toggled:
+            m.show_viewport = True
+    return meshes
+
+
+def _prepare_object_for_export(context, obj, mod_flags, use_depsgraph=True, evaluated_mesh=None):
+    """Temporary copy of obj for export with the selected modifiers applied.
+
+    The depsgraph path (default for meshes) builds the copy's mesh from the
+    evaluated object; pass evaluated_mesh when it was already built in a batch
+    by _build_evaluated_meshes. Otherwise the data is duplicated and
+    bpy.ops.object.modifier_apply is run per modifier.
+    """
+    if obj.type == 'MESH' and mod_flags and (use_depsgraph or evaluated_mesh is not None):
+        if evaluated_mesh is None:
+            evaluated_mesh = _build_evaluated_meshes(context, [obj], mod_flags)[obj]
+        tmp = obj.copy()
+        tmp.data = evaluated_mesh
+        # the applied modifiers are baked into the mesh; keep the others as on the original
+        for m in list(tmp.modifiers):
+            if m.type in mod_flags:
+                tmp.modifiers.remove(m)
+        _link_export_copy(context, tmp)
+        return tmp
+
+    # duplicate the object (data copy) to avoid changing original, then apply selected modifiers
+    tmp = obj.copy()
+    if obj.data:
+        tmp.data = obj.data.copy()
+    _link_export_copy(context, tmp)
+
+    if mod_flags:
+        # apply selected modifiers on the tmp object
+        prev_active = bpy.context.view_layer.objects.active
+        try:
+            bpy.context.view_layer.objects.active = tmp
+            for m in list(tmp.modifiers):
+                mtype = m.type.upper()
+                if mtype in mod_flags:
                     try:
-                        bpy.context.view_layer.objects.active = prev_active
+                        bpy.ops.object.modifier_apply(modifier=m.name)
                     except Exception:
                         pass
-            return tmp
+        finally:
+            try:
+                bpy.context.view_layer.objects.active = prev_active
+            except Exception:
+                pass
+    return tmp
 
-        # perform export
-        exported_files = []
-        if export_mode == 'GROUP':
-            # export all objects into a single file
-            # create a temporary collection and link duplicates into it
-            tmp_collection = bpy.data.collections.new('SL_Renamer_Export_Temp')
-            context.scene.collection.children.link(tmp_collection)
-            tmp_objs = []
+
+def _applied_modifiers(obj, mod_flags):
+    """Modifiers of obj the evaluated export path bakes into the mesh."""
+    if not mod_flags:
+        return []
+    return [m for m in obj.modifiers if m.type in mod_flags and m.show_viewport]
+
+
+def _shared_export_meshes(context, objs, mod_flags):
+    """Dedup pass for GROUP export: {obj: export mesh or None}.
+
+    Objects are grouped by mesh datablock and applied-modifier signature and
+    each group's mesh is evaluated once, from its first object. None means
+    the object has nothing to apply and its copy can use the original mesh.
+    Copies sharing a mesh are written by the glTF exporter as instances of
+    one glTF mesh.
+    """
+    shared = {}
+    groups = {}
+    for obj in objs:
+        if obj.type != 'MESH' or obj.data is None:
+            continue
+        applied = _applied_modifiers(obj, mod_flags)
+        if not applied:
+            shared[obj] = None
+            continue
+        key = (obj.data.session_uid, export_cache.modifier_signature(obj, applied))
+        groups.setdefault(key, []).append(obj)
+
+    evaluated = _build_evaluated_meshes(context, [m[0] for m in groups.values()], mod_flags) if groups else {}
+    for members in groups.values():
+        mesh = evaluated[members[0]]
+        for obj in members:
+            shared[obj] = mesh
+    return shared
+
+
+def _export_instance(context, obj, mesh, mod_flags):
+    """Temporary export copy of obj using an already built (possibly shared) mesh."""
+    tmp = obj.copy()
+    if mesh is not None:
+        tmp.data = mesh
+        for m in list(tmp.modifiers):
+            if m.type in mod_flags:
+                tmp.modifiers.remove(m)
+    _link_export_copy(context, tmp)
+    return tmp
+
+
+def _remove_export_copy(tmp):
+    data = tmp.data
+    try:
+        bpy.data.objects.remove(tmp, do_unlink=True)
+    except Exception:
+        pass
+    # the copied mesh is not used by anything else; free it right away
+    if data is not None and data.users == 0:
+        try:
+            bpy.data.meshes.remove(data)
+        except Exception:
+            pass
+
+
+def _export_selected_to(filepath, export_format):
+    if export_format == 'GLB':
+        bpy.ops.export_scene.gltf(filepath=filepath, export_format='GLB', export_selected=True)
+    else:
+        bpy.ops.wm.collada_export(filepath=filepath, selected=True)
+
+
+def _has_stock_collada():
+    # hasattr(bpy.ops.wm, ...) is always true: bpy.ops hands out a wrapper for any
+    # name, but dir() only lists the operators that are registered
+    return 'collada_export' in dir(bpy.ops.wm)
+
+
+def _write_export(filepath, export_format, objs, native_glb=False, names=None):
+    """Write objs (already selected) to filepath.
+
+    names maps export copies to the names of their source objects, which the
+    add-on's writers use for nodes and meshes instead of the copies' '.001' names.
+
+    DAE goes through the streaming dae_writer; only objects it does not cover
+    (rigged or shape-keyed meshes) fall back to wm.collada_export, where this
+    Blender still has it. With native_glb the fast glb_writer is used when it
+    covers every object; otherwise the stock glTF exporter runs on the selection.
+    """
+    name = os.path.basename(filepath)
+    if export_format == 'DAE':
+        reason = dae_writer.unsupported_reason(objs)
+        if reason is None:
+            dae_writer.write_dae(filepath, objs, names=names)
+            return
+        if not _has_stock_collada():
+            raise RuntimeError(f"cannot write {name}: {reason} and this Blender has no COLLADA exporter")
+        log.debug(f"SL Export: using the stock COLLADA exporter for {name}: {reason}")
+    elif native_glb and export_format == 'GLB':
+        reason = glb_writer.unsupported_reason(objs)
+        if reason is None:
+            glb_writer.write_glb(filepath, objs, names=names)
+            return
+        log.debug(f"SL Export: using the stock glTF exporter for {name}: {reason}")
+    _export_selected_to(filepath, export_format)
+
+
+def individual_export_path(obj, export_format, target_dir):
+    # one file per object, named like the object (chair_LOD1.dae), which is how
+    # the Second Life uploader pairs LOD files; a shared <base>.<fmt> made
+    # every LOD of a base overwrite the same file
+    return os.path.join(target_dir, f"{obj.name}.{export_format.lower()}")
+
+
+def _duplicate_outputs(objs, export_format, target_dir):
+    """(first, second, path) for objects whose INDIVIDUAL outputs are the same file.
+
+    Paths are compared case-folded, as on Windows and macOS file systems.
+    """
+    seen = {}
+    duplicates = []
+    for o in objs:
+        out = individual_export_path(o, export_format, target_dir)
+        first = seen.setdefault(out.casefold(), o)
+        if first is not o:
+            duplicates.append((first, o, out))
+    return duplicates
+
+
+def _export_contents(objs, names=None):
+    """{object name: triangles} of the meshes written for objs, for verify."""
+    names = names or {}
+    return {names.get(o, o.name): geometry.triangle_count(o.data)
+            for o in objs if o.type == 'MESH' and o.data is not None}
+
+
+def export_object_individual(context, obj, export_format, mod_flags, target_dir, dry_run=False,
+                             use_depsgraph=True, native_glb=False, record=None):
+    """Export one object to its own file; returns the output path.
+
+    Used by SL_OT_export_scene in INDIVIDUAL mode and by the parallel export
+    workers, so both produce identical files. When record is a dict, the
+    contents of the written file are stored in it under the output path.
+    """
+    if mod_flags:
+        tmp = _prepare_object_for_export(context, obj, mod_flags, use_depsgraph=use_depsgraph)
+    else:
+        tmp = obj
+
+    out_name = individual_export_path(obj, export_format, target_dir)
+    log.info(f"SL Export: exporting {obj.name} -> {out_name}")
+
+    # select only tmp for export
+    prev_selected = list(bpy.context.selected_objects)
+    try:
+        bpy.ops.object.select_all(action='DESELECT')
+    except Exception:
+        pass
+    try:
+        tmp.select_set(True)
+        bpy.context.view_layer.objects.active = tmp
+    except Exception:
+        pass
+
+    try:
+        if not dry_run:
+            names = {tmp: obj.name}
+            _write_export(out_name, export_format, [tmp], native_glb=native_glb, names=names)
+            if record is not None:
+                record[out_name] = _export_contents([tmp], names)
+    finally:
+        # restore selection
+        try:
+            bpy.ops.object.select_all(action='DESELECT')
+        except Exception:
+            pass
+        for so in prev_selected:
+            try:
+                so.select_set(True)
+            except Exception:
+                pass
+
+        # if we created a temporary copy, remove it
+        if tmp is not obj:
+            _remove_export_copy(tmp)
+    return out_name
+
+
+def _export_objects_for_scope(context):
+    scene = context.scene
+    props = scene.sl_renamer_props
+    if props.export_scope == 'SELECTION':
+        return list(context.selected_objects)
+    if props.export_scope == 'ITEMS':
+        return [it.obj for it in scene.sl_renamer_items if it.obj]
+    if props.export_scope == 'BASES':
+        return [b.obj for b in scene.sl_renamer_bases if b.obj]
+    return []
+
+
+EXPORT_TEMP_COLLECTION = 'SL_Renamer_Export_Temp'
+
+
+class _ExportJob:
+    """One run of the SL export, split into small steps.
+
+    The constructor resolves the objects and drops outputs the manifest says
+    are current. step() then exports a few objects at a time (GROUP mode
+    prepares copies per step and writes the file in the last step), so the
+    same job runs in one go from SL_OT_export_scene or spread over timer
+    ticks by SL_OT_export_scene_modal. cleanup() removes every temporary copy.
+    """
+
+    def __init__(self, context):
+        scene = context.scene
+        props = scene.sl_renamer_props
+        self.problem = None
+        self.dry_run = props.dry_run
+        self.mod_flags = _export_modifier_flags(props)
+        self.use_depsgraph = props.modifier_apply_method == 'EVALUATED'
+        self.export_format = props.export_format
+        self.export_mode = props.export_mode
+        self.target_dir = props.target_dir or bpy.path.abspath("//")
+        self.native_glb = props.export_native_glb
+        self.objs = []
+        self.digests = {}
+        self.cached = 0
+        self.exported_files = []
+        self.expected = {}  # written file -> {object name: triangles}
+        self.manifest = None
+        self.position = 0
+        self._tmp_collection = None
+        self._tmp_objs = []
+        self._evaluated = {}
+
+        # Determine objects to export based on scope
+        objs = [o for o in _export_objects_for_scope(context) if o]
+        if not objs:
+            self.problem = ({'WARNING'}, 'No objects found for export')
+            return
+
+        # ensure directory exists
+        if self.export_mode == 'INDIVIDUAL' and not os.path.isdir(self.target_dir):
+            try:
+                os.makedirs(self.target_dir, exist_ok=True)
+            except Exception as e:
+                self.problem = ({'ERROR'}, f'Cannot create target directory: {e}')
+                return
+
+        # incremental export: outputs whose content digest matches the manifest are skipped
+        self.manifest = export_cache.ExportManifest.load(self.target_dir)
+        isfile = os.path.isfile
+        if os.path.isdir(self.target_dir):
+            isfile = fileops.snapshot(self.target_dir).isfile
+        depsgraph = context.evaluated_depsgraph_get()
+        options = (self.export_format, self.export_mode, sorted(self.mod_flags), props.modifier_apply_method,
+                   self.native_glb, dae_writer.GENERATOR if self.export_format == 'DAE' else None)
+        if self.export_mode == 'INDIVIDUAL':
+            duplicates = _duplicate_outputs(objs, self.export_format, self.target_dir)
+            if duplicates:
+                for first, second, out in duplicates:
+                    log.error(f"SL Export: {first.name} and {second.name} would both be written to {out}")
+                self.problem = ({'ERROR'}, f"{len(duplicates)} object(s) share an output file name; "
+                                           "rename them (check console for details)")
+                return
             for o in objs:
-                if not o:
+                out = individual_export_path(o, self.export_format, self.target_dir)
+                digest = export_cache.object_digest(depsgraph, o, options)
+                if not props.export_force and self.manifest.is_fresh(out, digest, isfile, source=o.name):
+                    log.info(f"SL Export: {o.name} unchanged, keeping {out} (cached)")
+                    self.cached += 1
                     continue
-                tmp = _prepare_object_for_export(o)
-                tmp_collection.objects.link(tmp)
-                tmp_objs.append(tmp)
-
-            out_name = os.path.join(target_dir, f"sl_export.{export_format.lower()}")
-            print(f"SL Export: exporting group to {out_name}")
-            # select only the tmp objects
-            prev_selected = list(bpy.context.selected_objects)
+                self.digests[o.name] = (out, digest)
+                self.objs.append(o)
+        else:
+            out = os.path.join(self.target_dir, f"sl_export.{self.export_format.lower()}")
+            digest = export_cache.combined_digest(
+                export_cache.object_digest(depsgraph, o, options) for o in objs
+            )
+            if not props.export_force and self.manifest.is_fresh(out, digest, isfile):
+                log.info(f"SL Export: group unchanged, keeping {out} (cached)")
+                self.cached = 1
+            else:
+                self.objs = objs
+            self.digests[None] = (out, digest)
+
+    @property
+    def total(self):
+        # GROUP mode has one extra step that writes the file
+        return len(self.objs) + (1 if self.export_mode == 'GROUP' and self.objs else 0)
+
+    @property
+    def done(self):
+        return self.position >= self.total
+
+    def step(self, context, count=1):
+        """Run up to count steps; returns True once the job is complete."""
+        end = min(self.position + max(1, count), self.total)
+        while self.position < end:
+            if self.export_mode == 'GROUP':
+                self._group_step(context, self.position)
+            else:
+                self._individual_step(context, self.objs[self.position])
+            self.position += 1
+        return self.done
+
+    def _individual_step(self, context, o):
+        out_name, digest = self.digests[o.name]
+        self.exported_files.append(
+            export_object_individual(context, o, self.export_format, self.mod_flags, self.target_dir,
+                                     dry_run=self.dry_run, use_depsgraph=self.use_depsgraph,
+                                     native_glb=self.native_glb, record=self.expected)
+        )
+        if not self.dry_run:
+            self.manifest.record(out_name, digest, source=o.name)
+
+    def _group_step(self, context, i):
+        if i == 0:
+            # export all objects into a single file
+            # create a temporary collection and link duplicates into it
+            self._tmp_collection = bpy.data.collections.new(EXPORT_TEMP_COLLECTION)
+            context.scene.collection.children.link(self._tmp_collection)
+            if self.use_depsgraph:
+                self._evaluated = _shared_export_meshes(context, self.objs, self.mod_flags)
+                unique = {m.session_uid if m is not None else ('data', o.data.session_uid)
+                          for o, m in self._evaluated.items()}
+                log.info(f"SL Export: {len(self._evaluated)} mesh object(s) use {len(unique)} unique mesh(es)")
+        if i < len(self.objs):
+            o = self.objs[i]
+            if o in self._evaluated:
+                tmp = _export_instance(context, o, self._evaluated[o], self.mod_flags)
+            else:
+                tmp = _prepare_object_for_export(context, o, self.mod_flags, use_depsgraph=self.use_depsgraph)
+            self._tmp_collection.objects.link(tmp)
+            self._tmp_objs.append(tmp)
+            return
+
+        out_name = self.digests[None][0]
+        log.info(f"SL Export: exporting group to {out_name}")
+        # select only the tmp objects
+        prev_selected = list(bpy.context.selected_objects)
+        try:
+            bpy.ops.object.select_all(action='DESELECT')
+        except Exception:
+            pass
+        for o in self._tmp_objs:
             try:
-                bpy.ops.object.select_all(action='DESELECT')
+                o.select_set(True)
+            except Exception:
+                pass
+        if self._tmp_objs:
+            try:
+                bpy.context.view_layer.objects.active = self._tmp_objs[0]
             except Exception:
                 pass
-            for o in tmp_objs:
-                try:
-                    o.select_set(True)
-                except Exception:
-                    pass
-            if tmp_objs:
-                try:
-                    bpy.context.view_layer.objects.active = tmp_objs[0]
-                except Exception:
-                    pass
-
-            if not props.dry_run:
-                if export_format == 'GLB':
-                    bpy.ops.export_scene.gltf(filepath=out_name, export_format='GLB', export_selected=True)
-                else:
-                    bpy.ops.wm.collada_export(filepath=out_name, selected=True)
-            exported_files.append(out_name)
 
+        try:
+            if not self.dry_run:
+                # copies are made in the order of self.objs
+                names = {tmp: o.name for tmp, o in zip(self._tmp_objs, self.objs)}
+                _write_export(out_name, self.export_format, self._tmp_objs, native_glb=self.native_glb,
+                              names=names)
+                self.expected[out_name] = _export_contents(self._tmp_objs, names)
+                self.manifest.record(out_name, self.digests[None][1])
+            self.exported_files.append(out_name)
+        finally:
             # restore selection
             try:
                 bpy.ops.object.select_all(action='DESELECT')
@@ -506,73 +1300,236 @@ class SL_OT_export_scene(bpy.types.Operator):
                     o.select_set(True)
                 except Exception:
                     pass
-
-            # cleanup: remove temporary objects and collection
-            for o in tmp_objs:
-                try:
-                    bpy.data.objects.remove(o, do_unlink=True)
-                except Exception:
-                    pass
+            self.cleanup(context)
+
+    def cleanup(self, context):
+        """Remove temporary objects, evaluated meshes and the temp collection(s)."""
+        # evaluated meshes are shared by several copies; free what is left unused
+        meshes = {m.session_uid: m for m in self._evaluated.values() if m is not None}
+        for o in self._tmp_objs:
+            _remove_export_copy(o)
+        self._tmp_objs = []
+        for mesh in meshes.values():
             try:
-                scene.collection.children.unlink(tmp_collection)
-                bpy.data.collections.remove(tmp_collection)
+                if mesh.users == 0:
+                    bpy.data.meshes.remove(mesh)
             except Exception:
                 pass
-        else:
-            # individual exports per object
-            for o in objs:
-                if not o:
-                    continue
-                tmp_created = False
-                if props.apply_export_modifiers and mod_flags:
-                    tmp = _prepare_object_for_export(o)
-                    tmp_created = True
-                else:
-                    tmp = o
-
-                base_name = _derive_base_from_name(o.name)
-                filename = f"{base_name}.{export_format.lower()}"
-                out_name = os.path.join(target_dir, filename)
-                print(f"SL Export: exporting {o.name} -> {out_name}")
-
-                # select only tmp for export
-                prev_selected = list(bpy.context.selected_objects)
+        self._evaluated = {}
+        self._tmp_collection = None
+        # also catches 'SL_Renamer_Export_Temp.001' left behind by an interrupted run
+        for coll in list(bpy.data.collections):
+            if coll.name.startswith(EXPORT_TEMP_COLLECTION):
                 try:
-                    bpy.ops.object.select_all(action='DESELECT')
+                    context.scene.collection.children.unlink(coll)
                 except Exception:
                     pass
                 try:
-                    tmp.select_set(True)
-                    bpy.context.view_layer.objects.active = tmp
+                    bpy.data.collections.remove(coll)
                 except Exception:
                     pass
 
-                if not props.dry_run:
-                    if export_format == 'GLB':
-                        bpy.ops.export_scene.gltf(filepath=out_name, export_format='GLB', export_selected=True)
-                    else:
-                        bpy.ops.wm.collada_export(filepath=out_name, selected=True)
-                exported_files.append(out_name)
+    def finish(self):
+        if self.exported_files and not self.dry_run:
+            fileops.invalidate_snapshot(self.target_dir)
+        try:
+            self.manifest.save()
+        except OSError as e:
+            log.error(f"SL Export: could not write export manifest: {e}")
 
-                # restore selection
-                try:
-                    bpy.ops.object.select_all(action='DESELECT')
-                except Exception:
-                    pass
-                for so in prev_selected:
-                    try:
-                        so.select_set(True)
-                    except Exception:
-                        pass
+    def verify(self):
+        """Read back every file written by this job; returns the number of files with problems."""
+        return _verify_written(self.expected)
 
-                # if we created a temporary copy, remove it
-                if tmp_created:
-                    try:
-                        bpy.data.objects.remove(tmp, do_unlink=True)
-                    except Exception:
-                        pass
+    def summary(self):
+        return f"Exported {len(self.exported_files)} file(s), {self.cached} cached (dry_run={self.dry_run})"
+
+
+def _log_verify_reports(reports):
+    bad = 0
+    for report in reports:
+        if report.problems:
+            bad += 1
+            for problem in report.problems:
+                log.warning(f"SL Verify: {os.path.basename(report.path)}: {problem}")
+    log.info(f"SL Verify: checked {len(reports)} file(s), {bad} with problems")
+    return bad
+
+
+def _verify_written(expected):
+    """Check just-written files against {path: {object name: triangles}}; returns the files with problems."""
+    reports = verify.verify_files(((path, names, True) for path, names in expected.items()),
+                                  templates.active().parse)
+    return _log_verify_reports(reports)
+
+
+def _verify_summary(bad):
+    if bad:
+        return f"; verification found problems in {bad} file(s), see the log"
+    return ""
+
+
+class SL_OT_export_scene(bpy.types.Operator):
+    """Export selected/items/bases to GLB or DAE with optional modifier application"""
+    bl_idname = "scene.sl_export_scene"
+    bl_label = "Export SL Group"
+
+    @profiler.profiled
+    @log.flush_after
+    def execute(self, context):
+        props = context.scene.sl_renamer_props
+        job = _ExportJob(context)
+        if job.problem:
+            self.report(*job.problem)
+            return {'CANCELLED'}
 
-        self.report({'INFO'}, f"Exported {len(exported_files)} file(s) (dry_run={props.dry_run})")
+        if not job.objs:
+            self.report({'INFO'}, f"All {job.cached} file(s) up to date (cached); enable Force Re-export to rebuild")
+            return {'FINISHED'}
+
+        if (job.export_mode == 'INDIVIDUAL' and props.export_workers > 1
+                and not job.dry_run and len(job.objs) > 1):
+            if parallel_export.is_running():
+                self.report({'WARNING'}, 'A parallel export is already running')
+                return {'CANCELLED'}
+            try:
+                pjob = parallel_export.start(job.objs, props.export_workers, job.export_format, job.mod_flags,
+                                             bpy.path.abspath(job.target_dir), use_depsgraph=job.use_depsgraph,
+                                             manifest=job.manifest, digests=job.digests,
+                                             native_glb=job.native_glb,
+                                             verify_with=_verify_written if props.export_verify else None)
+            except Exception as e:
+                self.report({'ERROR'}, f'Cannot start parallel export: {e}')
+                return {'CANCELLED'}
+            verify_note = "; files are verified when it finishes" if props.export_verify else ""
+            self.report({'INFO'}, f"Exporting {pjob.total} object(s) with {pjob.workers} background worker(s)"
+                                  + verify_note)
+            return {'FINISHED'}
+
+        # perform export
+        try:
+            with profiler.phase('export', objects=len(job.objs)):
+                job.step(context, job.total)
+        finally:
+            with profiler.phase('cleanup'):
+                job.cleanup(context)
+                job.finish()
+        bad = 0
+        if props.export_verify:
+            with profiler.phase('verify', objects=len(job.expected)):
+                bad = job.verify()
+        self.report({'WARNING'} if bad else {'INFO'}, job.summary() + _verify_summary(bad))
+        return {'FINISHED'}
+
+
+class SL_OT_export_scene_modal(bpy.types.Operator):
+    """Export like Export SL Group, a chunk of objects per timer tick, with progress; Esc cancels"""
+    bl_idname = "scene.sl_export_scene_modal"
+    bl_label = "Export SL Group (Interactive)"
+
+    _job = None
+    _timer = None
+
+    def invoke(self, context, event):
+        if context.window is None:
+            # run from a script or in background mode: no window to run the timer
+            # in, so export in one go like Export SL Group
+            return bpy.ops.scene.sl_export_scene()
+        props = context.scene.sl_renamer_props
+        log.configure_from_props(props)
+        profiler.configure(props.profile_enabled)
+        job = _ExportJob(context)
+        if job.problem or not job.objs:
+            if job.problem:
+                self.report(*job.problem)
+            else:
+                self.report({'INFO'}, f"All {job.cached} file(s) up to date (cached); enable Force Re-export to rebuild")
+            log.flush()
+            return {'CANCELLED'} if job.problem else {'FINISHED'}
+
+        self._job = job
+        wm = context.window_manager
+        wm.progress_begin(0, job.total)
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        self._status(context)
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        return self.invoke(context, None)
+
+    def _status(self, context):
+        job = self._job
+        try:
+            context.workspace.status_text_set(
+                f"SL Export: {job.position}/{job.total} ({job.cached} cached) - Esc to cancel"
+            )
+        except Exception:
+            pass
+
+    def _end(self, context):
+        wm = context.window_manager
+        if self._timer is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        try:
+            context.workspace.status_text_set(None)
+        except Exception:
+            pass
+        with profiler.phase('cleanup', owner=self.bl_idname):
+            self._job.cleanup(context)
+            self._job.finish()
+        log.flush()
+
+    def modal(self, context, event):
+        job = self._job
+        if event.type == 'ESC':
+            log.warning(f"SL Export: cancelled after {job.position}/{job.total} step(s)")
+            self._end(context)
+            self.report({'WARNING'}, f"Export cancelled; {job.summary()}")
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        try:
+            chunk = context.scene.sl_renamer_props.export_chunk_size
+            with profiler.phase('export', objects=min(chunk, job.total - job.position), owner=self.bl_idname):
+                finished = job.step(context, chunk)
+        except Exception as e:
+            log.error(f"SL Export: export failed: {e}")
+            self._end(context)
+            self.report({'ERROR'}, f"Export failed: {e}")
+            return {'CANCELLED'}
+
+        context.window_manager.progress_update(job.position)
+        if finished:
+            self._end(context)
+            bad = 0
+            if context.scene.sl_renamer_props.export_verify:
+                with profiler.phase('verify', objects=len(job.expected), owner=self.bl_idname):
+                    bad = job.verify()
+            log.flush()
+            self.report({'WARNING'} if bad else {'INFO'}, job.summary() + _verify_summary(bad))
+            return {'FINISHED'}
+        self._status(context)
+        return {'PASS_THROUGH'}
+
+
+class SL_OT_cancel_parallel_export(bpy.types.Operator):
+    bl_idname = "scene.sl_cancel_parallel_export"
+    bl_label = "Cancel Parallel Export"
+    bl_description = "Stop the running background export workers"
+
+    @classmethod
+    def poll(cls, context):
+        return parallel_export.is_running()
+
+    @profiler.profiled
+    @log.flush_after
+    def execute(self, context):
+        parallel_export.cancel()
+        self.report({'INFO'}, "Parallel export cancelled")
         return {'FINISHED'}
 
 
@@ -584,31 +1541,38 @@ class SL_OT_add_selected_to_list(bpy.types.Operator):
     bl_label = "Add Selected"
     bl_description = "Add selected objects to the SL Renamer list"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         props = scene.sl_renamer_props
         coll = scene.sl_renamer_items
+        index = list_index.get(scene, 'sl_renamer_items')
         for obj in context.selected_objects:
             # avoid duplicates
-            if any(it.obj == obj for it in coll):
+            if obj in index:
                 continue
             it = coll.add()
             it.obj = obj
-            # heuristic: set lod based on name
+            index.note_added(obj, len(coll) - 1)
+            # names following a template give the LOD directly, else a keyword heuristic
+            parsed = templates.active().parse(obj.name)
             lname = (obj.name or '').upper()
-            if lname.endswith('_PHYS') or 'PHYS' in lname:
+            if parsed is not None:
+                it.lod = parsed[1]
+            elif 'PHYS' in lname:
                 it.lod = 'PHYS'
-            elif lname.endswith('_LOD0') or 'LOD0' in lname:
+            elif 'LOD0' in lname:
                 it.lod = 'LOD0'
-            elif lname.endswith('_LOD1') or 'LOD1' in lname:
+            elif 'LOD1' in lname:
                 it.lod = 'LOD1'
-            elif lname.endswith('_LOD2') or 'LOD2' in lname:
+            elif 'LOD2' in lname:
                 it.lod = 'LOD2'
             else:
                 it.lod = 'LOD0'
             # mark as base if the object's name doesn't already include a LOD/PHYS suffix
             # (comment/heuristic in original code hinted at this but did not set the flag)
-            if not any(s in lname for s in ('_PHYS', 'PHYS', '_LOD0', 'LOD0', '_LOD1', 'LOD1', '_LOD2', 'LOD2')):
+            if parsed is None and not any(s in lname for s in ('PHYS', 'LOD0', 'LOD1', 'LOD2')):
                 it.is_base = True
             else:
                 it.is_base = False
@@ -627,6 +1591,8 @@ class SL_OT_remove_from_list(bpy.types.Operator):
     def poll(cls, context):
         return len(context.scene.sl_renamer_items) > 0
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         idx = scene.sl_renamer_index
@@ -643,14 +1609,18 @@ class SL_OT_add_base(bpy.types.Operator):
     bl_label = "Add Base"
     bl_description = "Add selected object(s) to the Bases list"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         bases = scene.sl_renamer_bases
+        index = list_index.get(scene, 'sl_renamer_bases')
         for obj in context.selected_objects:
-            if any(b.obj == obj for b in bases):
+            if obj in index:
                 continue
             b = bases.add()
             b.obj = obj
+            index.note_added(obj, len(bases) - 1)
         return {'FINISHED'}
 
 
@@ -659,6 +1629,8 @@ class SL_OT_remove_base(bpy.types.Operator):
     bl_label = "Remove Base"
     bl_description = "Remove selected base from the Bases list"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         idx = scene.sl_renamer_base_index
@@ -674,6 +1646,8 @@ class SL_OT_assign_to_base(bpy.types.Operator):
     bl_label = "Assign to Base"
     bl_description = "Assign selected list items to the chosen base"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         base_idx = scene.sl_renamer_base_index
@@ -686,9 +1660,11 @@ class SL_OT_assign_to_base(bpy.types.Operator):
             return {'CANCELLED'}
 
         # assign selected items in the items list (by index selection) or selection in 3D view
-        for it in scene.sl_renamer_items:
-            if it.obj in context.selected_objects:
-                it.base_ref = base_obj
+        items = scene.sl_renamer_items
+        index = list_index.get(scene, 'sl_renamer_items')
+        for obj in context.selected_objects:
+            for pos in index.positions_of(obj):
+                items[pos].base_ref = base_obj
 
         self.report({'INFO'}, f"Assigned selected items to base {base_obj.name}")
         return {'FINISHED'}
@@ -701,6 +1677,8 @@ class SL_OT_assign_selected_to_base_row(bpy.types.Operator):
 
     base_index: IntProperty()
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         bases = getattr(scene, 'sl_renamer_bases', [])
@@ -714,13 +1692,14 @@ class SL_OT_assign_selected_to_base_row(bpy.types.Operator):
             return {'CANCELLED'}
 
         # assign selected objects in the 3D view or the active item in the Items list
-        sel = set(context.selected_objects)
+        items = scene.sl_renamer_items
+        index = list_index.get(scene, 'sl_renamer_items')
+        positions = {pos for obj in context.selected_objects for pos in index.positions_of(obj)}
         active_idx = getattr(scene, 'sl_renamer_index', None)
-        for i, it in enumerate(getattr(scene, 'sl_renamer_items', [])):
-            if not it.obj:
-                continue
-            if it.obj in sel or (active_idx is not None and i == active_idx):
-                it.base_ref = base_obj
+        if active_idx is not None and 0 <= active_idx < len(items) and items[active_idx].obj:
+            positions.add(active_idx)
+        for pos in positions:
+            items[pos].base_ref = base_obj
 
         self.report({'INFO'}, f"Assigned selected items to base {base_obj.name}")
         return {'FINISHED'}
@@ -734,6 +1713,8 @@ class SL_OT_assign_selected_to_base_slot(bpy.types.Operator):
     base_index: IntProperty()
     slot_name: bpy.props.StringProperty()
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         bases = getattr(scene, 'sl_renamer_bases', [])
@@ -779,13 +1760,59 @@ class SL_OT_assign_selected_to_base_slot(bpy.types.Operator):
 
 
 def _derive_base_from_name(name):
-    if not name:
-        return ''
-    lname = name
-    for sfx in ["_LOD0", "_LOD1", "_LOD2", "_PHYS"]:
-        if lname.endswith(sfx):
-            return lname[:-len(sfx)]
-    return lname
+    return templates.active().base_of(name)
+
+
+SLOT_LODS = (
+    ('lod0_obj', 'LOD0'),
+    ('lod1_obj', 'LOD1'),
+    ('lod2_obj', 'LOD2'),
+    ('phys_obj', 'PHYS'),
+)
+
+
+def _lod_target_name(base, lod):
+    return apply_template(base, LOD_TEMPLATE_KEYS.get(lod, 'mesh_lod0'))
+
+
+def _collect_rename_records(scene):
+    """Describe the Items list and base slots as planner.RenameRecords.
+
+    Returns (records, base_names, registered, objects) where objects maps
+    each record oid (the object's session_uid) back to the bpy object.
+    """
+    records = []
+    base_names = {}
+    registered = set()
+    objects = {}
+
+    for b in getattr(scene, 'sl_renamer_bases', []):
+        if not b.obj:
+            continue
+        buid = b.obj.session_uid
+        base_names[buid] = b.obj.name
+        registered.add(buid)
+        objects[buid] = b.obj
+        for attr, lod in SLOT_LODS:
+            tgt = getattr(b, attr, None)
+            if tgt:
+                objects[tgt.session_uid] = tgt
+                records.append(planner.RenameRecord(tgt.session_uid, tgt.name, lod, False, buid, attr[:-4]))
+
+    for it in scene.sl_renamer_items:
+        obj = it.obj
+        if not obj:
+            continue
+        uid = obj.session_uid
+        objects[uid] = obj
+        base_ref = getattr(it, 'base_ref', None)
+        ref_uid = None
+        if base_ref:
+            ref_uid = base_ref.session_uid
+            base_names[ref_uid] = base_ref.name
+        records.append(planner.RenameRecord(uid, obj.name, it.lod, it.is_base, ref_uid, None))
+
+    return records, base_names, registered, objects
 
 
 class SL_OT_apply_list_renames(bpy.types.Operator):
@@ -793,6 +1820,8 @@ class SL_OT_apply_list_renames(bpy.types.Operator):
     bl_label = "Apply List Renames"
     bl_description = "Apply/correct naming for items in the list"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         props = scene.sl_renamer_props
@@ -802,195 +1831,385 @@ class SL_OT_apply_list_renames(bpy.types.Operator):
         # selected items (by 3D selection or by the active Items list index) to that base
         base_idx = getattr(scene, 'sl_renamer_base_index', None)
         if base_idx is not None and 0 <= base_idx < len(getattr(scene, 'sl_renamer_bases', [])):
-            base_entry = scene.sl_renamer_bases[base_idx]
-            base_obj = base_entry.obj
+            base_obj = scene.sl_renamer_bases[base_idx].obj
             if base_obj:
-                # collect selected objects from 3D view and active item
                 sel_objs = set(context.selected_objects)
                 active_item_idx = getattr(scene, 'sl_renamer_index', None)
-
-                # Build explicit group for the selected base: items that either have base_ref==base_obj,
-                # are selected in the viewport, or are the active item; exclude the base object itself.
-                explicit_group = []
+                assigned = 0
                 for idx, it in enumerate(items):
-                    if not it.obj:
-                        continue
-                    if it.obj == base_obj:
+                    if not it.obj or it.obj == base_obj:
                         # don't include the base object itself
                         continue
-                    if getattr(it, 'base_ref', None) == base_obj or it.obj in sel_objs or (active_item_idx is not None and idx == active_item_idx):
-                        # ensure the item records the base_ref for clarity
+                    if it.obj in sel_objs or (active_item_idx is not None and idx == active_item_idx):
                         it.base_ref = base_obj
-                        explicit_group.append(it)
-
-                if explicit_group:
-                    # derive base name from the base object
-                    base_name = _derive_base_from_name(base_obj.name)
-                    print(f"SL Renamer: Applying renames for selected base '{base_obj.name}' -> base_name '{base_name}'")
-                    for it2 in explicit_group:
-                        obj2 = it2.obj
-                        tpl_key = {
-                            'LOD0': 'mesh_lod0',
-                            'LOD1': 'mesh_lod1',
-                            'LOD2': 'mesh_lod2',
-                            'PHYS': 'phys'
-                        }.get(it2.lod, 'mesh_lod0')
-                        target_name = apply_template(base_name, tpl_key)
-                        print(f"SL Renamer: {obj2.name} -> {target_name}")
-                        try:
-                            obj2.name = target_name
-                        except Exception:
-                            pass
-                        if getattr(obj2, 'data', None):
-                            try:
-                                obj2.data.name = target_name
-                            except Exception:
-                                pass
-                    # Optionally rename files on disk for this base
-                    if props.rename_files and props.target_dir and base_name:
-                        rename_files_on_disk(props.target_dir, base_name, dry_run=props.dry_run)
-                    # remove those items from further processing by clearing their base_ref marker from the temporary set
-                    # (they'll be skipped later because they now belong to an explicit group)
-                    # Continue to also process any other non-selected groups below
-        # Build grouping keyed by an explicit base object if provided
-        groups_by_baseobj = {}
-
-        # First, map any item that has an explicit base_ref to that base object
-        for it in items:
-            if not it.obj:
-                continue
-            if getattr(it, 'base_ref', None):
-                base_obj = it.base_ref
-                groups_by_baseobj.setdefault(base_obj, []).append(it)
+                        assigned += 1
+                if assigned:
+                    log.info(f"SL Renamer: Applying renames for selected base '{base_obj.name}'")
+
+        # Plan every object rename once (see planner.plan_renames for precedence), then apply it
+        with profiler.phase('grouping', objects=len(items)):
+            records, base_names, registered, objects = _collect_rename_records(scene)
+            plan = planner.plan_renames(records, base_names, _lod_target_name, registered=registered,
+                                        derive=_derive_base_from_name)
+
+        with profiler.phase('renaming', objects=len(plan)):
+            for r in plan.renames:
+                log.info(f"SL Renamer: {r.old_name} -> {r.new_name}")
+            renamed = _apply_renames([(objects[r.oid], r.new_name) for r in plan.renames])
+            list_index.invalidate()
+
+        # Optionally rename files on disk for every base touched above, from a single directory scan
+        if props.rename_files and props.target_dir and plan.file_targets:
+            with profiler.phase('file ops', objects=len(plan.file_targets)):
+                rename_files_for_bases(props.target_dir, plan.file_targets, dry_run=props.dry_run)
+
+        skipped = len(plan) - renamed
+        if skipped:
+            self.report({'WARNING'}, f"Applied {renamed} list rename(s), {skipped} skipped on name collisions "
+                                     "(check console for details)")
+            return {'FINISHED'}
+        self.report({'INFO'}, f"Applied {len(plan)} list rename(s) (check console for details)")
+        return {'FINISHED'}
 
-        # Next, include items that correspond to registered Bases entries (scene.sl_renamer_bases)
-        bases_lookup = {b.obj: b for b in getattr(scene, 'sl_renamer_bases', []) if b.obj}
-        for it in items:
-            if not it.obj:
-                continue
-            # if already assigned via base_ref, skip
-            if getattr(it, 'base_ref', None):
-                continue
-            # if the item's object matches a base entry, use that base
-            if it.obj in bases_lookup:
-                groups_by_baseobj.setdefault(it.obj, []).append(it)
-
-        # Now collect remaining items not yet grouped and group them by derived key
-        remaining = [it for it in items if it.obj and it not in [x for v in groups_by_baseobj.values() for x in v]]
-        groups_by_key = {}
-        for it in remaining:
-            key = _derive_base_from_name(it.obj.name)
-            groups_by_key.setdefault(key, []).append(it)
-
-        # Merge groups: process explicit base_obj groups first, then key-based groups
-        # Helper to process a list of group_items and perform renaming
-        def _process_group(group_items, explicit_base_obj=None, derived_key=None):
-            # determine base_obj/name for this group: prefer explicit_base_obj, then any is_base, then LOD0, then derived key
-            base_obj = explicit_base_obj
-            base_name = None
 
-            if base_obj is None:
-                for it2 in group_items:
-                    if it2.is_base and it2.obj:
-                        base_obj = it2.obj
-                        break
+# scene session_uid -> ((snapshot, list revision), (moves, conflicts))
+_preview_cache = {}
 
-            if base_obj is None:
-                for it2 in group_items:
-                    if it2.lod == 'LOD0' and it2.obj:
-                        base_obj = it2.obj
-                        break
 
-            if base_obj is not None:
-                base_name = _derive_base_from_name(base_obj.name)
-            else:
-                base_name = derived_key or (group_items[0].obj.name if group_items and group_items[0].obj else '')
+def preview_file_renames(scene):
+    """File renames Apply List Renames would make, for the panel preview.
 
-            # apply names for members; skip renaming the base object itself
-            for it2 in group_items:
-                obj2 = it2.obj
-                if not obj2:
-                    continue
+    Only the cached directory snapshot is used, never the file system, so
+    redraws stay cheap on network shares. Returns None when target_dir has
+    not been scanned in this session, else (moves, conflicts); the result is
+    memoized until the snapshot or the lists change.
+    """
+    props = scene.sl_renamer_props
+    directory = bpy.path.abspath(props.target_dir)
+    snap = fileops.cached_snapshot(directory)
+    if snap is None:
+        return None
+    key = (snap, list_index.revision())
+    cached = _preview_cache.get(scene.session_uid)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    records, base_names, registered, _objects = _collect_rename_records(scene)
+    plan = planner.plan_renames(records, base_names, _lod_target_name, registered=registered,
+                                derive=_derive_base_from_name)
+    moves = []
+    if plan.file_targets:
+        moves, _unmatched = snap.index.plan(plan.file_targets, _file_target_name)
+    pending = [mv for mv in moves if mv.src != mv.dst]
+    txn = fileops.RenameTransaction(directory, pending, exists=snap.exists)
+    result = (txn.moves, txn.conflicts)
+    _preview_cache[scene.session_uid] = (key, result)
+    return result
+
+
+class SL_OT_refresh_file_snapshot(bpy.types.Operator):
+    bl_idname = "scene.sl_refresh_file_snapshot"
+    bl_label = "Rescan Target Directory"
+    bl_description = "List the target directory again (used by the file rename preview and export checks)"
 
-                if base_obj is not None and obj2 == base_obj:
-                    # leave base object name as-is
-                    continue
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.sl_renamer_props.target_dir)
 
-                tpl_key = {
-                    'LOD0': 'mesh_lod0',
-                    'LOD1': 'mesh_lod1',
-                    'LOD2': 'mesh_lod2',
-                    'PHYS': 'phys'
-                }.get(it2.lod, 'mesh_lod0')
+    @profiler.profiled
+    @log.flush_after
+    def execute(self, context):
+        directory = bpy.path.abspath(context.scene.sl_renamer_props.target_dir)
+        fileops.invalidate_snapshot(directory)
+        try:
+            snap = fileops.snapshot(directory)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot list {directory}: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"{len(snap.index)} LOD/PHYS file(s) in {directory}")
+        return {'FINISHED'}
 
-                target_name = apply_template(base_name, tpl_key)
-                try:
-                    obj2.name = target_name
-                except Exception:
-                    pass
-                if getattr(obj2, 'data', None):
-                    try:
-                        obj2.data.name = target_name
-                    except Exception:
-                        pass
 
-            # Optionally rename files on disk for this base
-            if props.rename_files and props.target_dir and base_name:
-                rename_files_on_disk(props.target_dir, base_name, dry_run=props.dry_run)
+class SL_OT_verify_exports(bpy.types.Operator):
+    bl_idname = "scene.sl_verify_exports"
+    bl_label = "Verify Exported Files"
+    bl_description = ("Check every .glb/.dae in the target directory: node names against the LOD templates "
+                      "and triangle counts against the scene objects of the same name")
+
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.sl_renamer_props.target_dir)
+
+    @profiler.profiled
+    @log.flush_after
+    def execute(self, context):
+        props = context.scene.sl_renamer_props
+        directory = bpy.path.abspath(props.target_dir)
+        try:
+            snap = fileops.snapshot(directory)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot list {directory}: {e}")
+            return {'CANCELLED'}
+        paths = sorted(os.path.join(directory, n) for n in snap.files
+                       if os.path.splitext(n)[1].lower() in fileops.SL_MESH_EXTS)
+        if not paths:
+            self.report({'INFO'}, f"No .glb/.dae files in {directory}")
+            return {'FINISHED'}
+
+        # source triangle counts as the export would write them
+        mod_flags = _export_modifier_flags(props)
+        meshes = [o for o in context.scene.objects if o.type == 'MESH' and o.data is not None]
+        with_mods = [o for o in meshes if _applied_modifiers(o, mod_flags)]
+        expected = {}
+        if with_mods:
+            expected = {o.name: n for o, n in _evaluated_triangle_counts(context, with_mods).items()}
+        for o in meshes:
+            if o.name not in expected:
+                expected[o.name] = geometry.triangle_count(o.data)
+
+        reports = verify.verify_files(((p, expected, False) for p in paths), templates.active().parse)
+        bad = _log_verify_reports(reports)
+        if bad:
+            self.report({'WARNING'}, f"{bad} of {len(paths)} file(s) have problems. See the log.")
+        else:
+            self.report({'INFO'}, f"Verified {len(paths)} file(s): no problems found")
+        return {'FINISHED'}
+
+
+class SL_OT_profiler_reset(bpy.types.Operator):
+    bl_idname = "scene.sl_profiler_reset"
+    bl_label = "Reset Profiler"
+    bl_description = "Clear the recorded operator timings"
+
+    def execute(self, context):
+        profiler.reset()
+        return {'FINISHED'}
+
+
+class SL_OT_profiler_export(bpy.types.Operator):
+    bl_idname = "scene.sl_profiler_export"
+    bl_label = "Export Profiler Report"
+    bl_description = "Write the recorded operator timings to a JSON file for comparing runs"
+
+    filepath: StringProperty(subtype='FILE_PATH', default="sl_profile.json")
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+    @log.flush_after
+    def execute(self, context):
+        path = bpy.path.abspath(self.filepath)
+        scene = context.scene
+        extra = {
+            'blend_file': bpy.data.filepath,
+            'blender': getattr(bpy.app, 'version_string', ''),
+            'scene_objects': len(scene.objects),
+            'items': len(scene.sl_renamer_items),
+            'bases': len(scene.sl_renamer_bases),
+        }
+        try:
+            profiler.write_json(path, extra)
+        except OSError as e:
+            self.report({'ERROR'}, f"Cannot write {path}: {e}")
+            return {'CANCELLED'}
+        log.info(f"SL Profiler: report written to {path}")
+        self.report({'INFO'}, f"Profiler report written to {path}")
+        return {'FINISHED'}
+
+
+class SL_OT_estimate_land_impact(bpy.types.Operator):
+    bl_idname = "scene.sl_estimate_land_impact"
+    bl_label = "Estimate Land Impact"
+    bl_description = "Estimate streaming cost, physics cost and land impact for every base and its LOD slots"
+
+    @profiler.profiled
+    @log.flush_after
+    def execute(self, context):
+        scene = context.scene
+        bases = [b for b in scene.sl_renamer_bases if b.obj]
+        if not bases:
+            self.report({'WARNING'}, "No bases to estimate")
+            return {'CANCELLED'}
+
+        tri_cache = {}
+
+        def _tris(obj):
+            if not obj or obj.type != 'MESH' or obj.data is None:
+                return 0
+            n = tri_cache.get(obj.data)
+            if n is None:
+                n = tri_cache[obj.data] = geometry.triangle_count(obj.data)
+            return n
+
+        n = len(bases)
+        # columns: high (LOD0), medium (LOD1), low (LOD2), lowest (none, reuses LOD2)
+        tris = np.zeros((n, 4), dtype=np.int64)
+        phys = np.zeros(n, dtype=np.int64)
+        dims = np.zeros((n, 3), dtype=np.float64)
+        for i, b in enumerate(bases):
+            lod0 = b.lod0_obj or b.obj
+            tris[i, 0] = _tris(lod0)
+            tris[i, 1] = _tris(b.lod1_obj)
+            tris[i, 2] = _tris(b.lod2_obj)
+            phys[i] = _tris(b.phys_obj)
+            dims[i] = tuple(lod0.dimensions)
+        radius = 0.5 * np.linalg.norm(dims, axis=1)
+
+        stream, phys_cost, li = land_impact.estimate(tris, phys, radius)
+
+        report = scene.sl_renamer_li_report
+        report.clear()
+        for i, b in enumerate(bases):
+            row = report.add()
+            row.name = b.obj.name
+            row.obj = b.obj
+            row.tris_lod0, row.tris_lod1, row.tris_lod2 = (int(t) for t in tris[i, :3])
+            row.tris_phys = int(phys[i])
+            row.radius = float(radius[i])
+            row.streaming = float(stream[i])
+            row.physics = float(phys_cost[i])
+            row.land_impact = int(li[i])
+
+        total = int(li.sum())
+        log.info(f"SL Land Impact: {n} base(s), estimated total land impact {total}")
+        self.report({'INFO'}, f"Estimated land impact: {total} for {n} base(s)")
+        return {'FINISHED'}
+
+
+# slot attribute, template key, ratio property; each level is decimated from the one above
+LOD_GEN_LEVELS = (
+    ('lod1_obj', 'mesh_lod1', 'lod1_ratio'),
+    ('lod2_obj', 'mesh_lod2', 'lod2_ratio'),
+    ('phys_obj', 'phys', 'phys_ratio'),
+)
+
+# custom property marking objects created by SL_OT_generate_lods
+LOD_GEN_MARKER = 'sl_renamer_generated'
+
+
+def _evaluated_triangle_counts(context, objs):
+    """{obj: triangles} of the evaluated (modifier-applied) meshes, one depsgraph pass."""
+    depsgraph = context.evaluated_depsgraph_get()
+    counts = {}
+    for obj in objs:
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        try:
+            counts[obj] = geometry.triangle_count(mesh) if mesh is not None else 0
+        finally:
+            obj_eval.to_mesh_clear()
+    return counts
+
+
+def _decimate_copies(context, jobs):
+    """Create decimated copies for a batch of (source, name, ratio) jobs.
+
+    Every source is copied (keeping its own modifiers), a collapse Decimate is
+    appended and the whole batch is evaluated with a single depsgraph pass;
+    the copies then get their evaluated mesh and lose the modifiers. Returns
+    the new objects in job order.
+    """
+    copies = []
+    for src, name, ratio in jobs:
+        tmp = src.copy()
+        tmp.name = name
+        if ratio < 1.0:
+            dec = tmp.modifiers.new(name="SL_LOD_Decimate", type='DECIMATE')
+            dec.decimate_type = 'COLLAPSE'
+            dec.ratio = max(ratio, 0.0001)
+            dec.use_collapse_triangulate = True
+        colls = getattr(src, 'users_collection', None)
+        if colls:
+            colls[0].objects.link(tmp)
+        else:
+            _link_export_copy(context, tmp)
+        copies.append(tmp)
+
+    depsgraph = context.evaluated_depsgraph_get()
+    for tmp, (_src, name, _ratio) in zip(copies, jobs):
+        mesh = bpy.data.meshes.new_from_object(
+            tmp.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+        )
+        mesh.name = name
+        tmp.data = mesh
+        tmp.modifiers.clear()
+        tmp[LOD_GEN_MARKER] = True
+    return copies
+
+
+class SL_OT_generate_lods(bpy.types.Operator):
+    bl_idname = "scene.sl_generate_lods"
+    bl_label = "Generate LODs"
+    bl_description = "Create decimated LOD1, LOD2 and PHYS meshes for every base and fill its slots"
+
+    @profiler.profiled
+    @log.flush_after
+    def execute(self, context):
+        scene = context.scene
+        props = scene.sl_renamer_props
+        bases = [b for b in scene.sl_renamer_bases if b.obj and (b.lod0_obj or b.obj).type == 'MESH']
+        if not bases:
+            self.report({'WARNING'}, "No mesh bases to generate LODs for")
+            return {'CANCELLED'}
+
+        lod0_tris = _evaluated_triangle_counts(context, [b.lod0_obj or b.obj for b in bases])
+        # current source object per base, walking down the LOD chain
+        sources = {i: b.lod0_obj or b.obj for i, b in enumerate(bases)}
+        created = 0
+        for slot, template_key, ratio_prop in LOD_GEN_LEVELS:
+            budget_ratio = getattr(props, ratio_prop)
+            todo = []
+            keep = []
+            for i, b in enumerate(bases):
+                existing = getattr(b, slot)
+                if existing is not None and not props.lod_gen_replace:
+                    keep.append(i)
+                    continue
+                todo.append(i)
 
-        # Process explicit base_obj groups
-        # First, process explicit slot mappings defined per-base (if present)
-        for b in getattr(scene, 'sl_renamer_bases', []):
-            if not b.obj:
+            # user-made slot objects become the source of the next level as they are
+            for i in keep:
+                sources[i] = getattr(bases[i], slot)
+            if not todo:
                 continue
-            base_name = _derive_base_from_name(b.obj.name)
-            slot_map = [
-                ('lod0', getattr(b, 'lod0_obj', None)),
-                ('lod1', getattr(b, 'lod1_obj', None)),
-                ('lod2', getattr(b, 'lod2_obj', None)),
-                ('phys', getattr(b, 'phys_obj', None)),
-            ]
-            any_slot = False
-            for slot_key, tgt_obj in slot_map:
-                if tgt_obj:
-                    any_slot = True
-                    tpl_key = {
-                        'lod0': 'mesh_lod0',
-                        'lod1': 'mesh_lod1',
-                        'lod2': 'mesh_lod2',
-                        'phys': 'phys'
-                    }[slot_key]
-                    target_name = apply_template(base_name, tpl_key)
-                    print(f"SL Renamer (slots): {tgt_obj.name} -> {target_name}")
-                    try:
-                        tgt_obj.name = target_name
-                    except Exception:
-                        pass
-                    if getattr(tgt_obj, 'data', None):
-                        try:
-                            tgt_obj.data.name = target_name
-                        except Exception:
-                            pass
-            if any_slot and props.rename_files and props.target_dir and base_name:
-                rename_files_on_disk(props.target_dir, base_name, dry_run=props.dry_run)
-
-        # Then process explicit base_obj groups collected earlier
-        for base_obj, group_items in list(groups_by_baseobj.items()):
-            _process_group(group_items, explicit_base_obj=base_obj)
-
-        # Process key-based groups
-        for key, group_items in groups_by_key.items():
-            _process_group(group_items, explicit_base_obj=None, derived_key=key)
-
-        self.report({'INFO'}, "Applied list renames (check console for details)")
+
+            src_tris = _evaluated_triangle_counts(context, [sources[i] for i in todo])
+            jobs = []
+            for i in todo:
+                b = bases[i]
+                old = getattr(b, slot)
+                if old is not None and old.get(LOD_GEN_MARKER):
+                    # regenerate in place of our own earlier result
+                    setattr(b, slot, None)
+                    _remove_export_copy(old)
+                base = _derive_base_from_name(b.obj.name)
+                target = max(props.lod_min_tris, int(lod0_tris[b.lod0_obj or b.obj] * budget_ratio))
+                have = src_tris[sources[i]]
+                ratio = target / have if have else 1.0
+                jobs.append((sources[i], apply_template(base, template_key), min(ratio, 1.0)))
+
+            for i, obj, (_src, name, ratio) in zip(todo, _decimate_copies(context, jobs), jobs):
+                setattr(bases[i], slot, obj)
+                sources[i] = obj
+                created += 1
+                if obj.name != name:
+                    log.warning(f"SL LOD Gen: '{name}' already exists, generated object is '{obj.name}'")
+                log.debug(f"SL LOD Gen: {obj.name} decimate ratio {ratio:.3f}, "
+                          f"{geometry.triangle_count(obj.data)} tris")
+
+        log.info(f"SL LOD Gen: created {created} LOD object(s) for {len(bases)} base(s)")
+        self.report({'INFO'}, f"Generated {created} LOD object(s) for {len(bases)} base(s)")
         return {'FINISHED'}
 
 
 class SL_OT_check_material_subset(bpy.types.Operator):
     bl_idname = "scene.sl_check_material_subset"
     bl_label = "Check Materials Subset"
-    bl_description = "Check that materials on LODs are subsets of the reference (LOD0) materials"
+    bl_description = "Check that LODs use a subset of the reference (LOD0) materials, in the same slot order and without empty slots"
 
+    @profiler.profiled
+    @log.flush_after
     def execute(self, context):
         scene = context.scene
         items = scene.sl_renamer_items
@@ -1003,36 +2222,70 @@ class SL_OT_check_material_subset(bpy.types.Operator):
             base = _derive_base_from_name(obj.data.name) if not scene.sl_renamer_props.base_name.strip() else scene.sl_renamer_props.base_name.strip()
             groups.setdefault(base, []).append((it.lod, obj))
 
+        usage_cache = {}
+
+        def _usage(obj):
+            # (slot names, faces per slot), computed once per mesh
+            mesh = obj.data
+            u = usage_cache.get(mesh)
+            if u is None:
+                slots = [m.name if m else None for m in getattr(mesh, 'materials', [])]
+                counts = geometry.material_face_counts(mesh) if hasattr(mesh, 'polygons') else []
+                u = usage_cache[mesh] = (slots, counts)
+            return u
+
         issues = []
         for base, members in groups.items():
             # find reference materials from LOD0 if present
-            ref_mats = None
+            ref_obj = None
             for lod, obj in members:
                 if lod == 'LOD0':
-                    ref_mats = [m.name for m in getattr(obj.data, 'materials', []) if m]
+                    ref_obj = obj
                     break
             # fallback: use the member with most materials
-            if ref_mats is None:
-                best = None
-                best_count = -1
-                for lod, obj in members:
-                    mats = [m.name for m in getattr(obj.data, 'materials', []) if m]
-                    if len(mats) > best_count:
-                        best_count = len(mats)
-                        best = mats
-                ref_mats = best or []
-
-            ref_set = set(ref_mats)
+            if ref_obj is None:
+                ref_obj = max(members, key=lambda m: sum(1 for x in getattr(m[1].data, 'materials', []) if x))[1]
+            ref_slots, ref_counts = _usage(ref_obj)
+            ref_set = {m for m in ref_slots if m}
+            ref_used = {m for m, c in zip(ref_slots, ref_counts) if m and c}
+            ref_pos = {}
+            for i, m in enumerate(ref_slots):
+                if m:
+                    ref_pos.setdefault(m, i)
+
             for lod, obj in members:
-                mats = [m.name for m in getattr(obj.data, 'materials', []) if m]
-                mats_set = set(mats)
+                slots, counts = _usage(obj)
+                mats_set = {m for m in slots if m}
                 if not mats_set.issubset(ref_set):
                     diff = mats_set - ref_set
                     issues.append(f"Object '{obj.name}' (LOD {lod}) has materials not in reference: {sorted(list(diff))}")
 
+                for i, m in enumerate(slots):
+                    used = counts[i] if i < len(counts) else 0
+                    if not used:
+                        issues.append(f"Object '{obj.name}' (LOD {lod}) slot {i} '{m or '(empty)'}' is not used by any face")
+                    elif m is None:
+                        issues.append(f"Object '{obj.name}' (LOD {lod}) slot {i} has no material but {used} face(s) use it")
+                # without slots every face has index 0, which is not a stray index
+                first_stray = max(len(slots), 1)
+                if slots and len(counts) > first_stray:
+                    stray = int(sum(counts[first_stray:]))
+                    issues.append(f"Object '{obj.name}' (LOD {lod}) has {stray} face(s) with a material index past the last slot")
+
+                # physics meshes may use any materials; order and usage only matter for visual LODs
+                if obj is ref_obj or lod == 'PHYS':
+                    continue
+                pos = [ref_pos[m] for m in slots if m in ref_pos]
+                if any(a > b for a, b in zip(pos, pos[1:])):
+                    issues.append(f"Object '{obj.name}' (LOD {lod}) slot order {[m for m in slots if m in ref_pos]} differs from reference {[m for m in ref_slots if m]}")
+                used = {m for m, c in zip(slots, counts) if m and c}
+                lower_only = used & ref_set - ref_used
+                if lower_only:
+                    issues.append(f"Object '{obj.name}' (LOD {lod}) uses materials no face of the reference uses: {sorted(lower_only)}")
+
         if issues:
             for i in issues:
-                _bl_log(f"SL Material Check: {i}")
+                log.warning(f"SL Material Check: {i}")
             self.report({'WARNING'}, f"Found {len(issues)} material issue(s). See Text Editor 'SL_Renamer_Log' or system console.")
             return {'FINISHED'}
 
@@ -1040,6 +2293,16 @@ class SL_OT_check_material_subset(bpy.types.Operator):
         return {'FINISHED'}
 
 
+def _sync_templates_on_load(*_args):
+    """load_post handler: activate the naming templates saved with the file."""
+    scene = getattr(bpy.context, 'scene', None)
+    props = getattr(scene, 'sl_renamer_props', None)
+    if props is not None:
+        _sync_templates(props)
+    else:
+        templates.activate(templates.DEFAULT_PATTERNS)
+
+
 def register():
     bpy.utils.register_class(SLRenamerProperties)
     bpy.types.Scene.sl_renamer_props = bpy.props.PointerProperty(type=SLRenamerProperties)
@@ -1054,6 +2317,11 @@ def register():
     bpy.types.Scene.sl_renamer_bases = CollectionProperty(type=SLRenamerBase)
     bpy.types.Scene.sl_renamer_base_index = IntProperty(default=0)
 
+    # land impact report rows
+    bpy.utils.register_class(SLRenamerLandImpact)
+    bpy.types.Scene.sl_renamer_li_report = CollectionProperty(type=SLRenamerLandImpact)
+    bpy.types.Scene.sl_renamer_li_index = IntProperty(default=0)
+
     # register operators
     bpy.utils.register_class(OBJECT_OT_rename_lods)
     bpy.utils.register_class(OBJECT_OT_validate_for_sl)
@@ -1067,6 +2335,21 @@ def register():
     bpy.utils.register_class(SL_OT_assign_selected_to_base_row)
     bpy.utils.register_class(SL_OT_assign_selected_to_base_slot)
     bpy.utils.register_class(SL_OT_export_scene)
+    bpy.utils.register_class(SL_OT_export_scene_modal)
+    bpy.utils.register_class(SL_OT_rollback_file_renames)
+    bpy.utils.register_class(SL_OT_refresh_file_snapshot)
+    bpy.utils.register_class(SL_OT_verify_exports)
+    bpy.utils.register_class(SL_OT_profiler_reset)
+    bpy.utils.register_class(SL_OT_profiler_export)
+    bpy.utils.register_class(SL_OT_cancel_parallel_export)
+    bpy.utils.register_class(SL_OT_estimate_land_impact)
+    bpy.utils.register_class(SL_OT_generate_lods)
+
+    list_index.register()
+    bpy.app.handlers.persistent(_sync_templates_on_load)
+    if _sync_templates_on_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_sync_templates_on_load)
+    _sync_templates_on_load()
 
 
 def unregister():
@@ -1092,6 +2375,52 @@ def unregister():
         bpy.utils.unregister_class(SL_OT_export_scene)
     except Exception:
         pass
+    try:
+        bpy.utils.unregister_class(SL_OT_export_scene_modal)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_rollback_file_renames)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_refresh_file_snapshot)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_verify_exports)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_profiler_reset)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_profiler_export)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_cancel_parallel_export)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_estimate_land_impact)
+    except Exception:
+        pass
+    try:
+        bpy.utils.unregister_class(SL_OT_generate_lods)
+    except Exception:
+        pass
+    try:
+        list_index.unregister()
+    except Exception:
+        pass
+    try:
+        while _sync_templates_on_load in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(_sync_templates_on_load)
+    except Exception:
+        pass
+    parallel_export.cancel()
 
     # remove scene properties
     try:
@@ -1114,8 +2443,14 @@ def unregister():
         del bpy.types.Scene.sl_renamer_props
     except Exception:
         pass
+    try:
+        del bpy.types.Scene.sl_renamer_li_report
+        del bpy.types.Scene.sl_renamer_li_index
+    except Exception:
+        pass
 
     # unregister classes
     bpy.utils.unregister_class(SLRenamerItem)
     bpy.utils.unregister_class(SLRenamerProperties)
     bpy.utils.unregister_class(SLRenamerBase)
+    bpy.utils.unregister_class(SLRenamerLandImpact)
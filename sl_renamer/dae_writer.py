@@ -0,0 +1,195 @@
+"""Streaming COLLADA (.dae) writer for static LOD meshes.
+
+The document is written element by element: mesh data is read with
+foreach_get into NumPy arrays and the large arrays are formatted in blocks
+straight to the file, so no XML tree or full text copy of a mesh is held in
+memory. Node and geometry names are the object names (chair_LOD1, ...; export
+copies are written under their source object's name),
+which is what the Second Life uploader matches LOD files by; faces are
+split per material slot with the material names as symbols.
+
+Output goes to a temporary file in the target directory and is moved into
+place with os.replace, so a failed export never leaves a half-written .dae.
+Skinning and shape keys are not written: unsupported_reason() reports them
+so the caller can fall back to another exporter. Modifiers still on the
+object are ignored; the export operator applies them to a copy first.
+"""
+
+import os
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+from . import geometry
+
+GENERATOR = 'SL Renamer streaming COLLADA writer'
+
+# values formatted per block; bounds the text buffer for huge meshes
+_BLOCK = 1 << 16
+
+_ID_RE = re.compile(r'[^A-Za-z0-9_.-]')
+
+
+def unsupported_reason(objs):
+    """None if write_dae() covers every object, else a short reason."""
+    return geometry.static_mesh_reason(objs)
+
+
+def _id(name, used):
+    """Unique XML id derived from a Blender name."""
+    base = _ID_RE.sub('_', name) or 'id'
+    if base[0].isdigit() or base[0] in '.-':
+        base = '_' + base
+    ident = base
+    n = 1
+    while ident in used:
+        ident = f"{base}_{n}"
+        n += 1
+    used.add(ident)
+    return ident
+
+
+def _write_values(fh, values, fmt):
+    """Write a flat array as space separated text, one block at a time."""
+    flat = values.ravel()
+    for start in range(0, len(flat), _BLOCK):
+        block = flat[start:start + _BLOCK]
+        if start:
+            fh.write(' ')
+        fh.write(' '.join(fmt % v for v in block.tolist()))
+
+
+def _write_source(fh, ident, values, stride, params):
+    count = len(values) // stride
+    fh.write(f'<source id="{ident}"><float_array id="{ident}-array" count="{len(values)}">')
+    _write_values(fh, values, '%.7g')
+    fh.write(f'</float_array><technique_common><accessor source="#{ident}-array" count="{count}" stride="{stride}">')
+    fh.write(''.join(f'<param name="{p}" type="float"/>' for p in params))
+    fh.write('</accessor></technique_common></source>\n')
+
+
+def _write_geometry(fh, gid, name, mesh, material_ids):
+    mesh.calc_loop_triangles()
+    n_tris = len(mesh.loop_triangles)
+    n_loops = len(mesh.loops)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    vidx = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', vidx)
+    tri_loops = np.empty(n_tris * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('loops', tri_loops)
+    tri_mat = np.empty(n_tris, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('material_index', tri_mat)
+
+    fh.write(f'<geometry id="{gid}" name={quoteattr(name)}><mesh>\n')
+    _write_source(fh, f"{gid}-positions", co, 3, 'XYZ')
+    del co
+    _write_source(fh, f"{gid}-normals", geometry.corner_normals(mesh).ravel(), 3, 'XYZ')
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        uv = np.empty(n_loops * 2, dtype=np.float32)
+        uv_layer.data.foreach_get('uv', uv)
+        _write_source(fh, f"{gid}-map-0", uv, 2, 'ST')
+        del uv
+    fh.write(f'<vertices id="{gid}-vertices"><input semantic="POSITION" source="#{gid}-positions"/></vertices>\n')
+
+    order = np.argsort(tri_mat, kind='stable')
+    slots, starts, counts = np.unique(tri_mat[order], return_index=True, return_counts=True)
+    corners = tri_loops.reshape(-1, 3)[order].ravel()
+    inputs = 3 if uv_layer is not None else 2
+    for slot, first, count in zip(slots.tolist(), starts.tolist(), counts.tolist()):
+        symbol = material_ids[slot] if slot < len(material_ids) and material_ids[slot] else None
+        mat_attr = f' material="{symbol}"' if symbol else ''
+        fh.write(f'<triangles{mat_attr} count="{count}">'
+                 f'<input semantic="VERTEX" source="#{gid}-vertices" offset="0"/>'
+                 f'<input semantic="NORMAL" source="#{gid}-normals" offset="1"/>')
+        if uv_layer is not None:
+            fh.write(f'<input semantic="TEXCOORD" source="#{gid}-map-0" offset="2" set="0"/>')
+        fh.write('<p>')
+        for start in range(first * 3, (first + count) * 3, _BLOCK):
+            loops = corners[start:min(start + _BLOCK, (first + count) * 3)]
+            p = np.empty((len(loops), inputs), dtype=np.int64)
+            p[:, 0] = vidx[loops]
+            p[:, 1] = loops
+            if inputs == 3:
+                p[:, 2] = loops
+            if start > first * 3:
+                fh.write(' ')
+            _write_values(fh, p, '%d')
+        fh.write('</p></triangles>\n')
+    fh.write('</mesh></geometry>\n')
+
+
+def write_dae(filepath, objs, names=None):
+    """Write objs to filepath as COLLADA 1.4.1 (temp file, then atomic replace).
+
+    names maps an object to the name it is written under; export copies
+    ('chair_LOD1.001') pass the name of the object they were made from.
+    """
+    names = names or {}
+    used = set()
+    materials = {}  # material name -> (id, diffuse color)
+    for obj in objs:
+        for mat in obj.data.materials:
+            if mat is not None and mat.name not in materials:
+                materials[mat.name] = (_id(mat.name + '-material', used), tuple(mat.diffuse_color))
+    geometries = {}  # mesh session_uid -> (geometry id, first object using it, its name)
+    nodes = []
+    for obj in objs:
+        name = names.get(obj, obj.name)
+        key = obj.data.session_uid
+        if key not in geometries:
+            geometries[key] = (_id(name + '-mesh', used), obj, name)
+        nodes.append((_id(name, used), obj, geometries[key][0], name))
+
+    tmp = filepath + '.tmp'
+    try:
+        _write_document(tmp, materials, geometries, nodes)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp, filepath)
+    return filepath
+
+
+def _write_document(path, materials, geometries, nodes):
+    with open(path, 'w', encoding='utf-8', newline='\n') as fh:
+        fh.write('<?xml version="1.0" encoding="utf-8"?>\n'
+                 '<COLLADA xmlns="http://www.collada.org/2005/11/COLLADASchema" version="1.4.1">\n'
+                 f'<asset><contributor><authoring_tool>{escape(GENERATOR)}</authoring_tool></contributor>'
+                 '<unit name="meter" meter="1"/><up_axis>Z_UP</up_axis></asset>\n')
+
+        fh.write('<library_effects>\n')
+        for name, (mid, color) in materials.items():
+            rgba = ' '.join('%.6g' % c for c in color)
+            fh.write(f'<effect id="{mid}-effect"><profile_COMMON><technique sid="common"><lambert>'
+                     f'<diffuse><color sid="diffuse">{rgba}</color></diffuse>'
+                     '</lambert></technique></profile_COMMON></effect>\n')
+        fh.write('</library_effects>\n<library_materials>\n')
+        for name, (mid, _color) in materials.items():
+            fh.write(f'<material id="{mid}" name={quoteattr(name)}><instance_effect url="#{mid}-effect"/></material>\n')
+        fh.write('</library_materials>\n<library_geometries>\n')
+        for gid, obj, name in geometries.values():
+            material_ids = [materials[m.name][0] if m is not None else None for m in obj.data.materials]
+            _write_geometry(fh, gid, name, obj.data, material_ids)
+        fh.write('</library_geometries>\n<library_visual_scenes><visual_scene id="Scene" name="Scene">\n')
+        for nid, obj, gid, name in nodes:
+            m = np.array(obj.matrix_world, dtype=np.float64)
+            # COLLADA matrices are row-major
+            fh.write(f'<node id="{nid}" name={quoteattr(name)} type="NODE">'
+                     f'<matrix sid="transform">{" ".join("%.9g" % v for v in m.ravel().tolist())}</matrix>'
+                     f'<instance_geometry url="#{gid}" name={quoteattr(name)}>')
+            bound = [materials[mat.name][0] for mat in obj.data.materials if mat is not None]
+            if bound:
+                fh.write('<bind_material><technique_common>')
+                for mid in dict.fromkeys(bound):
+                    fh.write(f'<instance_material symbol="{mid}" target="#{mid}"/>')
+                fh.write('</technique_common></bind_material>')
+            fh.write('</instance_geometry></node>\n')
+        fh.write('</visual_scene></library_visual_scenes>\n'
+                 '<scene><instance_visual_scene url="#Scene"/></scene>\n</COLLADA>\n')
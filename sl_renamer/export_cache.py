@@ -0,0 +1,199 @@
+"""Incremental export: skip outputs whose inputs did not change.
+
+A manifest in the export directory records, per output file, a digest of
+everything that goes into it: the evaluated geometry, object transform,
+materials, modifier settings and the export options. Individual exports
+also record the object that wrote the file; an entry only counts as fresh
+for that object, and the export rejects two objects sharing one file, so
+an entry always describes the file on disk. SL_OT_export_scene
+compares the digest of the current scene against the manifest and only
+re-exports files whose digest changed (or that are missing on disk).
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+MANIFEST_NAME = '.sl_export_manifest.json'
+
+# bump when the digest layout changes so old manifests are ignored
+DIGEST_VERSION = 2
+
+
+class ExportManifest:
+    def __init__(self, directory, entries=None):
+        self.directory = directory
+        self.entries = entries or {}
+        self.dirty = False
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    @classmethod
+    def load(cls, directory):
+        path = os.path.join(directory, MANIFEST_NAME)
+        try:
+            with open(path, 'r', encoding='utf-8') as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return cls(directory)
+        if data.get('version') != DIGEST_VERSION:
+            return cls(directory)
+        return cls(directory, data.get('files', {}))
+
+    def is_fresh(self, out_path, digest, isfile=os.path.isfile, source=None):
+        """True if out_path exists and was last written from digest (by source, if given)."""
+        entry = self.entries.get(os.path.basename(out_path))
+        return (entry is not None and entry.get('digest') == digest and entry.get('source') == source
+                and isfile(out_path))
+
+    def record(self, out_path, digest, source=None):
+        """Remember that out_path was written from digest; source names the object for single-object files."""
+        self.entries[os.path.basename(out_path)] = {'digest': digest, 'source': source, 'time': time.time()}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty or not os.path.isdir(self.directory):
+            return
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fh:
+            json.dump({'version': DIGEST_VERSION, 'files': self.entries}, fh, indent=1, sort_keys=True)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+def _update_array(h, seq, attr, count, dtype):
+    if count == 0:
+        return
+    buf = np.empty(count, dtype=dtype)
+    seq.foreach_get(attr, buf)
+    h.update(memoryview(buf))
+
+
+def _update_value(h, value):
+    """Feed a plain RNA value (number, string, vector, ID) into the hash."""
+    if hasattr(value, 'name') and hasattr(value, 'bl_rna'):
+        h.update(f"<{type(value).__name__}:{value.name}>".encode())
+        return
+    try:
+        value = tuple(value) if not isinstance(value, str) else value
+    except TypeError:
+        pass
+    h.update(repr(value).encode())
+
+
+def _update_rna_props(h, struct):
+    for prop in struct.bl_rna.properties:
+        pid = prop.identifier
+        if pid == 'rna_type' or prop.type == 'COLLECTION':
+            continue
+        try:
+            value = getattr(struct, pid)
+        except Exception:
+            continue
+        h.update(pid.encode())
+        _update_value(h, value)
+
+
+def _update_mesh(h, mesh):
+    nv, nl, npoly = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+    h.update(f"mesh {nv} {nl} {npoly}".encode())
+    _update_array(h, mesh.vertices, 'co', nv * 3, np.float32)
+    _update_array(h, mesh.loops, 'vertex_index', nl, np.int32)
+    _update_array(h, mesh.polygons, 'loop_start', npoly, np.int32)
+    _update_array(h, mesh.polygons, 'material_index', npoly, np.int32)
+    _update_array(h, mesh.polygons, 'use_smooth', npoly, np.bool_)
+    for uv in mesh.uv_layers:
+        h.update(uv.name.encode())
+        _update_array(h, uv.data, 'uv', nl * 2, np.float32)
+
+
+def _update_material(h, mat):
+    if mat is None:
+        h.update(b'<no material>')
+        return
+    h.update(mat.name.encode())
+    _update_value(h, tuple(mat.diffuse_color))
+    _update_value(h, (mat.metallic, mat.roughness, mat.use_nodes))
+    if mat.use_nodes and mat.node_tree:
+        for node in mat.node_tree.nodes:
+            h.update(f"{node.bl_idname}:{node.name}".encode())
+            for sock in node.inputs:
+                if hasattr(sock, 'default_value') and not sock.is_linked:
+                    _update_value(h, sock.default_value)
+            image = getattr(node, 'image', None)
+            if image is not None:
+                h.update(f"{image.name}:{image.filepath}".encode())
+        for link in mat.node_tree.links:
+            h.update(f"{link.from_node.name}.{link.from_socket.identifier}>"
+                     f"{link.to_node.name}.{link.to_socket.identifier}".encode())
+
+
+def modifier_signature(obj, modifiers):
+    """Digest of the settings of the given modifiers of obj.
+
+    Two objects sharing a mesh and with equal signatures evaluate to the same
+    geometry. A modifier that points at another object (boolean cutter,
+    armature, mirror object...) makes the result depend on transforms, so
+    the object itself becomes part of the signature.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for m in modifiers:
+        h.update(f"mod {m.type}".encode())
+        for prop in m.bl_rna.properties:
+            pid = prop.identifier
+            if pid in ('rna_type', 'name') or prop.type == 'COLLECTION':
+                continue
+            try:
+                value = getattr(m, pid)
+            except Exception:
+                continue
+            if prop.type == 'POINTER' and value is not None and getattr(value, 'id_type', None) == 'OBJECT':
+                h.update(f"obj {obj.session_uid}".encode())
+            h.update(pid.encode())
+            _update_value(h, value)
+    return h.hexdigest()
+
+
+def object_digest(depsgraph, obj, options):
+    """Digest of one object's exported content.
+
+    options is a tuple/dict of export settings (format, modifiers, ...) that
+    also change the output file.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"v{DIGEST_VERSION} {obj.name} {obj.type}".encode())
+    _update_value(h, options)
+    h.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+
+    for m in obj.modifiers:
+        h.update(f"mod {m.type} {m.name}".encode())
+        _update_rna_props(h, m)
+
+    data = getattr(obj, 'data', None)
+    if data is not None:
+        for mat in getattr(data, 'materials', []):
+            _update_material(h, mat)
+
+    obj_eval = obj.evaluated_get(depsgraph)
+    try:
+        mesh = obj_eval.to_mesh()
+    except RuntimeError:
+        mesh = None
+    if mesh is not None:
+        try:
+            _update_mesh(h, mesh)
+        finally:
+            obj_eval.to_mesh_clear()
+    return h.hexdigest()
+
+
+def combined_digest(digests):
+    h = hashlib.blake2b(digest_size=20)
+    for d in digests:
+        h.update(d.encode())
+    return h.hexdigest()
@@ -0,0 +1,422 @@
+"""File-system helpers for renaming exported LOD files on disk.
+
+Nothing here imports bpy: callers pass in the naming function so the same
+code runs inside Blender, in the batch workers and in benchmarks.
+"""
+
+import json
+import os
+import time
+from collections import namedtuple
+
+# Second Life accepted upload types are COLLADA (.dae) and glTF Binary (.glb)
+SL_MESH_EXTS = ('.dae', '.glb')
+
+# keyword order matters: the first keyword found in a file name wins. Files
+# are found by these fixed keywords, not by the naming templates: they come
+# from other tools as often as from this add-on (chair_high_lod1_v2.dae), and
+# only their new names are built from the templates.
+FILE_KEYWORDS = ('lod0', 'lod1', 'lod2', 'phys')
+
+_SEPARATORS = '_-. '
+
+FileEntry = namedtuple('FileEntry', 'name stem ext keyword base_key')
+PlannedMove = namedtuple('PlannedMove', 'src dst base keyword')
+
+
+def _candidate_base(stem, pos, keyword):
+    """Strip the keyword token (and the separator next to it) from a file stem."""
+    prefix = stem[:pos].rstrip(_SEPARATORS)
+    suffix = stem[pos + len(keyword):].lstrip(_SEPARATORS)
+    if prefix and suffix:
+        return f"{prefix}_{suffix}"
+    return prefix or suffix
+
+
+class DirectoryIndex:
+    """One scan of a directory, bucketed for rename lookups.
+
+    Every regular file with an SL mesh extension and a lod/phys keyword in its
+    name is recorded once and bucketed by keyword and by candidate base (the
+    lower-cased stem with the keyword token removed, e.g. 'chair_LOD1.dae' ->
+    'chair'). plan() then resolves any number of bases against the index in a
+    single pass instead of listing and scanning the directory per base.
+    """
+
+    def __init__(self, directory, entries=()):
+        self.directory = directory
+        self.entries = []
+        self.by_keyword = {kw: [] for kw in FILE_KEYWORDS}
+        self.by_base = {}
+        for e in entries:
+            self._add(e)
+
+    def _add(self, entry):
+        self.entries.append(entry)
+        self.by_keyword[entry.keyword].append(entry)
+        self.by_base.setdefault(entry.base_key, {}).setdefault(entry.keyword, []).append(entry)
+
+    @staticmethod
+    def entry_for(fname, exts=SL_MESH_EXTS):
+        """Return a FileEntry for fname, or None if it is not a renamable mesh file."""
+        stem, ext = os.path.splitext(fname)
+        if ext.lower() not in exts:
+            return None
+        lower = stem.lower()
+        for kw in FILE_KEYWORDS:
+            pos = lower.find(kw)
+            if pos >= 0:
+                return FileEntry(fname, stem, ext, kw, _candidate_base(lower, pos, kw))
+        return None
+
+    @classmethod
+    def build(cls, directory, exts=SL_MESH_EXTS):
+        index = cls(directory)
+        with os.scandir(directory) as it:
+            for de in it:
+                try:
+                    if not de.is_file():
+                        continue
+                except OSError:
+                    continue
+                entry = cls.entry_for(de.name, exts)
+                if entry is not None:
+                    index._add(entry)
+        return index
+
+    def __len__(self):
+        return len(self.entries)
+
+    def plan(self, targets, name_for):
+        """Resolve renames for many bases at once.
+
+        targets maps each base name to an iterable of alias names (e.g. the
+        objects' names before renaming) whose files belong to that base.
+        name_for(base, keyword) returns the target file stem.
+
+        Returns (moves, unmatched): moves is a list of PlannedMove (src == dst
+        when a file is already named correctly); unmatched lists entries whose
+        candidate base did not match any target. With a single target every
+        keyword file is assigned to it, as rename_files_on_disk always did.
+        """
+        targets = dict(targets)
+        moves = []
+        claimed = set()
+
+        def _emit(entry, base):
+            if entry.name in claimed:
+                return
+            claimed.add(entry.name)
+            dst = name_for(base, entry.keyword) + entry.ext
+            moves.append(PlannedMove(
+                os.path.join(self.directory, entry.name),
+                os.path.join(self.directory, dst),
+                base,
+                entry.keyword,
+            ))
+
+        for base, aliases in targets.items():
+            keys = {base.lower()}
+            keys.update(a.lower() for a in aliases if a)
+            for key in sorted(keys):
+                for bucket in self.by_base.get(key, {}).values():
+                    for entry in bucket:
+                        _emit(entry, base)
+
+        if len(targets) == 1:
+            (only_base,) = targets
+            for kw in FILE_KEYWORDS:
+                for entry in self.by_keyword[kw]:
+                    _emit(entry, only_base)
+
+        unmatched = [e for e in self.entries if e.name not in claimed]
+        return moves, unmatched
+
+
+# --- cached directory snapshots ---
+
+
+class DirectorySnapshot:
+    """One listing of a directory: entry names plus its DirectoryIndex.
+
+    exists()/isfile() answer from the listing, so planning renames or
+    checking export outputs does not stat every path again (slow on network
+    shares). Names are matched exactly; a case-insensitive match falls back
+    to a real stat, since only the file system knows whether it folds case.
+    """
+
+    def __init__(self, directory, mtime_ns, exts=SL_MESH_EXTS):
+        self.directory = directory
+        self.mtime_ns = mtime_ns
+        self.exts = exts
+        self.names = set()
+        self.files = set()
+        self.index = DirectoryIndex(directory)
+        with os.scandir(directory) as it:
+            for de in it:
+                self.names.add(de.name)
+                try:
+                    if not de.is_file():
+                        continue
+                except OSError:
+                    continue
+                self.files.add(de.name)
+                entry = DirectoryIndex.entry_for(de.name, exts)
+                if entry is not None:
+                    self.index._add(entry)
+        self._lower = {n.lower() for n in self.names}
+
+    def _lookup(self, path, names, fallback):
+        d, name = os.path.split(path)
+        if _key(d) != _key(self.directory):
+            return fallback(path)
+        if name in names:
+            return True
+        if name.lower() in self._lower:
+            return fallback(path)
+        return False
+
+    def exists(self, path):
+        return self._lookup(path, self.names, os.path.exists)
+
+    def isfile(self, path):
+        return self._lookup(path, self.files, os.path.isfile)
+
+
+_snapshots = {}
+
+
+def snapshot(directory, exts=SL_MESH_EXTS):
+    """Listing of directory, reused while the directory's mtime is unchanged.
+
+    Costs one stat of the directory when the cached listing is still current.
+    File systems with coarse timestamps may miss a change made within the
+    same tick; the add-on invalidates after its own renames and exports.
+    """
+    key = _key(directory)
+    mtime_ns = os.stat(directory).st_mtime_ns
+    snap = _snapshots.get(key)
+    if snap is None or snap.mtime_ns != mtime_ns or snap.exts != exts:
+        snap = _snapshots[key] = DirectorySnapshot(directory, mtime_ns, exts)
+    return snap
+
+
+def cached_snapshot(directory):
+    """The last snapshot of directory without touching the file system, or None."""
+    return _snapshots.get(_key(directory))
+
+
+def invalidate_snapshot(directory=None):
+    """Forget the snapshot of directory (of every directory when None)."""
+    if directory is None:
+        _snapshots.clear()
+    else:
+        _snapshots.pop(_key(directory), None)
+
+
+# --- transactional renames ---
+
+JOURNAL_NAME = '.sl_renamer_journal.json'
+
+RenameConflict = namedtuple('RenameConflict', 'src dst reason')
+
+
+class RenameError(Exception):
+    """A batch of renames could not be applied (it was rolled back)."""
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _temp_name(path, token):
+    d, name = os.path.split(path)
+    return os.path.join(d, f".{name}.slr-{token}")
+
+
+def plan_moves(moves, exists=os.path.exists):
+    """Validate a set of (src, dst) moves before touching the disk.
+
+    Returns (accepted, conflicts). A move conflicts when several sources map to
+    the same target, or when its target already exists and is not itself being
+    moved away by another accepted move. Rejecting a move keeps its source in
+    place, which can in turn block a move targeting that source; this is
+    propagated with a worklist so the whole check stays O(n).
+    Chains and cycles (a target that is another move's source) are accepted:
+    execute_moves() stages those sources through temporary names.
+    """
+    by_src = {}
+    conflicts = []
+    dst_count = {}
+    for mv in moves:
+        src, dst = mv[0], mv[1]
+        if _key(src) == _key(dst) and src == dst:
+            continue
+        by_src[_key(src)] = mv
+        dst_count[_key(dst)] = dst_count.get(_key(dst), 0) + 1
+
+    active = {}
+    for k, mv in by_src.items():
+        if dst_count[_key(mv[1])] > 1:
+            conflicts.append(RenameConflict(mv[0], mv[1], 'several files map to this target'))
+        else:
+            active[k] = mv
+
+    by_dst = {_key(mv[1]): k for k, mv in active.items()}
+    work = list(active)
+    while work:
+        k = work.pop()
+        mv = active.get(k)
+        if mv is None:
+            continue
+        dk = _key(mv[1])
+        # a case-only rename on a case-insensitive file system targets the source itself
+        if dk in active or dk == k or not exists(mv[1]):
+            continue
+        conflicts.append(RenameConflict(mv[0], mv[1], 'target already exists'))
+        del active[k]
+        blocked = by_dst.get(k)
+        if blocked is not None:
+            work.append(blocked)
+
+    accepted = [mv for k, mv in by_src.items() if k in active]
+    return accepted, conflicts
+
+
+def execute_moves(moves, token, on_staged=None):
+    """Apply already validated moves in two phases and return the done list.
+
+    Phase 1 moves every source that is also some move's target to a temporary
+    name, phase 2 moves everything to its final name; after phase 1 all
+    targets are free, so the order within phase 2 does not matter.
+    If any rename fails, the moves done so far are undone and RenameError is
+    raised.
+    """
+    dst_keys = {_key(mv[1]) for mv in moves}
+    staged = []   # (src, tmp)
+    done = []     # (from, to) in application order, for undo
+    try:
+        for mv in moves:
+            if _key(mv[0]) in dst_keys:
+                tmp = _temp_name(mv[0], token)
+                os.replace(mv[0], tmp)
+                done.append((mv[0], tmp))
+                staged.append(mv)
+        if on_staged is not None:
+            on_staged()
+        staged_srcs = {_key(mv[0]) for mv in staged}
+        for mv in moves:
+            cur = _temp_name(mv[0], token) if _key(mv[0]) in staged_srcs else mv[0]
+            os.replace(cur, mv[1])
+            done.append((cur, mv[1]))
+    except OSError as e:
+        failed = []
+        for frm, to in reversed(done):
+            try:
+                os.replace(to, frm)
+            except OSError:
+                failed.append(to)
+        msg = f"rename failed ({e}); {len(done) - len(failed)} completed move(s) undone"
+        if failed:
+            msg += f", could not undo: {failed}"
+        raise RenameError(msg) from e
+    return done
+
+
+class RenameTransaction:
+    """Plan, journal and apply a batch of renames inside one directory.
+
+    The journal (JOURNAL_NAME in the directory) is written before anything is
+    moved and updated after each phase, so rollback_last() can restore the
+    original names later even if Blender crashed half way through.
+    """
+
+    def __init__(self, directory, moves, exists=os.path.exists):
+        self.directory = directory
+        self.token = f"{os.getpid():x}{int(time.time() * 1000):x}"
+        self.moves, self.conflicts = plan_moves([(m[0], m[1]) for m in moves], exists=exists)
+
+    @property
+    def journal_path(self):
+        return os.path.join(self.directory, JOURNAL_NAME)
+
+    def _write_journal(self, state):
+        write_journal(self.directory, {
+            'version': 1,
+            'state': state,
+            'token': self.token,
+            'created': time.time(),
+            'moves': [
+                {'src': os.path.basename(s), 'dst': os.path.basename(d)}
+                for s, d in self.moves
+            ],
+        })
+
+    def apply(self):
+        if not self.moves:
+            return []
+        invalidate_snapshot(self.directory)
+        self._write_journal('pending')
+        try:
+            done = execute_moves(self.moves, self.token, on_staged=lambda: self._write_journal('staged'))
+        except RenameError:
+            self._write_journal('rolled_back')
+            raise
+        self._write_journal('committed')
+        return done
+
+
+def write_journal(directory, data):
+    path = os.path.join(directory, JOURNAL_NAME)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh, indent=1)
+    os.replace(tmp, path)
+
+
+def read_journal(directory):
+    path = os.path.join(directory, JOURNAL_NAME)
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as fh:
+        return json.load(fh)
+
+
+def rollback_last(directory):
+    """Undo the renames recorded in the directory's journal.
+
+    Works from the current file system state rather than the journal state so
+    interrupted transactions are handled too: each file is looked up at its
+    target, then at its temporary name, and moved back to its original name.
+    Returns the number of files restored; raises RenameError on failure.
+    """
+    journal = read_journal(directory)
+    if not journal or journal.get('state') == 'rolled_back':
+        return 0
+
+    token = journal.get('token', '')
+    # while 'pending' no file has reached its target yet, only temporary names exist
+    targets_written = journal.get('state') != 'pending'
+    inverse = []
+    for m in journal.get('moves', []):
+        src = os.path.join(directory, m['src'])
+        dst = os.path.join(directory, m['dst'])
+        tmp = _temp_name(src, token)
+        if os.path.exists(tmp):
+            inverse.append((tmp, src))
+        elif targets_written and dst != src and os.path.exists(dst):
+            inverse.append((dst, src))
+
+    # a restored source may still be occupied by another file's rename target;
+    # sources that exist and are not being vacated are left untouched
+    accepted, conflicts = plan_moves(inverse)
+    if conflicts:
+        raise RenameError(
+            "cannot roll back, these files would be overwritten: "
+            + ', '.join(os.path.basename(c.dst) for c in conflicts)
+        )
+    invalidate_snapshot(directory)
+    execute_moves(accepted, token + 'r')
+    journal['state'] = 'rolled_back'
+    write_journal(directory, journal)
+    return len(accepted)
@@ -0,0 +1,122 @@
+"""NumPy helpers for mesh statistics.
+
+Everything reads mesh data through foreach_get into flat buffers, so the cost
+per mesh is a few bulk copies plus vectorized math instead of Python loops
+over faces. Only the foreach_get/len interface of bpy collections is used.
+The GLB and DAE writers share corner_normals() and static_mesh_reason().
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+# squared (doubled) triangle area below which a face counts as zero-area
+ZERO_AREA_EPS = 1e-12
+
+# triangles processed per block, keeps temporaries bounded on huge meshes
+_BLOCK = 1 << 20
+
+MeshStats = namedtuple('MeshStats', 'tris verts loops polys degenerate zero_area')
+
+
+def vertex_coords(mesh):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    return co.reshape(-1, 3)
+
+
+def corner_normals(mesh):
+    """(L, 3) split normals, one per face corner (loop)."""
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, 'corner_normals'):
+        mesh.corner_normals.foreach_get('vector', normals)
+    else:
+        # Blender < 4.1
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get('normal', normals)
+    return normals.reshape(-1, 3)
+
+
+def static_mesh_reason(objs):
+    """None if every object is a static mesh (no shape keys or skinning), else a short reason."""
+    for obj in objs:
+        if obj.type != 'MESH' or obj.data is None:
+            return f"{obj.name} is not a mesh"
+        if obj.data.shape_keys is not None:
+            return f"{obj.name} has shape keys"
+        if (obj.parent is not None and obj.parent.type == 'ARMATURE') or \
+                any(m.type == 'ARMATURE' for m in obj.modifiers):
+            return f"{obj.name} is skinned"
+    return None
+
+
+def triangle_indices(mesh):
+    """(T, 3) vertex indices of the mesh's loop triangles."""
+    mesh.calc_loop_triangles()
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('vertices', tris)
+    return tris.reshape(-1, 3)
+
+
+def triangle_count(mesh):
+    """Triangle count from polygon sizes only (no triangulation needed)."""
+    n = len(mesh.polygons)
+    if n == 0:
+        return 0
+    sizes = np.empty(n, dtype=np.int32)
+    mesh.polygons.foreach_get('loop_total', sizes)
+    return int(sizes.sum()) - 2 * n
+
+
+def material_face_counts(mesh):
+    """Faces per material slot: bincount over polygons.material_index.
+
+    The result has one entry per slot, longer if faces reference indices
+    beyond the last slot. A mesh without slots still gets one entry: all of
+    its faces use index 0.
+    """
+    n_slots = len(mesh.materials)
+    n = len(mesh.polygons)
+    if n == 0:
+        return np.zeros(n_slots, dtype=np.int64)
+    idx = np.empty(n, dtype=np.int32)
+    mesh.polygons.foreach_get('material_index', idx)
+    return np.bincount(idx, minlength=n_slots)
+
+
+def mesh_stats(mesh):
+    tris = triangle_indices(mesh)
+    co = vertex_coords(mesh)
+
+    degenerate = 0
+    zero_area = 0
+    for start in range(0, len(tris), _BLOCK):
+        t = tris[start:start + _BLOCK]
+        dup = (t[:, 0] == t[:, 1]) | (t[:, 1] == t[:, 2]) | (t[:, 0] == t[:, 2])
+        a = co[t[:, 0]]
+        cross = np.cross(co[t[:, 1]] - a, co[t[:, 2]] - a)
+        area2 = np.einsum('ij,ij->i', cross, cross)
+        degenerate += int(dup.sum())
+        zero_area += int(((area2 <= ZERO_AREA_EPS) & ~dup).sum())
+
+    return MeshStats(
+        tris=len(tris),
+        verts=len(mesh.vertices),
+        loops=len(mesh.loops),
+        polys=len(mesh.polygons),
+        degenerate=degenerate,
+        zero_area=zero_area,
+    )
+
+
+def format_table(headers, rows):
+    """Fixed-width text table (first column left aligned, the rest right aligned)."""
+    cells = [[str(c) for c in headers]] + [[str(c) for c in r] for r in rows]
+    widths = [max(len(r[i]) for r in cells) for i in range(len(headers))]
+
+    def _line(r):
+        return '  '.join(c.ljust(widths[i]) if i == 0 else c.rjust(widths[i]) for i, c in enumerate(r))
+
+    out = [_line(cells[0]), '  '.join('-' * w for w in widths)]
+    out += [_line(r) for r in cells[1:]]
+    return '\n'.join(out)
@@ -0,0 +1,234 @@
+"""Direct GLB writer for static LOD meshes.
+
+Covers what Second Life reads from an upload: node and mesh names,
+positions, normals, one UV map, triangle indices split per material and
+material names with a base colour. Mesh data is pulled with foreach_get into
+NumPy arrays, corners with identical position/normal/UV are merged, and the
+arrays are written straight into the GLB binary chunk (no intermediate
+buffer). Objects share a glTF mesh when they share a mesh datablock.
+
+Anything else (shape keys, skinning, image textures) is left to the stock
+glTF exporter: unsupported_reason() says why an object is not covered.
+Like the stock exporter with default settings, modifiers still on the object
+are ignored and Blender's Z-up is converted to glTF's Y-up.
+"""
+
+import json
+import os
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from . import geometry
+
+GENERATOR = 'SL Renamer fast GLB writer'
+
+_FLOAT = 5126
+_UNSIGNED_SHORT = 5123
+_UNSIGNED_INT = 5125
+_ARRAY_BUFFER = 34962
+_ELEMENT_ARRAY_BUFFER = 34963
+
+# Blender Z-up -> glTF Y-up: (x, y, z) -> (x, z, -y)
+_AXIS = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, -1, 0, 0], [0, 0, 0, 1]], dtype=np.float64)
+
+# primitives: list of (material slot, first index, index count)
+MeshArrays = namedtuple('MeshArrays', 'positions normals uvs indices primitives')
+
+
+def unsupported_reason(objs):
+    """None if write_glb() covers every object, else a short reason."""
+    reason = geometry.static_mesh_reason(objs)
+    if reason is not None:
+        return reason
+    for obj in objs:
+        for mat in obj.data.materials:
+            if mat is not None and mat.use_nodes and mat.node_tree is not None and \
+                    any(n.type == 'TEX_IMAGE' and n.image is not None for n in mat.node_tree.nodes):
+                return f"material {mat.name} uses image textures"
+    return None
+
+
+def mesh_arrays(mesh):
+    """Vertex and index arrays of a mesh in glTF layout (Y-up, flipped V)."""
+    mesh.calc_loop_triangles()
+    n_tris = len(mesh.loop_triangles)
+    n_loops = len(mesh.loops)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    vidx = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get('vertex_index', vidx)
+    tri_loops = np.empty(n_tris * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('loops', tri_loops)
+    tri_mat = np.empty(n_tris, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('material_index', tri_mat)
+
+    # one row per corner: position, normal, uv
+    corner = np.zeros((n_loops, 8), dtype=np.float32)
+    corner[:, 0:3] = co.reshape(-1, 3)[vidx]
+    corner[:, 3:6] = geometry.corner_normals(mesh)
+    uv_layer = mesh.uv_layers.active
+    if uv_layer is not None:
+        uv = np.empty(n_loops * 2, dtype=np.float32)
+        uv_layer.data.foreach_get('uv', uv)
+        corner[:, 6:8] = uv.reshape(-1, 2)
+
+    # merge identical corners into shared vertices
+    rows = np.ascontiguousarray(corner).view(np.dtype((np.void, corner.dtype.itemsize * 8))).ravel()
+    _, first, inverse = np.unique(rows, return_index=True, return_inverse=True)
+    verts = corner[first]
+
+    positions = np.ascontiguousarray(verts[:, [0, 2, 1]])
+    positions[:, 2] *= -1
+    normals = np.ascontiguousarray(verts[:, [3, 5, 4]])
+    normals[:, 2] *= -1
+    uvs = None
+    if uv_layer is not None:
+        uvs = np.ascontiguousarray(verts[:, 6:8])
+        uvs[:, 1] = 1.0 - uvs[:, 1]
+
+    # triangles grouped by material slot, one primitive per used slot
+    order = np.argsort(tri_mat, kind='stable')
+    tris = inverse.reshape(-1)[tri_loops].reshape(-1, 3)[order]
+    slots, starts, counts = np.unique(tri_mat[order], return_index=True, return_counts=True)
+    index_type = np.uint16 if len(verts) < 65536 else np.uint32
+    indices = np.ascontiguousarray(tris.ravel(), dtype=index_type)
+    primitives = [(int(s), int(a) * 3, int(c) * 3) for s, a, c in zip(slots, starts, counts)]
+    return MeshArrays(positions, normals, uvs, indices, primitives)
+
+
+class _Binary:
+    """Layout of the BIN chunk: arrays are referenced, not copied, until written."""
+
+    def __init__(self):
+        self.chunks = []
+        self.views = []
+        self.length = 0
+
+    def add(self, array, target):
+        offset = self.length
+        nbytes = array.nbytes
+        pad = (-nbytes) % 4
+        self.chunks.append((array, pad))
+        self.length += nbytes + pad
+        self.views.append({'buffer': 0, 'byteOffset': offset, 'byteLength': nbytes, 'target': target})
+        return len(self.views) - 1
+
+
+def _node_matrix(obj):
+    m = _AXIS @ np.array(obj.matrix_world, dtype=np.float64) @ _AXIS.T
+    if np.allclose(m, np.identity(4)):
+        return None
+    # glTF matrices are column-major
+    return [float(v) for v in m.T.ravel()]
+
+
+def _material(mat):
+    color = [float(c) for c in getattr(mat, 'diffuse_color', (0.8, 0.8, 0.8, 1.0))]
+    return {
+        'name': mat.name,
+        'pbrMetallicRoughness': {
+            'baseColorFactor': color,
+            'metallicFactor': float(getattr(mat, 'metallic', 0.0)),
+            'roughnessFactor': float(getattr(mat, 'roughness', 0.5)),
+        },
+    }
+
+
+def build(objs, names=None):
+    """Return (gltf dict, _Binary) for objs without writing anything.
+
+    names maps an object to the name its node and mesh get; export copies
+    ('chair_LOD1.001') pass the name of the object they were made from.
+    """
+    names = names or {}
+    gltf = {'asset': {'version': '2.0', 'generator': GENERATOR}, 'scene': 0,
+            'scenes': [{'nodes': []}], 'nodes': [], 'meshes': [], 'accessors': []}
+    binary = _Binary()
+    accessors = gltf['accessors']
+    materials = []
+    material_index = {}
+    mesh_index = {}
+
+    def _accessor(view, component, count, kind, offset=0, **extra):
+        acc = {'bufferView': view, 'componentType': component, 'count': count, 'type': kind}
+        if offset:
+            acc['byteOffset'] = offset
+        acc.update(extra)
+        accessors.append(acc)
+        return len(accessors) - 1
+
+    for obj in objs:
+        name = names.get(obj, obj.name)
+        mesh = obj.data
+        key = mesh.session_uid
+        if key not in mesh_index:
+            arrays = mesh_arrays(mesh)
+            if len(arrays.indices) == 0:
+                mesh_index[key] = None
+            else:
+                count = len(arrays.positions)
+                attrs = {
+                    'POSITION': _accessor(binary.add(arrays.positions, _ARRAY_BUFFER), _FLOAT, count, 'VEC3',
+                                          min=arrays.positions.min(axis=0).tolist(),
+                                          max=arrays.positions.max(axis=0).tolist()),
+                    'NORMAL': _accessor(binary.add(arrays.normals, _ARRAY_BUFFER), _FLOAT, count, 'VEC3'),
+                }
+                if arrays.uvs is not None:
+                    attrs['TEXCOORD_0'] = _accessor(binary.add(arrays.uvs, _ARRAY_BUFFER), _FLOAT, count, 'VEC2')
+                index_view = binary.add(arrays.indices, _ELEMENT_ARRAY_BUFFER)
+                component = _UNSIGNED_SHORT if arrays.indices.dtype == np.uint16 else _UNSIGNED_INT
+                primitives = []
+                for slot, first, n in arrays.primitives:
+                    prim = {'attributes': attrs, 'mode': 4,
+                            'indices': _accessor(index_view, component, n, 'SCALAR',
+                                                 offset=first * arrays.indices.itemsize)}
+                    mat = mesh.materials[slot] if slot < len(mesh.materials) else None
+                    if mat is not None:
+                        if mat.name not in material_index:
+                            material_index[mat.name] = len(materials)
+                            materials.append(_material(mat))
+                        prim['material'] = material_index[mat.name]
+                    primitives.append(prim)
+                gltf['meshes'].append({'name': name, 'primitives': primitives})
+                mesh_index[key] = len(gltf['meshes']) - 1
+
+        node = {'name': name}
+        if mesh_index[key] is not None:
+            node['mesh'] = mesh_index[key]
+        matrix = _node_matrix(obj)
+        if matrix is not None:
+            node['matrix'] = matrix
+        gltf['scenes'][0]['nodes'].append(len(gltf['nodes']))
+        gltf['nodes'].append(node)
+
+    if materials:
+        gltf['materials'] = materials
+    if binary.length:
+        gltf['buffers'] = [{'byteLength': binary.length}]
+        gltf['bufferViews'] = binary.views
+    return gltf, binary
+
+
+def write_glb(filepath, objs, names=None):
+    """Write objs to filepath as GLB (temp file, then atomic replace)."""
+    gltf, binary = build(objs, names)
+    json_bytes = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+    json_bytes += b' ' * ((-len(json_bytes)) % 4)
+    total = 12 + 8 + len(json_bytes) + (8 + binary.length if binary.length else 0)
+
+    tmp = filepath + '.tmp'
+    with open(tmp, 'wb') as fh:
+        fh.write(struct.pack('<4sII', b'glTF', 2, total))
+        fh.write(struct.pack('<I4s', len(json_bytes), b'JSON'))
+        fh.write(json_bytes)
+        if binary.length:
+            fh.write(struct.pack('<I4s', binary.length, b'BIN\0'))
+            for array, pad in binary.chunks:
+                fh.write(memoryview(array).cast('B'))
+                if pad:
+                    fh.write(b'\0' * pad)
+    os.replace(tmp, filepath)
+    return filepath
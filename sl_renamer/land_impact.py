@@ -0,0 +1,94 @@
+"""Second Life land impact estimates for LOD sets, vectorized with NumPy.
+
+Streaming (download) cost follows the viewer's legacy mesh streaming cost:
+each LOD's triangle count is weighted by the area of the ring of view
+distances in which that LOD is displayed, the distances depending on the
+object's bounding radius. Triangle counts stand in for the compressed LOD
+sizes the viewer uses, so the result is an estimate; expect the uploader to
+differ by a few percent.
+
+Physics cost is a rough heuristic: a triangle-mesh physics shape costs more
+per triangle the smaller the object is, and without a PHYS mesh the default
+convex hull cost is assumed.
+"""
+
+import numpy as np
+
+MAX_DISTANCE = 512.0
+# area of the circle that encompasses a region
+MAX_AREA = 102944.0
+MIN_AREA = 1.0
+METADATA_DISCOUNT = 128
+MINIMUM_SIZE = 16
+BYTES_PER_TRIANGLE = 16
+TRIANGLE_BUDGET = 250000.0
+STREAMING_SCALE = 15000.0
+
+# LOD switch distances are radius / factor (high -> medium -> low -> lowest)
+LOD_SWITCH_FACTORS = (0.24, 0.06, 0.03)
+
+PHYSICS_TRI_COST = 0.04
+CONVEX_HULL_COST = 0.36
+SERVER_COST = 0.5
+
+
+def fill_missing_lods(tris):
+    """(N, 4) triangle counts for high/medium/low/lowest; 0 means missing.
+
+    A missing LOD reuses the next higher one, as the uploader's
+    'use LOD above' default does.
+    """
+    tris = np.asarray(tris, dtype=np.float64).copy()
+    for col in range(1, tris.shape[1]):
+        missing = tris[:, col] <= 0
+        tris[missing, col] = tris[missing, col - 1]
+    return tris
+
+
+def streaming_cost(tris, radius):
+    """Streaming cost per object.
+
+    tris: (N, 4) triangles for high/medium/low/lowest LOD, radius: (N,)
+    bounding radius in metres.
+    """
+    tris = fill_missing_lods(tris)
+    radius = np.asarray(radius, dtype=np.float64)
+
+    # estimated compressed bytes -> effective triangles, as the viewer does
+    size = np.maximum(tris * BYTES_PER_TRIANGLE - METADATA_DISCOUNT, MINIMUM_SIZE)
+    tri_eff = size / BYTES_PER_TRIANGLE
+
+    f_mid, f_low, f_lowest = LOD_SWITCH_FACTORS
+    d_mid = np.minimum(radius / f_mid, MAX_DISTANCE)
+    d_low = np.minimum(radius / f_low, MAX_DISTANCE)
+    d_lowest = np.minimum(radius / f_lowest, MAX_DISTANCE)
+
+    high_area = np.clip(np.pi * d_mid ** 2, MIN_AREA, MAX_AREA)
+    mid_area = np.clip(np.pi * d_low ** 2, MIN_AREA, MAX_AREA)
+    low_area = np.clip(np.pi * d_lowest ** 2, MIN_AREA, MAX_AREA)
+    lowest_area = np.full_like(radius, MAX_AREA)
+
+    lowest_area = np.maximum(lowest_area - low_area, MIN_AREA)
+    low_area = np.maximum(low_area - mid_area, MIN_AREA)
+    mid_area = np.maximum(mid_area - high_area, MIN_AREA)
+
+    areas = np.stack([high_area, mid_area, low_area, lowest_area], axis=1)
+    weighted = (areas * tri_eff).sum(axis=1) / areas.sum(axis=1)
+    return weighted / TRIANGLE_BUDGET * STREAMING_SCALE
+
+
+def physics_cost(phys_tris, radius):
+    """Rough physics cost: per-triangle cost scaled down for larger objects."""
+    phys_tris = np.asarray(phys_tris, dtype=np.float64)
+    radius = np.maximum(np.asarray(radius, dtype=np.float64), 0.01)
+    mesh_cost = PHYSICS_TRI_COST * phys_tris * np.clip(1.0 / radius, 0.1, 10.0)
+    return np.where(phys_tris > 0, mesh_cost, CONVEX_HULL_COST)
+
+
+def estimate(tris, phys_tris, radius):
+    """Return (streaming, physics, land_impact) arrays for N objects."""
+    stream = streaming_cost(tris, radius)
+    phys = physics_cost(phys_tris, radius)
+    weight = np.maximum(np.maximum(stream, phys), SERVER_COST)
+    land_impact = np.maximum(1, np.floor(weight + 0.5)).astype(np.int64)
+    return stream, phys, land_impact
@@ -0,0 +1,114 @@
+"""Cached object -> position index for the Items and Bases lists.
+
+The list operators used to scan the whole collection for every selected
+object (`any(it.obj == obj for it in coll)`), which is quadratic for large
+selections. ObjectIndex maps each object's session_uid to its positions in
+the collection. Indexes are cached per scene and collection and rebuilt
+lazily when the collection length changes, when an entry's properties are
+edited (update callbacks) or after undo/redo/file load, which can replace
+the collection's contents wholesale. A position found in
+the index is checked against the collection before it is returned; a stale
+entry triggers a rebuild.
+
+Only Blender's handler registration needs bpy; lookups work on any object
+with a session_uid.
+"""
+
+# bumped by the undo/redo/load handlers, invalidates every cached index
+_generation = 0
+_cache = {}
+
+
+class ObjectIndex:
+    def __init__(self, coll, attr='obj'):
+        self.coll = coll
+        self.attr = attr
+        self.generation = _generation
+        self._build()
+
+    def _build(self):
+        positions = {}
+        for i, it in enumerate(self.coll):
+            obj = getattr(it, self.attr)
+            if obj is not None:
+                positions.setdefault(obj.session_uid, []).append(i)
+        self.positions = positions
+        self.length = len(self.coll)
+
+    def _valid(self, obj, pos):
+        return pos < len(self.coll) and getattr(self.coll[pos], self.attr) == obj
+
+    def positions_of(self, obj):
+        """Every position holding obj (an object can be listed more than once)."""
+        if obj is None:
+            return []
+        found = self.positions.get(obj.session_uid, [])
+        if not all(self._valid(obj, p) for p in found):
+            self._build()
+            found = self.positions.get(obj.session_uid, [])
+        return list(found)
+
+    def find(self, obj):
+        """First position of obj, or None."""
+        found = self.positions_of(obj)
+        return found[0] if found else None
+
+    def __contains__(self, obj):
+        return self.find(obj) is not None
+
+    def note_added(self, obj, pos):
+        """Record an entry the caller just appended, keeping the index current."""
+        if obj is not None:
+            self.positions.setdefault(obj.session_uid, []).append(pos)
+        self.length = len(self.coll)
+
+
+def get(scene, propname, attr='obj'):
+    """Index of scene.<propname> by <attr>, reused while it is still current."""
+    coll = getattr(scene, propname)
+    key = (scene.session_uid, propname, attr)
+    index = _cache.get(key)
+    if index is None or index.generation != _generation or index.length != len(coll):
+        index = _cache[key] = ObjectIndex(coll, attr)
+    else:
+        # the RNA collection wrapper is fetched fresh for every operator run
+        index.coll = coll
+    return index
+
+
+def invalidate(*_args):
+    global _generation
+    _generation += 1
+    _cache.clear()
+
+
+def revision():
+    """Counter that changes whenever cached list data may be stale."""
+    return _generation
+
+
+def on_item_update(self, context):
+    """Property update callback for list entries (obj, lod, base...)."""
+    invalidate()
+
+
+def _handler_lists():
+    import bpy
+    h = bpy.app.handlers
+    return (h.undo_post, h.redo_post, h.load_post)
+
+
+def register():
+    import bpy
+    # keep the handler installed across file loads
+    bpy.app.handlers.persistent(invalidate)
+    for handlers in _handler_lists():
+        if invalidate not in handlers:
+            handlers.append(invalidate)
+
+
+def unregister():
+    for handlers in _handler_lists():
+        while invalidate in handlers:
+            handlers.remove(invalidate)
+    invalidate()
@@ -0,0 +1,153 @@
+"""Buffered, leveled logging for SL Renamer.
+
+Messages are collected in an in-memory ring buffer and written out in one go
+by flush(): a single append to the 'SL_Renamer_Log' text datablock, a single
+console write and, optionally, one append to a JSONL file. Operators flush at
+the end of execute via the flush_after decorator, so validators that emit
+thousands of issues no longer pay for a text-buffer append and a print per
+message.
+
+bpy is only imported when flushing, the module works without Blender.
+"""
+
+import functools
+import json
+import sys
+import time
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVELS = {'DEBUG': DEBUG, 'INFO': INFO, 'WARNING': WARNING, 'ERROR': ERROR}
+_LEVEL_NAMES = {v: k for k, v in LEVELS.items()}
+
+TEXT_NAME = 'SL_Renamer_Log'
+DEFAULT_BUFFER_SIZE = 10000
+
+
+class _State:
+    level = INFO
+    jsonl_path = ''
+    records = deque(maxlen=DEFAULT_BUFFER_SIZE)
+    dropped = 0
+
+
+def configure(level=None, jsonl_path=None, buffer_size=None):
+    if level is not None:
+        _State.level = LEVELS.get(level, level) if isinstance(level, str) else int(level)
+    if jsonl_path is not None:
+        _State.jsonl_path = jsonl_path
+    if buffer_size is not None and buffer_size != _State.records.maxlen:
+        _State.records = deque(_State.records, maxlen=max(1, int(buffer_size)))
+
+
+def configure_from_props(props):
+    """Apply the log settings stored in SLRenamerProperties."""
+    path = props.log_jsonl_path
+    if path:
+        try:
+            import bpy
+            path = bpy.path.abspath(path)
+        except ImportError:
+            pass
+    configure(level=props.log_level, jsonl_path=path, buffer_size=props.log_buffer_size)
+
+
+def log(level, msg):
+    if level < _State.level:
+        return
+    records = _State.records
+    if len(records) == records.maxlen:
+        _State.dropped += 1
+    records.append((time.time(), level, msg))
+
+
+def debug(msg):
+    log(DEBUG, msg)
+
+
+def info(msg):
+    log(INFO, msg)
+
+
+def warning(msg):
+    log(WARNING, msg)
+
+
+def error(msg):
+    log(ERROR, msg)
+
+
+def pending():
+    """Number of buffered records not yet flushed."""
+    return len(_State.records)
+
+
+def _format(rec):
+    _t, level, msg = rec
+    if level >= WARNING:
+        return f"[{_LEVEL_NAMES[level]}] {msg}"
+    return msg
+
+
+def _write_text(text):
+    try:
+        import bpy
+        txt = bpy.data.texts.get(TEXT_NAME)
+        if txt is None:
+            txt = bpy.data.texts.new(TEXT_NAME)
+        txt.write(text)
+    except Exception:
+        # no Blender, or the text datablock cannot be written right now
+        pass
+
+
+def _write_jsonl(path, records):
+    lines = ''.join(
+        json.dumps({'time': t, 'level': _LEVEL_NAMES[level], 'message': msg}) + '\n'
+        for t, level, msg in records
+    )
+    try:
+        with open(path, 'a', encoding='utf-8') as fh:
+            fh.write(lines)
+    except OSError as e:
+        sys.stderr.write(f"SL Renamer: cannot write log file {path}: {e}\n")
+
+
+def flush():
+    """Write every buffered record to the text datablock, console and JSONL sink."""
+    records = list(_State.records)
+    dropped = _State.dropped
+    _State.records.clear()
+    _State.dropped = 0
+    if not records:
+        return
+    lines = [_format(r) for r in records]
+    if dropped:
+        lines.insert(0, f"[WARNING] log buffer full, {dropped} older message(s) dropped")
+    text = '\n'.join(lines) + '\n'
+    _write_text(text)
+    try:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+    except Exception:
+        pass
+    if _State.jsonl_path:
+        _write_jsonl(_State.jsonl_path, records)
+
+
+def flush_after(execute):
+    """Decorator for Operator.execute: load log settings, run, then flush once."""
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        props = getattr(context.scene, 'sl_renamer_props', None)
+        if props is not None:
+            configure_from_props(props)
+        try:
+            return execute(self, context)
+        finally:
+            flush()
+    return wrapper
@@ -0,0 +1,74 @@
+"""Pair LOD candidates with their base objects by position and size.
+
+When a whole kit is selected, names and selection order are not enough to
+tell which LOD1/LOD2/PHYS belongs to which LOD0. LODs of one model share
+its place and roughly its extents, so every candidate is paired with the
+nearest base (world bounding-box centre, via a mathutils KD-tree) whose
+bounding-box dimensions are compatible. Building the tree is O(B log B),
+each query O(k log B).
+"""
+
+import numpy as np
+from mathutils import kdtree
+
+# nearest bases (by centre) inspected per candidate
+NEIGHBOURS = 8
+
+# per-axis size ratio above which a candidate cannot be a LOD of a base
+MAX_SIZE_RATIO = 3.0
+
+# axes thinner than this fraction of the largest extent count as flat
+_FLAT = 0.05
+
+
+def bounds(objs):
+    """(centres, dimensions) as (N, 3) arrays of the world bounding boxes."""
+    centres = np.zeros((len(objs), 3))
+    dims = np.zeros((len(objs), 3))
+    for i, obj in enumerate(objs):
+        corners = np.array(obj.bound_box, dtype=np.float64).reshape(-1, 3)
+        local = (corners.min(axis=0) + corners.max(axis=0)) * 0.5
+        m = np.array(obj.matrix_world, dtype=np.float64)
+        centres[i] = m[:3, :3] @ local + m[:3, 3]
+        dims[i] = obj.dimensions
+    return centres, dims
+
+
+def size_ratios(a, b):
+    """Largest per-axis ratio between dimension rows of a and b (flat axes ignored)."""
+    eps = np.maximum(a.max(axis=-1), b.max(axis=-1))[..., None] * _FLAT + 1e-9
+    return ((np.maximum(a, b) + eps) / (np.minimum(a, b) + eps)).max(axis=-1)
+
+
+def nearest_bases(bases, candidates, neighbours=NEIGHBOURS, max_ratio=MAX_SIZE_RATIO):
+    """Index into bases for every candidate, or None when no base fits.
+
+    Among the nearest bases by centre, those with a compatible size are
+    ranked by centre distance plus size difference.
+    """
+    if not bases or not candidates:
+        return [None] * len(candidates)
+    base_centres, base_dims = bounds(bases)
+    cand_centres, cand_dims = bounds(candidates)
+
+    tree = kdtree.KDTree(len(bases))
+    for i, co in enumerate(base_centres):
+        tree.insert(co, i)
+    tree.balance()
+
+    # (C, k) neighbour indices and distances; missing neighbours stay -1 / inf
+    k = min(neighbours, len(bases))
+    idx = np.full((len(candidates), k), -1, dtype=np.int64)
+    dist = np.full((len(candidates), k), np.inf)
+    for c, co in enumerate(cand_centres):
+        for j, (_co, i, d) in enumerate(tree.find_n(co, k)):
+            idx[c, j] = i
+            dist[c, j] = d
+
+    # score every (candidate, neighbour) pair at once
+    dims = base_dims[idx]
+    score = dist + np.linalg.norm(dims - cand_dims[:, None, :], axis=-1)
+    score[(idx < 0) | (size_ratios(dims, cand_dims[:, None, :]) > max_ratio)] = np.inf
+    best = score.argmin(axis=1)
+    rows = np.arange(len(candidates))
+    return [int(idx[r, b]) if np.isfinite(score[r, b]) else None for r, b in zip(rows, best)]
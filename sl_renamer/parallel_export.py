@@ -0,0 +1,273 @@
+"""Parallel INDIVIDUAL-mode export through background Blender processes.
+
+The export set is written to a temporary .blend (bpy.data.libraries.write, so
+only the objects and what they depend on), split into one chunk per worker,
+and every worker opens the snapshot and calls core.export_object_individual
+for its share. Objects that write the same file always share a chunk.
+Workers stream one result per object back over stdout; a bpy.app.timers
+callback collects them so the panel can show live progress while Blender
+stays responsive.
+"""
+
+import os
+import sys
+
+if __name__ == '__main__' and not __package__:
+    # executed via `blender --python .../sl_renamer/parallel_export.py`: make the package importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'sl_renamer'
+    import sl_renamer  # noqa: F401
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+
+from . import fileops, log, procpool
+
+POLL_INTERVAL = 0.25
+
+_job = None
+
+
+class ParallelExportJob:
+    """Progress of one parallel export, updated from the timer callback."""
+
+    def __init__(self, pool, names, tmpdir, manifest=None, digests=None, verify_with=None):
+        self.pool = pool
+        # called with {written file: {object name: triangles}} once the export ends
+        self.verify_with = verify_with
+        self.expected = {}
+        self.manifest = manifest
+        self.digests = digests or {}
+        self.names = names
+        self.total = len(names)
+        self.tmpdir = tmpdir
+        self.files = []
+        self.errors = []
+        self.reported = set()
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.finished = False
+        self.cancelled = False
+
+    @property
+    def workers(self):
+        return len(self.pool.jobs)
+
+    @property
+    def done(self):
+        return len(self.reported)
+
+    def progress_text(self):
+        state = 'cancelled' if self.cancelled else ('finished' if self.finished else 'running')
+        text = f"Parallel export {state}: {self.done}/{self.total}"
+        if self.errors:
+            text += f", {len(self.errors)} error(s)"
+        return text + f" ({self.elapsed:.1f}s)"
+
+    def consume(self):
+        for ev in self.pool.poll():
+            if ev['event'] == 'result':
+                res = ev['payload']
+                self.reported.add(res.get('object'))
+                if res.get('status') == 'ok':
+                    self.files.append(res.get('file'))
+                    if res.get('contents') is not None:
+                        self.expected[res.get('file')] = res['contents']
+                    entry = self.digests.get(res.get('object'))
+                    if self.manifest is not None and entry is not None:
+                        self.manifest.record(entry[0], entry[1], source=res.get('object'))
+                else:
+                    self.errors.append(f"{res.get('object')}: {res.get('error')}")
+            elif ev['event'] == 'error':
+                self.errors.append(f"{ev['label']}: {ev['error']}")
+            elif ev['event'] == 'done' and ev['returncode'] != 0:
+                tail = ' | '.join(ev['output'][-2:])
+                self.errors.append(f"{ev['label']} exited with code {ev['returncode']}: {tail}")
+        self.elapsed = time.perf_counter() - self.started
+
+    def finish(self):
+        self.finished = True
+        missing = [n for n in self.names if n not in self.reported]
+        if missing and not self.cancelled:
+            self.errors.append(f"{len(missing)} object(s) were not exported: {missing[:5]}")
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+        for directory in {os.path.dirname(f) for f in self.files if f}:
+            fileops.invalidate_snapshot(directory)
+        if self.manifest is not None:
+            try:
+                self.manifest.save()
+            except OSError as e:
+                self.errors.append(f"could not write export manifest: {e}")
+        log.info(f"SL Export: parallel export {'cancelled' if self.cancelled else 'finished'}, "
+                 f"{len(self.files)} file(s) written in {self.elapsed:.2f}s")
+        for err in self.errors:
+            log.error(f"SL Export: {err}")
+        if self.verify_with is not None and self.expected:
+            try:
+                self.verify_with(self.expected)
+            except Exception as e:
+                log.error(f"SL Verify: verification failed: {e}")
+        log.flush()
+
+
+def current_job():
+    return _job
+
+
+def is_running():
+    return _job is not None and not _job.finished
+
+
+def _redraw_panels():
+    import bpy
+    wm = bpy.context.window_manager
+    for window in getattr(wm, 'windows', []):
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+
+
+def _poll():
+    job = _job
+    if job is None or job.finished:
+        return None
+    job.consume()
+    if job.pool.done:
+        job.finish()
+    try:
+        _redraw_panels()
+    except Exception:
+        pass
+    return None if job.finished else POLL_INTERVAL
+
+
+def _chunks_by_output(names, outputs, workers):
+    """Split names into at most `workers` chunks; names with the same output stay together.
+
+    outputs maps a name to its output path (names without one count as their
+    own output), so no two workers ever write the same file. Groups go to
+    the least loaded chunk, largest first, which keeps the split even and
+    deterministic.
+    """
+    groups = {}
+    for name in names:
+        groups.setdefault(outputs.get(name, name), []).append(name)
+    chunks = [[] for _ in range(max(1, min(workers, len(groups))))]
+    for group in sorted(groups.values(), key=len, reverse=True):
+        min(chunks, key=len).extend(group)
+    return chunks
+
+
+def start(objs, workers, export_format, mod_flags, target_dir, use_depsgraph=True, manifest=None, digests=None,
+          native_glb=False, verify_with=None):
+    """Snapshot objs and start exporting them with `workers` background Blenders.
+
+    When an export_cache.ExportManifest is given, digests maps object name to
+    (output path, digest) and successful outputs are recorded as they arrive.
+    verify_with, if given, is called with the contents the workers reported
+    for each written file when the export ends.
+    """
+    global _job
+    import bpy
+
+    names = [o.name for o in objs if o]
+    chunks = _chunks_by_output(names, {n: out for n, (out, _digest) in (digests or {}).items()}, int(workers))
+    workers = len(chunks)
+    tmpdir = tempfile.mkdtemp(prefix='sl_renamer_export_')
+    try:
+        snapshot = os.path.join(tmpdir, 'export_set.blend')
+        # fake_user keeps the objects alive in the snapshot although no scene links them
+        bpy.data.libraries.write(snapshot, {o for o in objs if o}, path_remap='ABSOLUTE', fake_user=True)
+
+        script = os.path.abspath(__file__)
+        jobs = []
+        for i, chunk in enumerate(chunks):
+            chunk_file = os.path.join(tmpdir, f"chunk_{i}.json")
+            with open(chunk_file, 'w', encoding='utf-8') as fh:
+                json.dump(chunk, fh)
+            args = [
+                '--objects', chunk_file,
+                '--format', export_format,
+                '--target-dir', target_dir,
+                '--modifiers', ','.join(sorted(mod_flags)),
+            ]
+            if not use_depsgraph:
+                args.append('--operator-apply')
+            if native_glb:
+                args.append('--native-glb')
+            jobs.append(procpool.BlenderJob(f"worker {i + 1}", script, args, blend_file=snapshot))
+    except Exception:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise
+
+    pool = procpool.BlenderPool(jobs, workers=workers)
+    _job = ParallelExportJob(pool, names, tmpdir, manifest=manifest, digests=digests, verify_with=verify_with)
+    pool.start()
+    bpy.app.timers.register(_poll, first_interval=POLL_INTERVAL)
+    return _job
+
+
+def cancel():
+    job = _job
+    if job is None or job.finished:
+        return
+    job.cancelled = True
+    job.pool.cancel()
+    job.consume()
+    job.finish()
+
+
+# --- worker side (runs inside a background Blender with the snapshot open) ---
+
+
+def run_worker(argv):
+    import bpy
+    from . import core
+
+    ap = argparse.ArgumentParser(prog='sl_renamer.parallel_export')
+    ap.add_argument('--objects', required=True)
+    ap.add_argument('--format', default='GLB')
+    ap.add_argument('--target-dir', required=True)
+    ap.add_argument('--modifiers', default='')
+    ap.add_argument('--operator-apply', action='store_true')
+    ap.add_argument('--native-glb', action='store_true')
+    opts = ap.parse_args(argv)
+
+    with open(opts.objects, 'r', encoding='utf-8') as fh:
+        names = json.load(fh)
+    mod_flags = {m for m in opts.modifiers.split(',') if m}
+
+    scene = bpy.context.scene
+    objs = []
+    for name in names:
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            procpool.emit_result({'object': name, 'status': 'error', 'error': 'missing from snapshot'})
+            continue
+        if scene.objects.get(obj.name) is None:
+            scene.collection.objects.link(obj)
+        objs.append(obj)
+
+    for obj in objs:
+        t0 = time.perf_counter()
+        name = obj.name
+        record = {}
+        try:
+            out = core.export_object_individual(bpy.context, obj, opts.format, mod_flags, opts.target_dir,
+                                                use_depsgraph=not opts.operator_apply,
+                                                native_glb=opts.native_glb, record=record)
+            procpool.emit_result({'object': name, 'status': 'ok', 'file': out, 'contents': record.get(out),
+                                  'seconds': time.perf_counter() - t0})
+        except Exception as e:
+            procpool.emit_result({'object': name, 'status': 'error', 'error': f"{type(e).__name__}: {e}",
+                                  'seconds': time.perf_counter() - t0})
+        log.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    argv = sys.argv[sys.argv.index('--') + 1:] if '--' in sys.argv else []
+    sys.exit(run_worker(argv))
@@ -0,0 +1,193 @@
+"""Rename planning for the Items/Bases lists, independent of bpy.
+
+SL_OT_apply_list_renames used to rename objects in three overlapping passes
+(selected base, per-base slots, groups), so an object could be renamed several
+times and the grouping step flattened every group for each item. Here the
+operator's data is described as flat RenameRecords and turned into a single
+deduplicated plan in linear time; the operator applies it once.
+
+Applying a plan one assignment at a time collides with names that are still
+in use (swapping LOD1 and LOD2 across a kit), and Blender answers with
+'.001' names. resolve_collisions() orders the assignments so that every
+final name is free when it is assigned: objects whose current name another
+rename wants are moved to temporary names first, then all final names are
+set.
+"""
+
+from collections import namedtuple
+
+# default suffixes for derive_base; the add-on passes a derive callable that
+# follows the active naming templates (this module must stay importable on
+# its own, benchmarks/bench_planner.py loads it by path)
+LOD_SUFFIXES = ('_LOD0', '_LOD1', '_LOD2', '_PHYS')
+
+# oid: any hashable object id (the operator uses ID.session_uid)
+# lod: 'LOD0' | 'LOD1' | 'LOD2' | 'PHYS'
+# base_ref: oid of the explicit base object, or None
+# slot: None for Items list entries, the slot name ('lod0', ...) for base slots
+RenameRecord = namedtuple('RenameRecord', 'oid name lod is_base base_ref slot')
+PlannedRename = namedtuple('PlannedRename', 'oid old_name new_name base')
+
+# prefix of the temporary names used by resolve_collisions; short enough to
+# stay well inside Blender's 63 byte name limit
+TEMP_PREFIX = '~slr_tmp_'
+
+# precedence when one object is reachable through several records
+_PRIO_DERIVED = 0
+_PRIO_SLOT = 1
+_PRIO_EXPLICIT = 2
+
+
+class RenamePlan:
+    def __init__(self):
+        self.renames = []
+        # base name -> set of names (before renaming) whose files belong to it
+        self.file_targets = {}
+
+    def __len__(self):
+        return len(self.renames)
+
+
+def derive_base(name):
+    if not name:
+        return ''
+    for sfx in LOD_SUFFIXES:
+        if name.endswith(sfx):
+            return name[:-len(sfx)]
+    return name
+
+
+def plan_renames(records, base_names, name_for, registered=None, derive=derive_base):
+    """Build one rename per object from Items and base slot records.
+
+    base_names maps the oid of every registered base and every base_ref target
+    to its current object name; registered is the set of oids in the Bases
+    list (defaults to all of base_names). name_for(base, lod) returns the
+    target name.
+
+    Precedence, highest first:
+      1. Items with a base_ref are named after that base (the base itself is
+         left alone); Items whose object is a registered base form their own
+         group and are not renamed.
+      2. Base slots (lod0/lod1/lod2/phys) are named after their base.
+      3. Remaining Items are grouped by their name with the LOD suffix
+         stripped; the first is_base (else first LOD0) member keeps its name
+         and the others are named after the group key.
+    Within one level the last record wins, as with the sequential passes.
+    """
+    if registered is None:
+        registered = base_names
+    chosen = {}  # oid -> (prio, old_name, new_name, base)
+    plan = RenamePlan()
+
+    def _alias(base, name):
+        if base:
+            plan.file_targets.setdefault(base, set()).add(derive(name))
+
+    def _choose(rec, prio, base):
+        prev = chosen.get(rec.oid)
+        if prev is not None and prev[0] > prio:
+            return
+        chosen[rec.oid] = (prio, rec.name, name_for(base, rec.lod), base)
+
+    derived_groups = {}
+    for rec in records:
+        if rec.slot is not None:
+            base = derive(base_names.get(rec.base_ref, ''))
+            if base:
+                _alias(base, rec.name)
+                _choose(rec, _PRIO_SLOT, base)
+        elif rec.base_ref is not None:
+            base = derive(base_names.get(rec.base_ref, ''))
+            _alias(base, rec.name)
+            if base and rec.oid != rec.base_ref:
+                _choose(rec, _PRIO_EXPLICIT, base)
+        elif rec.oid in registered:
+            _alias(derive(rec.name), rec.name)
+        else:
+            derived_groups.setdefault(derive(rec.name), []).append(rec)
+
+    for key, members in derived_groups.items():
+        base_oid = next((r.oid for r in members if r.is_base), None)
+        if base_oid is None:
+            base_oid = next((r.oid for r in members if r.lod == 'LOD0'), None)
+        base = key or members[0].name
+        for rec in members:
+            _alias(base, rec.name)
+            if rec.oid != base_oid:
+                _choose(rec, _PRIO_DERIVED, base)
+
+    for oid, (_prio, old, new, base) in chosen.items():
+        if old != new:
+            plan.renames.append(PlannedRename(oid, old, new, base))
+    return plan
+
+
+def resolve_collisions(renames, taken, temp_prefix=TEMP_PREFIX):
+    """Two-pass assignment order for renames within one name space.
+
+    renames are (key, old_name, new_name) tuples; for the same key the last
+    one wins. taken is anything supporting `in` that holds every name in use
+    (bpy.data.objects works directly), including the old names of renames.
+
+    Returns (temps, finals, conflicts):
+      temps: (key, temporary name) for the keys whose current name another
+          rename needs; assign these first.
+      finals: (key, new_name) in plan order; assign these second.
+      conflicts: (key, new_name) renames that were dropped because the new
+          name belongs to something that is not renamed away, or because an
+          earlier rename already claimed it.
+    The result only depends on the input order, so repeated runs agree.
+    """
+    wanted = {}
+    for key, old, new in renames:
+        wanted.pop(key, None)
+        wanted[key] = (old, new)
+
+    conflicts = []
+    by_target = {}  # new name -> key of the rename that gets it
+    for key, (old, new) in wanted.items():
+        if old == new:
+            continue
+        if new in by_target:
+            conflicts.append((key, new))
+        else:
+            by_target[new] = key
+    active = set(by_target.values())
+    # current name -> key, for names that will be vacated
+    by_old = {wanted[key][0]: key for key in active}
+
+    def _blocked(name):
+        # taken by something that keeps its name
+        return name in taken and by_old.get(name) not in active
+
+    pending = [key for key in active if _blocked(wanted[key][1])]
+    while pending:
+        key = pending.pop()
+        if key not in active:
+            continue
+        active.discard(key)
+        old, new = wanted[key]
+        conflicts.append((key, new))
+        # the dropped object keeps its name, so a rename that wanted it fails too
+        waiting = by_target.get(old)
+        if waiting in active:
+            pending.append(waiting)
+
+    order = [key for key in wanted if key in active]
+    position = {key: i for i, key in enumerate(wanted)}
+    conflicts.sort(key=lambda c: position[c[0]])
+
+    temps = []
+    n = 0
+    for key in order:
+        old = wanted[key][0]
+        if by_target.get(old) in active:
+            while True:
+                n += 1
+                temp = f"{temp_prefix}{n:06d}"
+                if temp not in taken and temp not in by_target:
+                    break
+            temps.append((key, temp))
+    finals = [(key, wanted[key][1]) for key in order]
+    return temps, finals, conflicts
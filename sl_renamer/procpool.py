@@ -0,0 +1,191 @@
+"""Run background Blender processes in parallel and collect their results.
+
+Workers talk back to the controller through stdout: every line starting with
+RESULT_PREFIX carries one JSON payload. Everything else a worker prints is
+kept as plain log output so failures can be diagnosed from the summary.
+
+This module does not import bpy so it can be used by the batch CLI, the
+parallel exporter and the benchmarks alike.
+"""
+
+import json
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+RESULT_PREFIX = "SLR_RESULT "
+
+
+def emit_result(payload):
+    """Print a result line that the controlling BlenderPool will pick up."""
+    print(RESULT_PREFIX + json.dumps(payload), flush=True)
+
+
+def default_blender_binary():
+    """Return the Blender binary to launch workers with.
+
+    Inside Blender this is the running executable; outside it falls back to
+    the SL_RENAMER_BLENDER environment variable or plain 'blender' on PATH.
+    """
+    try:
+        import bpy
+        path = bpy.app.binary_path
+        if path:
+            return path
+    except Exception:
+        pass
+    return os.environ.get('SL_RENAMER_BLENDER', 'blender')
+
+
+class BlenderJob:
+    """One background Blender invocation.
+
+    blend_file is opened by Blender before the worker script runs (may be None).
+    script is the Python file passed to --python, script_args follow the '--'.
+    """
+
+    def __init__(self, label, script, script_args=(), blend_file=None):
+        self.label = label
+        self.script = script
+        self.script_args = list(script_args)
+        self.blend_file = blend_file
+
+    def command(self, blender):
+        cmd = [blender, '-b']
+        if self.blend_file:
+            cmd.append(self.blend_file)
+        cmd += ['--python', self.script, '--'] + self.script_args
+        return cmd
+
+
+class BlenderPool:
+    """Fan BlenderJobs out over at most `workers` concurrent Blender processes.
+
+    Events are queued as dicts with an 'event' key:
+      - 'result': a payload emitted by a worker via emit_result()
+      - 'done':   the process exited ('returncode', 'elapsed', 'output' tail)
+      - 'error':  the process could not be started or timed out
+    Use run() to block until everything finished, or start() + poll() to
+    consume events incrementally (e.g. from a bpy.app.timers callback).
+    """
+
+    def __init__(self, jobs, workers=None, blender=None, timeout=None, output_tail=40):
+        self.jobs = list(jobs)
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.blender = blender or default_blender_binary()
+        self.timeout = timeout
+        self.output_tail = output_tail
+        self.events = queue.Queue()
+        self._procs = set()
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._thread = None
+        self.finished = threading.Event()
+
+    def _run_job(self, job):
+        if self._cancelled:
+            return
+        start = time.perf_counter()
+        try:
+            proc = subprocess.Popen(
+                job.command(self.blender),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                errors='replace',
+            )
+        except Exception as e:
+            self.events.put({'event': 'error', 'label': job.label, 'error': f"cannot start Blender: {e}"})
+            return
+        with self._lock:
+            self._procs.add(proc)
+
+        timer = None
+        if self.timeout:
+            timer = threading.Timer(self.timeout, proc.kill)
+            timer.start()
+
+        tail = []
+        try:
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+                if line.startswith(RESULT_PREFIX):
+                    try:
+                        payload = json.loads(line[len(RESULT_PREFIX):])
+                    except ValueError:
+                        tail.append(line)
+                        continue
+                    self.events.put({'event': 'result', 'label': job.label, 'payload': payload})
+                else:
+                    tail.append(line)
+                    if len(tail) > self.output_tail:
+                        del tail[0]
+            returncode = proc.wait()
+        finally:
+            if timer is not None:
+                timer.cancel()
+            with self._lock:
+                self._procs.discard(proc)
+
+        elapsed = time.perf_counter() - start
+        if self.timeout and elapsed >= self.timeout and returncode != 0:
+            self.events.put({'event': 'error', 'label': job.label, 'error': f"timed out after {self.timeout}s"})
+        self.events.put({
+            'event': 'done',
+            'label': job.label,
+            'returncode': returncode,
+            'elapsed': elapsed,
+            'output': tail,
+        })
+
+    def _run_all(self):
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as ex:
+                list(ex.map(self._run_job, self.jobs))
+        finally:
+            self.finished.set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run_all, daemon=True)
+        self._thread.start()
+        return self
+
+    def poll(self):
+        """Return all events queued since the last call (never blocks)."""
+        out = []
+        while True:
+            try:
+                out.append(self.events.get_nowait())
+            except queue.Empty:
+                return out
+
+    @property
+    def done(self):
+        return self.finished.is_set() and self.events.empty()
+
+    def run(self, on_event=None):
+        """Run every job and return the full list of events in arrival order."""
+        self.start()
+        events = []
+        while not self.done:
+            try:
+                ev = self.events.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            events.append(ev)
+            if on_event is not None:
+                on_event(ev)
+        return events
+
+    def cancel(self):
+        self._cancelled = True
+        with self._lock:
+            procs = list(self._procs)
+        for p in procs:
+            try:
+                p.terminate()
+            except Exception:
+                pass
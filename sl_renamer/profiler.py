@@ -0,0 +1,137 @@
+"""Opt-in timing of operators and their internal phases.
+
+Operators decorate execute with @profiled and mark their expensive parts
+with `with profiler.phase('renaming', objects=n):`. While profiling is off
+(the default) profiled only checks a flag and phase() returns a shared null
+context, so the hooks cost next to nothing. When it is on, every operator
+run and every phase adds its wall time, a call and its object count to an
+entry keyed 'operator' or 'operator/phase'. The totals are shown in the
+panel's Profiler Report and can be written to JSON to compare runs.
+
+Like log, this module does not need bpy.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import platform
+import time
+
+_NULL = contextlib.nullcontext()
+
+
+class Stat:
+    __slots__ = ('calls', 'seconds', 'max_seconds', 'objects')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.objects = 0
+
+    def add(self, seconds, objects):
+        self.calls += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.objects += objects
+
+
+class _State:
+    enabled = False
+    stats = {}
+    # keys of the operators/phases currently running, outermost first
+    stack = []
+
+
+def configure(enabled):
+    _State.enabled = bool(enabled)
+
+
+def is_enabled():
+    return _State.enabled
+
+
+def reset():
+    _State.stats.clear()
+
+
+def _record(key, seconds, objects):
+    stat = _State.stats.get(key)
+    if stat is None:
+        stat = _State.stats[key] = Stat()
+    stat.add(seconds, objects)
+
+
+@contextlib.contextmanager
+def _timed(key, objects):
+    _State.stack.append(key)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(key, time.perf_counter() - t0, objects)
+        _State.stack.pop()
+
+
+def phase(name, objects=0, owner=None):
+    """Context manager timing a named phase of the running operator.
+
+    owner names the operator when the phase runs outside a profiled execute
+    (e.g. in a modal operator's timer ticks).
+    """
+    if not _State.enabled:
+        return _NULL
+    parent = owner or (_State.stack[0] if _State.stack else '')
+    return _timed(f"{parent}/{name}" if parent else name, objects)
+
+
+def profiled(execute):
+    """Decorator for Operator.execute; the profile_enabled setting turns it on."""
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        props = getattr(context.scene, 'sl_renamer_props', None)
+        if props is not None:
+            _State.enabled = props.profile_enabled
+        if not _State.enabled:
+            return execute(self, context)
+        key = getattr(self, 'bl_idname', type(self).__name__)
+        try:
+            objects = len(context.selected_objects)
+        except Exception:
+            objects = 0
+        with _timed(key, objects):
+            return execute(self, context)
+    return wrapper
+
+
+def rows():
+    """(key, calls, seconds, mean, max_seconds, objects), slowest total first."""
+    out = [(key, s.calls, s.seconds, s.seconds / s.calls if s.calls else 0.0, s.max_seconds, s.objects)
+           for key, s in _State.stats.items()]
+    out.sort(key=lambda r: r[2], reverse=True)
+    return out
+
+
+def to_dict():
+    return {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'entries': [
+            {'key': key, 'calls': calls, 'seconds': seconds, 'mean_seconds': mean,
+             'max_seconds': max_seconds, 'objects': objects}
+            for key, calls, seconds, mean, max_seconds, objects in rows()
+        ],
+    }
+
+
+def write_json(path, extra=None):
+    """Write the report to path (temp file, then replace); extra is merged in."""
+    data = to_dict()
+    if extra:
+        data.update(extra)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh, indent=2)
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,110 @@
+"""Naming templates compiled once into a formatter and a matching regex.
+
+A template is a name pattern with one `{base}` placeholder, one per LOD slot
+('{base}_LOD1', 'LOD1_{base}', ...). TemplateSet compiles the four slot
+patterns up front: format() is then a string concatenation, and parse()
+turns a name back into (base, lod) with a single match of one combined
+regex, instead of str.format and suffix loops per call. Matching is
+case-insensitive unless asked otherwise.
+
+The add-on keeps the patterns in the scene settings and activates the
+compiled set through activate(); compiled sets are cached by pattern, so
+switching back and forth does not recompile. Nothing here imports bpy.
+"""
+
+import functools
+import re
+import string
+
+LODS = ('LOD0', 'LOD1', 'LOD2', 'PHYS')
+
+DEFAULT_PATTERNS = {
+    # Second Life prefers LOD0 (highest), LOD1, LOD2 and a separate physics mesh
+    'LOD0': "{base}_LOD0",
+    'LOD1': "{base}_LOD1",
+    'LOD2': "{base}_LOD2",
+    'PHYS': "{base}_PHYS",
+}
+
+
+class TemplateError(ValueError):
+    pass
+
+
+def split_pattern(pattern):
+    """(prefix, suffix) around the single {base} placeholder of pattern."""
+    try:
+        fields = [f for _lit, f, _spec, _conv in string.Formatter().parse(pattern) if f is not None]
+    except ValueError as e:
+        raise TemplateError(f"'{pattern}': {e}") from None
+    if fields != ['base']:
+        raise TemplateError(f"'{pattern}' must contain {{base}} exactly once and no other fields")
+    prefix, suffix = pattern.split('{base}')
+    # literal braces are written doubled in format syntax
+    prefix = prefix.replace('{{', '{').replace('}}', '}')
+    suffix = suffix.replace('{{', '{').replace('}}', '}')
+    return prefix, suffix
+
+
+class TemplateSet:
+    """Compiled templates for the LOD slots."""
+
+    def __init__(self, patterns, case_sensitive=False):
+        self.patterns = dict(patterns)
+        self.case_sensitive = case_sensitive
+        self._parts = {lod: split_pattern(self.patterns[lod]) for lod in LODS}
+        if len(set(self._parts.values())) != len(LODS):
+            raise TemplateError("two LOD slots use the same template")
+        # most specific pattern first, so '{base}_LOD1' wins over '{base}1' and a
+        # bare '{base}' only takes names no other template matches
+        order = sorted(LODS, key=lambda lod: -sum(map(len, self._parts[lod])))
+        alternatives = '|'.join(
+            f"{re.escape(p)}(?P<{lod}>.+?){re.escape(s)}" for lod in order for p, s in [self._parts[lod]]
+        )
+        self._regex = re.compile(f"(?:{alternatives})", 0 if case_sensitive else re.IGNORECASE)
+
+    def format(self, base, lod):
+        prefix, suffix = self._parts[lod]
+        return prefix + base + suffix
+
+    def parse(self, name):
+        """(base, lod) if name matches one of the templates, else None."""
+        if not name:
+            return None
+        m = self._regex.fullmatch(name)
+        if m is None:
+            return None
+        return m.group(m.lastgroup), m.lastgroup
+
+    def lod_of(self, name):
+        parsed = self.parse(name)
+        return parsed[1] if parsed else None
+
+    def base_of(self, name):
+        """Name with its template stripped (the name itself if none matches)."""
+        parsed = self.parse(name)
+        return parsed[0] if parsed else (name or '')
+
+
+@functools.lru_cache(maxsize=16)
+def _compiled(patterns, case_sensitive):
+    return TemplateSet(dict(patterns), case_sensitive)
+
+
+def compile_patterns(patterns, case_sensitive=False):
+    """Cached TemplateSet for a {lod: pattern} mapping."""
+    return _compiled(tuple(sorted(patterns.items())), bool(case_sensitive))
+
+
+_active = compile_patterns(DEFAULT_PATTERNS)
+
+
+def active():
+    return _active
+
+
+def activate(patterns, case_sensitive=False):
+    """Make patterns the active set; raises TemplateError and keeps the old one if invalid."""
+    global _active
+    _active = compile_patterns(patterns, case_sensitive)
+    return _active
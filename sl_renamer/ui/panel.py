@@ -1,4 +1,10 @@
+import fnmatch
+import os
+
 import bpy
+import numpy as np
+from bpy.props import BoolProperty, EnumProperty
+from .. import list_index, parallel_export, profiler, templates
 from ..core import (
     OBJECT_OT_rename_lods,
     SL_OT_add_selected_to_list,
@@ -8,10 +14,53 @@ from ..core import (
     SL_OT_add_base,
     SL_OT_remove_base,
     SL_OT_assign_to_base,
+    _derive_base_from_name,
+    _template_patterns,
+    preview_file_renames,
 )
 
+# (scene uid, list propname) -> (cache key, (flags, neworder))
+_filter_cache = {}
+
 
 class SL_UL_item_list(bpy.types.UIList):
+    filter_lod: EnumProperty(
+        name="LOD",
+        description="Only show items of this LOD type",
+        items=[
+            ('ALL', 'All LODs', ''),
+            ('LOD0', 'LOD0', ''),
+            ('LOD1', 'LOD1', ''),
+            ('LOD2', 'LOD2', ''),
+            ('PHYS', 'PHYS', ''),
+        ],
+        default='ALL',
+    )
+    filter_base: EnumProperty(
+        name="Base",
+        description="Filter items by whether they are assigned to a base",
+        items=[
+            ('ALL', 'Any Base', ''),
+            ('ASSIGNED', 'Assigned', 'Items with a Base Ref'),
+            ('UNASSIGNED', 'Unassigned', 'Items without a Base Ref'),
+        ],
+        default='ALL',
+    )
+    filter_missing: BoolProperty(
+        name="Missing Only",
+        description="Only show entries whose object was deleted",
+        default=False,
+    )
+    sort_key: EnumProperty(
+        name="Sort",
+        items=[
+            ('NONE', 'List Order', ''),
+            ('NAME', 'Name', ''),
+            ('BASE', 'Base', ''),
+        ],
+        default='NONE',
+    )
+
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         # data is the owner (Scene), item is SLRenamerItem
         # item may be SLRenamerItem or SLRenamerBase
@@ -35,6 +84,115 @@ class SL_UL_item_list(bpy.types.UIList):
             row.prop(item, 'lod', text='')
             row.prop(item, 'is_base', text='')
 
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, 'filter_name', text='')
+        row.prop(self, 'use_filter_invert', text='', icon='ARROW_LEFTRIGHT')
+        row.prop(self, 'filter_missing', text='', icon='ERROR')
+        if self.list_id == 'sl_renamer_items':
+            row = layout.row(align=True)
+            row.prop(self, 'filter_lod', text='')
+            row.prop(self, 'filter_base', text='')
+        row = layout.row(align=True)
+        row.prop(self, 'sort_key', expand=True)
+        row.prop(self, 'use_filter_sort_reverse', text='', icon='SORT_DESC' if self.use_filter_sort_reverse else 'SORT_ASC')
+
+    def filter_items(self, context, data, propname):
+        # redraws happen constantly; recompute only when the list or the filter settings change.
+        # Object names are part of the key: renames and deletions outside the add-on
+        # (outliner, F2) bump no revision, and reading the names is far cheaper than
+        # matching and sorting them again
+        coll = getattr(data, propname)
+        names = tuple(it.obj.name if it.obj else None for it in coll)
+        key = (
+            names, list_index.revision(), self.filter_name, self.filter_lod, self.filter_base,
+            self.filter_missing, self.sort_key,
+        )
+        cached = _filter_cache.get((data.session_uid, propname))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        result = self._compute_filter(coll, propname == 'sl_renamer_items')
+        _filter_cache[(data.session_uid, propname)] = (key, result)
+        return result
+
+    def _compute_filter(self, coll, is_items):
+        visible = self.bitflag_filter_item
+        pattern = f"*{self.filter_name.lower()}*" if self.filter_name else None
+        names = []
+        flags = []
+        for it in coll:
+            obj = it.obj
+            name = obj.name if obj else ''
+            names.append(name)
+            show = True
+            if self.filter_missing and obj is not None:
+                show = False
+            elif pattern and not fnmatch.fnmatchcase(name.lower(), pattern):
+                show = False
+            elif is_items:
+                if self.filter_lod != 'ALL' and it.lod != self.filter_lod:
+                    show = False
+                elif self.filter_base == 'ASSIGNED' and it.base_ref is None:
+                    show = False
+                elif self.filter_base == 'UNASSIGNED' and it.base_ref is not None:
+                    show = False
+            flags.append(visible if show else 0)
+
+        if self.sort_key == 'NONE':
+            return flags, []
+        if self.sort_key == 'BASE':
+            if is_items:
+                keys = [((it.base_ref.name if it.base_ref else _derive_base_from_name(n)).lower(), n.lower())
+                        for it, n in zip(coll, names)]
+            else:
+                keys = [(_derive_base_from_name(n).lower(), n.lower()) for n in names]
+        else:
+            keys = [n.lower() for n in names]
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        # UIList expects the new position of every item; Blender applies the reverse toggle itself
+        neworder = [0] * len(order)
+        for pos, i in enumerate(order):
+            neworder[i] = pos
+        return flags, neworder
+
+
+class SL_UL_land_impact(bpy.types.UIList):
+    """Land impact report rows, sorted by the column chosen in the panel"""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.name, icon='OBJECT_DATA' if item.obj else 'ERROR')
+        row.label(text=f"LI {item.land_impact}")
+        row.label(text=f"S {item.streaming:.2f}")
+        row.label(text=f"P {item.physics:.2f}")
+        row.label(text=f"{item.tris_lod0}/{item.tris_lod1}/{item.tris_lod2}/{item.tris_phys}")
+
+    def filter_items(self, context, data, propname):
+        rows = getattr(data, propname)
+        props = context.scene.sl_renamer_props
+        helpers = bpy.types.UI_UL_list
+
+        flt_flags = []
+        if self.filter_name:
+            flt_flags = helpers.filter_items_by_name(self.filter_name, self.bitflag_filter_item, rows, "name")
+
+        n = len(rows)
+        if n == 0:
+            return flt_flags, []
+        if props.li_sort_key == 'NAME':
+            order = np.argsort(np.array([r.name.lower() for r in rows]), kind='stable')
+        else:
+            values = np.empty(n, dtype=np.float64)
+            rows.foreach_get(props.li_sort_key, values)
+            # highest cost first
+            order = np.argsort(-values, kind='stable')
+        if props.li_sort_reverse:
+            order = order[::-1]
+        # UIList expects the new position of every item, not the item at every position
+        flt_neworder = np.empty(n, dtype=np.int64)
+        flt_neworder[order] = np.arange(n)
+        return flt_flags, flt_neworder.tolist()
+
 
 class SL_PT_renamer_panel(bpy.types.Panel):
     bl_label = "SL Renamer"
@@ -119,11 +277,41 @@ class SL_PT_renamer_panel(bpy.types.Panel):
         box.label(text="Tip: select items in 3D view and use 'Assign Selected Items to Base' or use per-base slots.")
 
         # Files options
+        tpl_box = layout.box()
+        tpl_box.label(text="Naming templates ({base} = base name)")
+        col = tpl_box.column(align=True)
+        col.prop(props, 'template_lod0', text='LOD0')
+        col.prop(props, 'template_lod1', text='LOD1')
+        col.prop(props, 'template_lod2', text='LOD2')
+        col.prop(props, 'template_phys', text='PHYS')
+        tpl_box.prop(props, 'template_case_sensitive')
+        if templates.active().patterns != _template_patterns(props):
+            tpl_box.label(text="Templates invalid (one {base} each, all different); previous set in use",
+                          icon='ERROR')
+
         file_box = layout.box()
         file_box.label(text="File rename options (optional)")
         file_box.prop(props, 'target_dir')
         file_box.prop(props, 'rename_files')
         file_box.prop(props, 'dry_run')
+        file_box.operator('scene.sl_rollback_file_renames', text='Roll back last file rename', icon='LOOP_BACK')
+        if props.rename_files and props.target_dir:
+            prev = file_box.box()
+            row = prev.row()
+            preview = preview_file_renames(scene)
+            if preview is None:
+                row.label(text="Preview: directory not scanned yet")
+            else:
+                moves, conflicts = preview
+                row.label(text=f"Preview: {len(moves)} rename(s), {len(conflicts)} conflict(s)")
+                col = prev.column(align=True)
+                for src, dst in moves[:5]:
+                    col.label(text=f"{os.path.basename(src)} -> {os.path.basename(dst)}")
+                for c in conflicts[:3]:
+                    col.label(text=f"{os.path.basename(c.src)}: {c.reason}", icon='ERROR')
+                if len(moves) > 5:
+                    col.label(text=f"... and {len(moves) - 5} more")
+            row.operator('scene.sl_refresh_file_snapshot', text='', icon='FILE_REFRESH')
         file_box.label(text="Note: file operations only affect .dae and .glb files and respect Dry Run.")
 
         # Export options
@@ -136,8 +324,28 @@ class SL_PT_renamer_panel(bpy.types.Panel):
         # show the modifiers flags only when apply_export_modifiers is True
         if props.apply_export_modifiers:
             exp_box.prop(props, 'export_modifiers', text='Modifiers')
-        exp_row = exp_box.row()
+            exp_box.prop(props, 'modifier_apply_method')
+        exp_box.prop(props, 'export_force')
+        exp_box.prop(props, 'export_verify')
+        if props.export_format == 'GLB':
+            exp_box.prop(props, 'export_native_glb')
+        if props.export_mode == 'INDIVIDUAL':
+            exp_box.prop(props, 'export_workers')
+        exp_row = exp_box.row(align=True)
         exp_row.operator('scene.sl_export_scene', text='Export', icon='EXPORT')
+        exp_row.operator('scene.sl_export_scene_modal', text='Export (Interactive)', icon='TIME')
+        exp_row.prop(props, 'export_chunk_size', text='Step')
+        exp_box.operator('scene.sl_verify_exports', text='Verify Exported Files', icon='CHECKMARK')
+
+        # progress of a background (parallel) export
+        job = parallel_export.current_job()
+        if job is not None:
+            prog = exp_box.column(align=True)
+            prog.label(text=job.progress_text(), icon='TIME' if not job.finished else 'CHECKMARK')
+            for err in job.errors[-3:]:
+                prog.label(text=err, icon='ERROR')
+            if not job.finished:
+                prog.operator('scene.sl_cancel_parallel_export', text='Cancel', icon='CANCEL')
 
         # Action buttons (grouped)
         actions = layout.box()
@@ -148,6 +356,63 @@ class SL_PT_renamer_panel(bpy.types.Panel):
         actions.operator('scene.sl_check_material_subset', text='Check Materials Subset', icon='MATERIAL')
         actions.operator("object.sl_validate_for_sl", text="Validate for SL Upload", icon='ERROR')
 
+        # LOD generation
+        gen_box = layout.box()
+        gen_box.label(text="Generate LODs (decimate LOD0 into empty base slots)")
+        col = gen_box.column(align=True)
+        col.prop(props, 'lod1_ratio')
+        col.prop(props, 'lod2_ratio')
+        col.prop(props, 'phys_ratio')
+        col.prop(props, 'lod_min_tris')
+        gen_box.prop(props, 'lod_gen_replace')
+        gen_box.operator('scene.sl_generate_lods', text='Generate LODs for All Bases', icon='MOD_DECIM')
+
+        # Land impact estimate
+        li_box = layout.box()
+        li_box.label(text="Land Impact (estimate)")
+        row = li_box.row(align=True)
+        row.prop(props, 'li_sort_key', text='Sort')
+        row.prop(props, 'li_sort_reverse', text='', icon='SORT_ASC')
+        li_box.template_list(
+            "SL_UL_land_impact",
+            "sl_renamer_li_report",
+            scene,
+            "sl_renamer_li_report",
+            scene,
+            "sl_renamer_li_index",
+            rows=4,
+        )
+        li_box.operator('scene.sl_estimate_land_impact', text='Estimate Land Impact', icon='WORLD')
+        if len(scene.sl_renamer_li_report):
+            total = sum(r.land_impact for r in scene.sl_renamer_li_report)
+            li_box.label(text=f"Total: {total} (columns: LI, streaming, physics, LOD0/1/2/PHYS tris)")
+
+        # Logging options
+        log_box = layout.box()
+        log_box.label(text="Logging (Text Editor: SL_Renamer_Log)")
+        row = log_box.row(align=True)
+        row.prop(props, 'log_level', text='Level')
+        row.prop(props, 'log_buffer_size', text='Buffer')
+        log_box.prop(props, 'log_jsonl_path', text='JSONL File')
+
+        # Profiler report
+        prof_box = layout.box()
+        prof_box.label(text="Profiler Report")
+        prof_box.prop(props, 'profile_enabled')
+        rows = profiler.rows()
+        if rows:
+            col = prof_box.column(align=True)
+            for key, calls, seconds, mean, _max_seconds, objects in rows[:12]:
+                col.label(text=f"{key}: {seconds * 1000:.1f} ms, {calls} call(s), "
+                               f"{mean * 1000:.1f} ms avg, {objects} obj")
+            if len(rows) > 12:
+                col.label(text=f"... and {len(rows) - 12} more (export to JSON for all)")
+        elif props.profile_enabled:
+            prof_box.label(text="Run an operator to record timings")
+        prow = prof_box.row(align=True)
+        prow.operator('scene.sl_profiler_export', text='Export JSON', icon='EXPORT')
+        prow.operator('scene.sl_profiler_reset', text='Reset', icon='X')
+
         # Help / concise usage
         layout.separator()
         help_box = layout.box()
@@ -159,9 +424,11 @@ class SL_PT_renamer_panel(bpy.types.Panel):
 
 def register():
     bpy.utils.register_class(SL_UL_item_list)
+    bpy.utils.register_class(SL_UL_land_impact)
     bpy.utils.register_class(SL_PT_renamer_panel)
 
 
 def unregister():
     bpy.utils.unregister_class(SL_PT_renamer_panel)
     bpy.utils.unregister_class(SL_UL_item_list)
+    bpy.utils.unregister_class(SL_UL_land_impact)
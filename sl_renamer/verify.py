@@ -0,0 +1,189 @@
+"""Check written .glb/.dae files against what was exported.
+
+Only the metadata of each file is read. A .glb is memory-mapped and just its
+JSON chunk is decoded; triangle counts come from the accessor counts, so the
+binary buffer is never copied. A .dae is stream-parsed with iterparse and
+elements are cleared as soon as they are counted. Files are checked in a
+thread pool.
+
+Checks per file: no mesh node name carries Blender's duplicate suffix
+('chair_LOD1.001' is not matched by the Second Life uploader), no two nodes
+claim the same LOD of one base, and every node's triangle count matches its
+source mesh. Names are split with the parse_name callable passed in (the
+active naming templates, so this module stays free of bpy); as in the scene
+validator, a name no template matches is the base object, i.e. its LOD0.
+"""
+
+import json
+import mmap
+import os
+import re
+import struct
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+FileReport = namedtuple('FileReport', 'path nodes problems')
+
+_DUPLICATE_SUFFIX = re.compile(r'\.\d{3,}$')
+
+# glTF primitive modes: 4 triangles, 5 triangle strip, 6 triangle fan
+_TRIANGLE_MODES = (4, 5, 6)
+
+
+def strip_duplicate_suffix(name):
+    return _DUPLICATE_SUFFIX.sub('', name)
+
+
+def _primitive_triangles(gltf, prim):
+    mode = prim.get('mode', 4)
+    if mode not in _TRIANGLE_MODES:
+        return 0
+    accessors = gltf.get('accessors', [])
+    if 'indices' in prim:
+        count = accessors[prim['indices']]['count']
+    else:
+        count = accessors[prim['attributes']['POSITION']]['count']
+    return count // 3 if mode == 4 else max(count - 2, 0)
+
+
+def read_glb(path):
+    """{node name: triangles} for every node with a mesh in a .glb file."""
+    with open(path, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size < 20:
+            raise ValueError("file too short for a GLB header")
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, length = struct.unpack_from('<4sII', mm, 0)
+            if magic != b'glTF' or version != 2:
+                raise ValueError("not a glTF 2.0 binary")
+            if length != len(mm):
+                raise ValueError(f"header says {length} bytes, file has {len(mm)}")
+            json_len, kind = struct.unpack_from('<I4s', mm, 12)
+            if kind != b'JSON' or 20 + json_len > len(mm):
+                raise ValueError("missing JSON chunk")
+            gltf = json.loads(mm[20:20 + json_len])
+
+    mesh_tris = [sum(_primitive_triangles(gltf, p) for p in m.get('primitives', []))
+                 for m in gltf.get('meshes', [])]
+    nodes = {}
+    for i, node in enumerate(gltf.get('nodes', [])):
+        if 'mesh' in node:
+            name = node.get('name', f"node_{i}")
+            nodes[name] = nodes.get(name, 0) + mesh_tris[node['mesh']]
+    return nodes
+
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def read_dae(path):
+    """{node name: triangles} for every node instancing a geometry in a .dae file."""
+    geometry_tris = {}
+    instances = []  # (node name, geometry id)
+    node_names = []
+    geometry = None
+    strip_inputs = 0  # inputs per vertex inside <tristrips>/<trifans>, else 0
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        tag = _local(elem.tag)
+        if event == 'start':
+            if tag == 'geometry':
+                geometry = elem.get('id')
+                geometry_tris[geometry] = 0
+            elif tag == 'node':
+                node_names.append(elem.get('name') or elem.get('id') or '')
+            elif tag in ('tristrips', 'trifans'):
+                strip_inputs = -1
+            continue
+
+        if tag == 'triangles':
+            geometry_tris[geometry] += int(elem.get('count', 0))
+        elif tag == 'vcount':
+            geometry_tris[geometry] += sum(int(v) - 2 for v in (elem.text or '').split())
+        elif tag == 'input' and strip_inputs:
+            strip_inputs = max(strip_inputs, int(elem.get('offset', 0)) + 1)
+        elif tag == 'p' and strip_inputs:
+            values = len((elem.text or '').split())
+            geometry_tris[geometry] += max(values // max(strip_inputs, 1) - 2, 0)
+        elif tag in ('tristrips', 'trifans'):
+            strip_inputs = 0
+        elif tag == 'instance_geometry' and node_names:
+            instances.append((node_names[-1], elem.get('url', '').lstrip('#')))
+        elif tag == 'node':
+            node_names.pop()
+        elif tag == 'geometry':
+            geometry = None
+        if tag in ('float_array', 'p', 'vcount', 'triangles', 'polylist', 'source', 'geometry', 'node'):
+            # drop the parsed text right away; only counts are kept
+            elem.clear()
+
+    nodes = {}
+    for name, gid in instances:
+        nodes[name] = nodes.get(name, 0) + geometry_tris.get(gid, 0)
+    return nodes
+
+
+def read_nodes(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.glb':
+        return read_glb(path)
+    if ext == '.dae':
+        return read_dae(path)
+    raise ValueError(f"unsupported file type {ext}")
+
+
+def check_file(path, parse_name, expected=None, strict=False):
+    """FileReport for one file.
+
+    parse_name(name) returns (base, lod) or None. expected maps object names
+    to triangle counts; a suffixed node is compared with its unsuffixed entry
+    so the triangle check still runs. With strict, the file must contain
+    exactly the expected names (a just-exported file); otherwise nodes
+    without an entry only get the naming checks.
+    """
+    try:
+        nodes = read_nodes(path)
+    except FileNotFoundError:
+        return FileReport(path, {}, ["file is missing"])
+    except (OSError, ValueError, ET.ParseError) as e:
+        return FileReport(path, {}, [f"cannot read file: {e}"])
+
+    expected = expected or {}
+    problems = []
+    if not nodes:
+        problems.append("file contains no meshes")
+    slots = {}  # (base, lod) -> first node name
+    for name, tris in nodes.items():
+        plain = strip_duplicate_suffix(name)
+        if plain != name:
+            problems.append(f"{name}: duplicate suffix; the uploader expects '{plain}'")
+        base, lod = parse_name(plain) or (plain, 'LOD0')
+        other = slots.setdefault((base, lod), name)
+        if other != name:
+            problems.append(f"{name}: {other} is already the {lod} of '{base}'")
+        want = expected.get(name, expected.get(plain))
+        if want is None:
+            if strict:
+                problems.append(f"{name}: not part of the export")
+        elif want != tris:
+            problems.append(f"{name}: {tris} triangles, source mesh has {want}")
+    if strict:
+        # a suffixed node was already reported above
+        present = {strip_duplicate_suffix(n) for n in nodes}
+        for name in expected:
+            if name not in nodes and name not in present:
+                problems.append(f"{name}: missing from the file")
+    return FileReport(path, nodes, problems)
+
+
+def verify_files(jobs, parse_name, workers=None):
+    """Check many files in threads; jobs are (path, expected, strict) tuples.
+
+    Returns FileReports in the order of jobs.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    workers = max(1, min(len(jobs), workers or (os.cpu_count() or 1) + 4))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda job: check_file(job[0], parse_name, job[1], job[2]), jobs))